@@ -10,10 +10,11 @@ if [ -z "$DEV_SCHEMA_URL" ] || [ -z "$PROD_SCHEMA_URL" ]; then
 fi
 
 if [ -n "$PROD_URL" ]; then
-    echo "Swapping dev url with prod url in all FMU Schemas..."
-    find /app/schemas -type f -name "*.json" -exec sed -i "s|${DEV_SCHEMA_URL}|${PROD_SCHEMA_URL}|" {} +
+    echo "Serving FMU Schemas with prod url..."
+    ln -sfn /app/build/prod /app/public
 else
-    echo "Environment variable 'PROD_URL' is not set. Using dev url in all FMU Schemas..."
+    echo "Environment variable 'PROD_URL' is not set. Serving FMU Schemas with dev url..."
+    ln -sfn /app/build/dev /app/public
 fi
 
 #Start Nginx
@@ -1,52 +1,62 @@
 """Top-level package for fmu-datamodels."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fmu.datamodels import _lazy
 from fmu.datamodels._schema_base import SchemaBase
 
-from .common import (
-    Access,
-    Asset,
-    CoordinateSystem,
-    CountryItem,
-    DiscoveryItem,
-    FieldItem,
-    Masterdata,
-    OperatingSystem,
-    Smda,
-    Ssdl,
-    SsdlAccess,
-    StratigraphicColumn,
-    SystemInformation,
-    Tracklog,
-    TracklogEvent,
-    TracklogSource,
-    User,
-    Version,
-)
-from .fmu_results import FmuResults, FmuResultsSchema
-from .standard_results import (
-    ErtDistribution,
-    ErtObservationsBreakthroughResult,
-    ErtObservationsBreakthroughSchema,
-    ErtObservationsRftResult,
-    ErtObservationsRftSchema,
-    ErtObservationsSummaryResult,
-    ErtObservationsSummarySchema,
-    ErtParameterMetadata,
-    ErtParametersResult,
-    ErtParametersSchema,
-    FieldOutlineResult,
-    FieldOutlineSchema,
-    FluidContactOutlineResult,
-    FluidContactOutlineSchema,
-    InplaceVolumesResult,
-    InplaceVolumesSchema,
-    SimulatorFipregionsMappingResult,
-    SimulatorFipregionsMappingSchema,
-    StratigraphyMappingResult,
-    StratigraphyMappingSchema,
-    StructureDepthFaultLinesResult,
-    StructureDepthFaultLinesSchema,
-)
+if TYPE_CHECKING:
+    # Explicit re-exports, as __all__ is derived from _LAZY_EXPORTS below
+    from .common import (
+        Access as Access,
+        Asset as Asset,
+        CoordinateSystem as CoordinateSystem,
+        CountryItem as CountryItem,
+        DiscoveryItem as DiscoveryItem,
+        FieldItem as FieldItem,
+        Masterdata as Masterdata,
+        OperatingSystem as OperatingSystem,
+        Smda as Smda,
+        Ssdl as Ssdl,
+        SsdlAccess as SsdlAccess,
+        StratigraphicColumn as StratigraphicColumn,
+        SystemInformation as SystemInformation,
+        Tracklog as Tracklog,
+        TracklogEvent as TracklogEvent,
+        TracklogSource as TracklogSource,
+        User as User,
+        Version as Version,
+    )
+    from .fmu_results import (
+        FmuResults as FmuResults,
+        FmuResultsSchema as FmuResultsSchema,
+    )
+    from .standard_results import (
+        ErtDistribution as ErtDistribution,
+        ErtObservationsBreakthroughResult as ErtObservationsBreakthroughResult,
+        ErtObservationsBreakthroughSchema as ErtObservationsBreakthroughSchema,
+        ErtObservationsRftResult as ErtObservationsRftResult,
+        ErtObservationsRftSchema as ErtObservationsRftSchema,
+        ErtObservationsSummaryResult as ErtObservationsSummaryResult,
+        ErtObservationsSummarySchema as ErtObservationsSummarySchema,
+        ErtParameterMetadata as ErtParameterMetadata,
+        ErtParametersResult as ErtParametersResult,
+        ErtParametersSchema as ErtParametersSchema,
+        FieldOutlineResult as FieldOutlineResult,
+        FieldOutlineSchema as FieldOutlineSchema,
+        FluidContactOutlineResult as FluidContactOutlineResult,
+        FluidContactOutlineSchema as FluidContactOutlineSchema,
+        InplaceVolumesResult as InplaceVolumesResult,
+        InplaceVolumesSchema as InplaceVolumesSchema,
+        SimulatorFipregionsMappingResult as SimulatorFipregionsMappingResult,
+        SimulatorFipregionsMappingSchema as SimulatorFipregionsMappingSchema,
+        StratigraphyMappingResult as StratigraphyMappingResult,
+        StratigraphyMappingSchema as StratigraphyMappingSchema,
+        StructureDepthFaultLinesResult as StructureDepthFaultLinesResult,
+        StructureDepthFaultLinesSchema as StructureDepthFaultLinesSchema,
+    )
 
 try:
     from .version import version
@@ -55,61 +65,102 @@ try:
 except ImportError:
     __version__ = "0.0.0"
 
-__all__ = [
-    "Access",
-    "SsdlAccess",
-    "Asset",
-    "Ssdl",
-    "Masterdata",
-    "Smda",
-    "StratigraphicColumn",
-    "CoordinateSystem",
-    "CountryItem",
-    "FieldItem",
-    "DiscoveryItem",
-    "Tracklog",
-    "OperatingSystem",
-    "SystemInformation",
-    "TracklogEvent",
-    "TracklogSource",
-    "User",
-    "Version",
-    "ErtDistribution",
-    "ErtObservationsRftResult",
-    "ErtObservationsRftSchema",
-    "ErtObservationsSummaryResult",
-    "ErtObservationsSummarySchema",
-    "ErtParameterMetadata",
-    "ErtParametersResult",
-    "ErtParametersSchema",
-    "FmuResults",
-    "FmuResultsSchema",
-    "FieldOutlineResult",
-    "FieldOutlineSchema",
-    "FluidContactOutlineResult",
-    "FluidContactOutlineSchema",
-    "InplaceVolumesResult",
-    "InplaceVolumesSchema",
-    "SimulatorFipregionsMappingResult",
-    "SimulatorFipregionsMappingSchema",
-    "ErtObservationsBreakthroughResult",
-    "ErtObservationsBreakthroughSchema",
-    "StratigraphyMappingResult",
-    "StratigraphyMappingSchema",
-    "StructureDepthFaultLinesResult",
-    "StructureDepthFaultLinesSchema",
-]
+# The models are imported on first access, so that e.g. `Masterdata` can be used
+# without building the core schemas of all the FMU results and standard results.
+_LAZY_EXPORTS = {
+    **dict.fromkeys(
+        [
+            "Access",
+            "Asset",
+            "CoordinateSystem",
+            "CountryItem",
+            "DiscoveryItem",
+            "FieldItem",
+            "Masterdata",
+            "OperatingSystem",
+            "Smda",
+            "Ssdl",
+            "SsdlAccess",
+            "StratigraphicColumn",
+            "SystemInformation",
+            "Tracklog",
+            "TracklogEvent",
+            "TracklogSource",
+            "User",
+            "Version",
+        ],
+        ".common",
+    ),
+    **dict.fromkeys(["FmuResults", "FmuResultsSchema"], ".fmu_results"),
+    **dict.fromkeys(
+        [
+            "ErtDistribution",
+            "ErtObservationsBreakthroughResult",
+            "ErtObservationsBreakthroughSchema",
+            "ErtObservationsRftResult",
+            "ErtObservationsRftSchema",
+            "ErtObservationsSummaryResult",
+            "ErtObservationsSummarySchema",
+            "ErtParameterMetadata",
+            "ErtParametersResult",
+            "ErtParametersSchema",
+            "FieldOutlineResult",
+            "FieldOutlineSchema",
+            "FluidContactOutlineResult",
+            "FluidContactOutlineSchema",
+            "InplaceVolumesResult",
+            "InplaceVolumesSchema",
+            "SimulatorFipregionsMappingResult",
+            "SimulatorFipregionsMappingSchema",
+            "StratigraphyMappingResult",
+            "StratigraphyMappingSchema",
+            "StructureDepthFaultLinesResult",
+            "StructureDepthFaultLinesSchema",
+        ],
+        ".standard_results",
+    ),
+}
+
+__all__ = [*_LAZY_EXPORTS]
+
+_getattr, __dir__ = _lazy.attach(__name__, _LAZY_EXPORTS)
+
+schemas: list[type[SchemaBase]]
+"""All schemas generated and exposed by this package. Imported on first access."""
+
+
+def _schemas() -> list[type[SchemaBase]]:
+    from .fmu_results import FmuResultsSchema
+    from .standard_results import (
+        ErtObservationsBreakthroughSchema,
+        ErtObservationsRftSchema,
+        ErtObservationsSummarySchema,
+        ErtParametersSchema,
+        FieldOutlineSchema,
+        FluidContactOutlineSchema,
+        InplaceVolumesSchema,
+        SimulatorFipregionsMappingSchema,
+        StratigraphyMappingSchema,
+        StructureDepthFaultLinesSchema,
+    )
+
+    return [
+        FmuResultsSchema,
+        ErtObservationsRftSchema,
+        ErtObservationsSummarySchema,
+        ErtParametersSchema,
+        FieldOutlineSchema,
+        FluidContactOutlineSchema,
+        InplaceVolumesSchema,
+        SimulatorFipregionsMappingSchema,
+        ErtObservationsBreakthroughSchema,
+        StratigraphyMappingSchema,
+        StructureDepthFaultLinesSchema,
+    ]
+
 
-schemas: list[type[SchemaBase]] = [
-    FmuResultsSchema,
-    ErtObservationsRftSchema,
-    ErtObservationsSummarySchema,
-    ErtParametersSchema,
-    FieldOutlineSchema,
-    FluidContactOutlineSchema,
-    InplaceVolumesSchema,
-    SimulatorFipregionsMappingSchema,
-    ErtObservationsBreakthroughSchema,
-    StratigraphyMappingSchema,
-    StructureDepthFaultLinesSchema,
-]
+def __getattr__(name: str) -> Any:
+    if name == "schemas":
+        globals()["schemas"] = value = _schemas()
+        return value
+    return _getattr(name)
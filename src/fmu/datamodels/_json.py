@@ -0,0 +1,66 @@
+"""Validation of models straight from raw JSON."""
+
+from __future__ import annotations
+
+import mmap
+from typing import TYPE_CHECKING, Any, Self
+
+JsonInput = str | bytes | bytearray | memoryview | mmap.mmap
+"""Raw JSON accepted by the ``from_json_bytes`` class methods."""
+
+
+def json_input(data: JsonInput) -> str | bytes | bytearray:
+    """Returns raw JSON in a form accepted by pydantic-core's JSON parser.
+
+    pydantic-core only parses ``str``, ``bytes`` and ``bytearray``. Other buffers,
+    like a ``memoryview`` of a larger buffer or a memory-mapped file, are copied
+    once into ``bytes``. This is still far cheaper than building the intermediate
+    Python objects of ``json.loads``.
+    """
+    if isinstance(data, str | bytes | bytearray):
+        return data
+    if isinstance(data, mmap.mmap):
+        return data[:]
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    raise TypeError(f"Expected raw JSON, got '{type(data).__name__}'")
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    _Base = BaseModel
+else:
+    _Base = object
+
+
+class FromJsonBytesMixin(_Base):
+    """Adds validation straight from raw JSON to a model."""
+
+    @classmethod
+    def from_json_bytes(
+        cls,
+        data: JsonInput,
+        *,
+        strict: bool | None = None,
+        context: Any | None = None,
+    ) -> Self:
+        """Validates raw JSON without first loading it into Python objects.
+
+        The JSON is parsed by pydantic-core while validating, which avoids the
+        intermediate dictionaries and lists of ``json.loads`` followed by
+        ``model_validate``.
+
+        Args:
+            data: The raw JSON, i.e. the contents of a file or a response body. A
+                ``memoryview`` or memory-mapped file is also accepted.
+            strict: Whether to validate in strict mode.
+            context: Additional context passed to the validators.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValidationError: If the JSON is malformed or invalid.
+        """
+        return cls.model_validate_json(json_input(data), strict=strict, context=context)
@@ -0,0 +1,58 @@
+"""Lazy attribute access for packages.
+
+Importing the model modules builds their Pydantic core schemas, which is costly
+for the large discriminated unions in the FMU results schema. Packages use
+:func:`attach` to defer importing a submodule until one of its names is accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def attach(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Returns ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Names that are not exported are looked up as submodules of the package, so that
+    e.g. ``fmu.datamodels.standard_results`` can be accessed as an attribute after
+    only ``import fmu.datamodels``.
+
+    Args:
+        package: The ``__name__`` of the package.
+        exports: A mapping from each lazily exported name to the module, relative
+            to the package, that defines it.
+
+    Returns:
+        The module-level ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    module_globals = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+        else:
+            value = _import_submodule(package, name)
+        # Cache it so __getattr__ is not called again for this name
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def _import_submodule(package: str, name: str) -> Any:
+    """Imports a submodule of a package, raising an AttributeError if there is no
+    such submodule."""
+    try:
+        return importlib.import_module(f"{package}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{package}.{name}":
+            # The submodule exists, but imports something missing
+            raise
+        raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import functools
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Mapping
+from copy import deepcopy
 from pathlib import Path
 from typing import (
     Any,
     Final,
     Literal,
+    NoReturn,
     TypeVar,
 )
 
@@ -23,6 +26,147 @@ T = TypeVar("T", dict, list, object)
 FMU_SCHEMAS_PATH: Final[Path] = Path("schemas")
 
 
+def version_key(version: str) -> tuple[int, ...]:
+    """Returns the key sorting schema versions numerically, so that 0.10.0 is after
+    0.9.0."""
+    return tuple(int(part) for part in version.split("."))
+
+
+def _immutable(self: object, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"'{type(self).__name__}' is immutable. Use copy.deepcopy() to get a "
+        "mutable copy."
+    )
+
+
+def _thaw(data: Any) -> Any:
+    """Returns a mutable deep copy of a frozen schema."""
+    if isinstance(data, dict):
+        return {k: _thaw(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_thaw(v) for v in data]
+    return data
+
+
+class FrozenSchemaDict(dict[str, Any]):
+    """An immutable JSON schema object, as returned by :meth:`SchemaBase.dump`.
+
+    It compares equal to, and serializes like, a plain dictionary. Copies made with
+    ``copy.copy()``, ``copy.deepcopy()`` or pickling are plain, mutable
+    dictionaries."""
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict[str, Any]:
+        return _thaw(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return _thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (_thaw(self),))
+
+
+class FrozenSchemaList(list[Any]):
+    """An immutable JSON schema array. See :class:`FrozenSchemaDict`."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __copy__(self) -> list[Any]:
+        return _thaw(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return _thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (_thaw(self),))
+
+
+def freeze_schema(data: Any) -> Any:
+    """Returns an immutable deep copy of a JSON schema."""
+    if isinstance(data, dict):
+        # dict.__init__ does not go through __setitem__
+        return FrozenSchemaDict({k: freeze_schema(v) for k, v in data.items()})
+    if isinstance(data, list):
+        return FrozenSchemaList(freeze_schema(v) for v in data)
+    return data
+
+
+def _cached_dump(
+    dump: Callable[[type[SchemaBase]], dict[str, Any]],
+) -> Callable[[type[SchemaBase]], dict[str, Any]]:
+    """Caches the schemas returned by a dump method per class, version and URL."""
+
+    @functools.wraps(dump)
+    def cached_dump(cls: type[SchemaBase]) -> dict[str, Any]:
+        key = (cls.VERSION, cls.url())
+        cache = cls.__dict__["_dump_cache"]
+        if key not in cache:
+            cache[key] = freeze_schema(dump(cls))
+        return cache[key]
+
+    return cached_dump
+
+
+SchemaTransform = Callable[[dict[str, Any]], None]
+"""A rewrite of a JSON schema applied in place to each of its objects."""
+
+
+def transform_schema(data: T, transforms: Iterable[SchemaTransform]) -> T:
+    """Applies transforms in place to every object in a JSON schema.
+
+    All transforms are applied in a single traversal of the schema. Each object is
+    passed to every transform, in order, before its members are visited, so members
+    removed by a transform are not visited. The traversal is iterative, so deeply
+    nested schemas do not exhaust the recursion limit.
+
+    Args:
+        data: The JSON schema, or any part of it.
+        transforms: Functions rewriting one JSON schema object in place.
+
+    Returns:
+        The same, transformed, JSON schema.
+    """
+    transforms = tuple(transforms)
+    stack: list[Any] = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for transform in transforms:
+                transform(node)
+            stack.extend(v for v in node.values() if isinstance(v, dict | list))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, dict | list))
+    return data
+
+
+def drop_discriminator_mapping(node: dict[str, Any]) -> None:
+    """Removes the mapping of a discriminator, which OpenAPI recognizes but JSON
+    Schema does not."""
+    discriminator = node.get("discriminator")
+    if isinstance(discriminator, dict):
+        discriminator.pop("mapping", None)
+
+
+def drop_format_path(node: dict[str, Any]) -> None:
+    """Removes ``"format": "path"``, which OpenAPI recognizes but JSON Schema does
+    not."""
+    if node.get("format") == "path":
+        del node["format"]
+
+
+def drop_keys(*keys: str) -> SchemaTransform:
+    """Returns a transform removing the given keys from every object."""
+
+    def transform(node: dict[str, Any]) -> None:
+        for key in keys:
+            node.pop(key, None)
+
+    return transform
+
+
 class GenerateJsonSchemaBase(GenerateJsonSchema):
     """Implements a schema generator so that some additional fields may be
     added.
@@ -30,6 +174,13 @@ class GenerateJsonSchemaBase(GenerateJsonSchema):
     This class also collects static methods used to transform the default OpenAPI
     schemas generated by Pydantic into schemas compatible with JSON Schema specs."""
 
+    transforms: tuple[SchemaTransform, ...] = (
+        drop_discriminator_mapping,
+        drop_format_path,
+    )
+    """The rewrites applied to the generated schema, in a single traversal.
+    Subclasses may extend these."""
+
     @staticmethod
     def remove_discriminator_mapping(data: T) -> T:
         """
@@ -37,21 +188,7 @@ class GenerateJsonSchemaBase(GenerateJsonSchema):
         adjustment is necessary because JSON Schema does not recognize this value
         while OpenAPI does.
         """
-
-        if isinstance(data, dict):
-            if "discriminator" in data and isinstance(data["discriminator"], dict):
-                data["discriminator"].pop("mapping", None)
-
-            for key, value in data.items():
-                data[key] = GenerateJsonSchemaBase.remove_discriminator_mapping(value)
-
-        elif isinstance(data, list):
-            for index, element in enumerate(data):
-                data[index] = GenerateJsonSchemaBase.remove_discriminator_mapping(
-                    element
-                )
-
-        return data
+        return transform_schema(data, [drop_discriminator_mapping])
 
     @staticmethod
     def remove_format_path(data: T) -> T:
@@ -60,21 +197,11 @@ class GenerateJsonSchemaBase(GenerateJsonSchema):
         adjustment is necessary because JSON Schema does not recognize the "format":
         "path", while OpenAPI does. This function is used in contexts where OpenAPI
         specifications are not applicable.
-        """
-
-        if isinstance(data, dict):
-            return {
-                k: GenerateJsonSchemaBase.remove_format_path(v)
-                for k, v in data.items()
-                if not (k == "format" and v == "path")
-            }
-
-        if isinstance(data, list):
-            return [
-                GenerateJsonSchemaBase.remove_format_path(element) for element in data
-            ]
 
-        return data
+        Unlike :meth:`remove_discriminator_mapping`, the given schema is not
+        modified; a transformed copy is returned.
+        """
+        return transform_schema(deepcopy(data), [drop_format_path])
 
     def generate(
         self,
@@ -83,8 +210,7 @@ class GenerateJsonSchemaBase(GenerateJsonSchema):
     ) -> dict[str, Any]:
         json_schema = super().generate(schema, mode=mode)
 
-        json_schema = GenerateJsonSchemaBase.remove_discriminator_mapping(json_schema)
-        json_schema = GenerateJsonSchemaBase.remove_format_path(json_schema)
+        json_schema = transform_schema(json_schema, self.transforms)
         json_schema["$schema"] = self.schema_dialect
 
         return json_schema
@@ -113,6 +239,9 @@ class SchemaBase(ABC):
 
     """
 
+    _dump_cache: dict[tuple[str, str], dict[str, Any]]
+    """The schemas dumped by this class, by version and URL."""
+
     @classmethod
     def __init_subclass__(cls, **kwargs: dict[str, Any]) -> None:
         """This achieves Pydantic-like validation without being Pydantic.
@@ -127,6 +256,11 @@ class SchemaBase(ABC):
         cls._validate_version_changelog()
         cls._validate_path()
 
+        cls._dump_cache = {}
+        if "dump" in cls.__dict__:
+            dump = cls.__dict__["dump"].__func__
+            cls.dump = classmethod(_cached_dump(dump))  # type: ignore[method-assign, assignment]
+
     @classmethod
     def _validate_class_vars_set(cls) -> None:
         for attr in ("VERSION", "VERSION_CHANGELOG", "FILENAME", "PATH"):
@@ -215,6 +349,15 @@ class SchemaBase(ABC):
 
         return DefaultGenerateJsonSchema
 
+    @classmethod
+    def clear_dump_cache(cls) -> None:
+        """Discards the cached schemas of this class and its subclasses, so that the
+        next call to :meth:`dump` generates them again."""
+        if "_dump_cache" in cls.__dict__:
+            cls._dump_cache.clear()
+        for subclass in cls.__subclasses__():
+            subclass.clear_dump_cache()
+
     @classmethod
     @abstractmethod
     def dump(cls) -> dict[str, Any]:
@@ -222,6 +365,10 @@ class SchemaBase(ABC):
         Dumps the export root model to JSON format for schema validation and
         usage in FMU data structures.
 
+        The schema is generated once per version and URL and then cached. It is
+        returned as an immutable :class:`FrozenSchemaDict`; use ``copy.deepcopy()``
+        to get a mutable copy, and :meth:`clear_dump_cache` to generate it again.
+
         To update the schema:
             1. Run the following CLI command to dump the updated schema:
                 `./tools/update-schemas.py --diff`.
@@ -1,6 +1,18 @@
-from .fmu_results import FmuResults, FmuResultsSchema
+from __future__ import annotations
 
-__all__ = [
-    "FmuResultsSchema",
-    "FmuResults",
-]
+from typing import TYPE_CHECKING
+
+from fmu.datamodels import _lazy
+
+if TYPE_CHECKING:
+    # Explicit re-exports, as __all__ is derived from _LAZY_EXPORTS below
+    from .fmu_results import (
+        FmuResults as FmuResults,
+        FmuResultsSchema as FmuResultsSchema,
+    )
+
+_LAZY_EXPORTS = {"FmuResults": ".fmu_results", "FmuResultsSchema": ".fmu_results"}
+
+__all__ = [*_LAZY_EXPORTS]
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,117 @@
+"""Explicit dispatch of FMU results payloads to their concrete models.
+
+:class:`FmuResults` is a tagged union on ``class``, its ``data`` block a tagged union
+on ``data.content``, and ``data.standard_result`` a tagged union on
+``data.standard_result.name``. This module precomputes the tables mapping each tag
+to its concrete model, so that the concrete models of a payload can be looked up
+without validating it, i.e. to route it.
+
+Payloads are still validated with ``FmuResults.model_validate``. pydantic-core
+resolves the tagged unions with one lookup per level, so validating against the
+concrete models instead saves nothing measurable, see
+``tools/benchmark-dispatch.py``.
+
+Example:
+    >>> leaf = resolve(payload)
+    >>> leaf.metadata, leaf.data, leaf.standard_result
+    (ObjectMetadata, DepthData, StructureDepthSurfaceStandardResult)
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, get_args
+
+from .data import AnyData
+from .fmu_results import FmuResults
+from .standard_result import AnyStandardResult
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pydantic import BaseModel, RootModel
+
+
+@dataclass(frozen=True)
+class Leaf:
+    """The concrete models of an FMU results payload."""
+
+    metadata: type[BaseModel]
+    """The metadata model selected by ``class``, i.e. ``ObjectMetadata``."""
+
+    data: type[BaseModel] | None = None
+    """The data model selected by ``data.content``, i.e. ``DepthData``. None if
+    the metadata has no ``data`` block."""
+
+    standard_result: type[BaseModel] | None = None
+    """The standard result model selected by ``data.standard_result.name``. None
+    if the data is not a standard result."""
+
+
+def _tag_table(union: type[RootModel], field: str) -> dict[str, type[BaseModel]]:
+    """Maps the tag values of a discriminated union to its members."""
+    table: dict[str, type[BaseModel]] = {}
+    for member in get_args(union.model_fields["root"].annotation):
+        for tag in get_args(member.model_fields[field].annotation):
+            table[tag.value if isinstance(tag, Enum) else tag] = member
+    return table
+
+
+@functools.cache
+def tables() -> tuple[
+    dict[str, type[BaseModel]],
+    dict[str, type[BaseModel]],
+    dict[str, type[BaseModel]],
+]:
+    """Returns the tag tables of ``class``, ``data.content`` and
+    ``data.standard_result.name``, mapping each tag to its concrete model."""
+    return (
+        _tag_table(FmuResults, "class_"),
+        _tag_table(AnyData, "content"),
+        _tag_table(AnyStandardResult, "name"),
+    )
+
+
+def _lookup(table: dict[str, type[BaseModel]], tag: Any, path: str) -> type[BaseModel]:
+    try:
+        return table[tag]
+    except (KeyError, TypeError):
+        expected = ", ".join(f"'{t}'" for t in table)
+        raise ValueError(
+            f"Unknown '{path}' {tag!r}, expected one of: {expected}"
+        ) from None
+
+
+def resolve(payload: Mapping[str, Any]) -> Leaf:
+    """Returns the concrete models of a payload by peeking at its tags.
+
+    Only ``class``, ``data.content`` and ``data.standard_result.name`` are read.
+    The payload is not validated.
+
+    Args:
+        payload: The FMU results metadata, as loaded from JSON or YAML.
+
+    Raises:
+        ValueError: If a tag is missing or has an unknown value.
+    """
+    metadata_table, data_table, standard_result_table = tables()
+    metadata = _lookup(metadata_table, payload.get("class"), "class")
+    if "data" not in metadata.model_fields:
+        return Leaf(metadata)
+
+    data = payload.get("data")
+    data = data if isinstance(data, dict) else {}
+    standard_result = data.get("standard_result")
+    return Leaf(
+        metadata,
+        _lookup(data_table, data.get("content"), "data.content"),
+        _lookup(
+            standard_result_table,
+            standard_result.get("name"),
+            "data.standard_result.name",
+        )
+        if isinstance(standard_result, dict)
+        else None,
+    )
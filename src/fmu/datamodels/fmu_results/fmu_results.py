@@ -12,6 +12,7 @@ from pydantic import (
     model_validator,
 )
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import (
     FMU_SCHEMAS_PATH,
     GenerateJsonSchemaBase,
@@ -434,6 +435,7 @@ class ObjectMetadata(MetadataBase):
 
 
 class FmuResults(
+    FromJsonBytesMixin,
     RootModel[
         Annotated[
             CaseMetadata
@@ -443,7 +445,7 @@ class FmuResults(
             | EnsembleMetadata,
             Field(discriminator="class_"),
         ]
-    ]
+    ],
 ):
     @model_validator(mode="after")
     def _check_class_data_spec(self) -> FmuResults:
@@ -0,0 +1,286 @@
+"""Upgrades of FMU results metadata to later schema versions.
+
+Each version in :attr:`FmuResultsSchema.VERSION_CHANGELOG` has a
+:class:`Migration` of the renames, removals and replaced values of that version.
+Changes that cannot be made without more information, like a field that is no
+longer optional, are not migrated, and are reported when validating the upgraded
+metadata.
+
+Migrations are applied to batches of documents, one operation at a time, on the
+dictionaries as loaded from JSON or YAML. The documents are not validated or
+round-tripped through the models.
+
+Example:
+    >>> from fmu.datamodels.fmu_results.migrations import upgrade_stream
+    >>> for document in upgrade_stream(json.loads(line) for line in lines):
+    ...     print(json.dumps(document))
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH
+
+from .fmu_results import FmuResultsSchema
+from .versions import SCHEMA_URL_VERSION, version_of
+
+Document = dict[str, Any]
+"""A metadata document, as loaded from JSON or YAML."""
+
+DEFAULT_BATCH_SIZE: Final = 1000
+"""The default number of documents upgraded at a time by :func:`upgrade_stream`."""
+
+
+def _split(path: str) -> tuple[tuple[str, ...], str]:
+    *parents, key = path.split(".")
+    return tuple(parents), key
+
+
+def _parents(
+    documents: Iterable[Document], parents: tuple[str, ...]
+) -> Iterator[dict[str, Any]]:
+    """Yields the objects at a path in each document that has it."""
+    for document in documents:
+        node: Any = document
+        for key in parents:
+            node = node.get(key)
+            if not isinstance(node, dict):
+                break
+        else:
+            yield node
+
+
+@dataclass(frozen=True)
+class Rename:
+    """Moves a field to another path, i.e. ``data.product`` to
+    ``data.standard_result``. Documents that already have the target are left
+    unchanged."""
+
+    source: str
+    target: str
+
+    def apply(self, documents: list[Document]) -> None:
+        parents, key = _split(self.source)
+        target_parents, target_key = _split(self.target)
+        for document in documents:
+            node = next(_parents([document], parents), None)
+            if node is None or key not in node:
+                continue
+            target: dict[str, Any] = document
+            for part in target_parents:
+                target = target.setdefault(part, {})
+            if target_key not in target:
+                target[target_key] = node.pop(key)
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """Copies a field to another field of the same object, i.e. ``fmu.iteration``
+    to ``fmu.ensemble``. Documents that already have the target are left
+    unchanged."""
+
+    source: str
+    target: str
+
+    def __post_init__(self) -> None:
+        if _split(self.source)[0] != _split(self.target)[0]:
+            raise ValueError(
+                f"'{self.source}' and '{self.target}' have different parents"
+            )
+
+    def apply(self, documents: list[Document]) -> None:
+        parents, key = _split(self.source)
+        target_key = _split(self.target)[1]
+        for node in _parents(documents, parents):
+            if key in node and target_key not in node:
+                node[target_key] = node[key]
+
+
+@dataclass(frozen=True)
+class Remove:
+    """Removes a field, i.e. ``file.absolute_path_symlink``."""
+
+    path: str
+
+    def apply(self, documents: list[Document]) -> None:
+        parents, key = _split(self.path)
+        for node in _parents(documents, parents):
+            node.pop(key, None)
+
+
+@dataclass(frozen=True)
+class ReplaceValue:
+    """Replaces a value of a field, i.e. ``triangulated_surface`` with
+    ``triangulated`` in ``data.layout``."""
+
+    path: str
+    old: Any
+    new: Any
+
+    def apply(self, documents: list[Document]) -> None:
+        parents, key = _split(self.path)
+        for node in _parents(documents, parents):
+            if node.get(key) == self.old:
+                node[key] = self.new
+
+
+Operation = Rename | Duplicate | Remove | ReplaceValue
+"""An operation applied to the documents by a migration."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """The changes of the documents to upgrade them to a version."""
+
+    version: str
+    """The version upgraded to."""
+
+    operations: tuple[Operation, ...] = field(default_factory=tuple)
+    """The operations applied, in order. Empty if the documents of the previous
+    version are also documents of this version."""
+
+    def apply(self, documents: list[Document]) -> None:
+        """Upgrades documents of the previous version in place.
+
+        Also sets ``version`` and the version in the URL of ``$schema``.
+        """
+        for operation in self.operations:
+            operation.apply(documents)
+        replacement = f"/{FMU_SCHEMAS_PATH}/{self.version}/{FmuResultsSchema.FILENAME}"
+        for document in documents:
+            document["version"] = self.version
+            if isinstance(schema := document.get("$schema"), str):
+                document["$schema"] = SCHEMA_URL_VERSION.sub(replacement, schema)
+
+
+MIGRATIONS: Final[tuple[Migration, ...]] = (
+    Migration(
+        "0.9.0",
+        (
+            Rename("data.product", "data.standard_result"),
+            Remove("data.stratigraphic_alias"),
+            Remove("file.absolute_path_symlink"),
+            Remove("file.relative_path_symlink"),
+            Remove("fmu.aggregation.parameters"),
+            Remove("fmu.realization.parameters"),
+            Remove("fmu.realization.jobs"),
+        ),
+    ),
+    Migration("0.10.0", (Duplicate("fmu.iteration", "fmu.ensemble"),)),
+    Migration("0.11.0"),
+    Migration("0.12.0"),
+    Migration(
+        "0.13.0",
+        (ReplaceValue("data.content", "fault_triangulated_surface", "fault_surface"),),
+    ),
+    Migration("0.14.0"),
+    Migration(
+        "0.15.0",
+        (
+            ReplaceValue("class", "triangulated_surface", "surface"),
+            ReplaceValue("data.layout", "triangulated_surface", "triangulated"),
+        ),
+    ),
+    Migration("0.15.1"),
+    Migration("0.16.0"),
+    Migration("0.16.1"),
+    Migration(
+        "0.17.0",
+        (ReplaceValue("data.layout", "faultroom_triangulated", "triangulated"),),
+    ),
+    Migration("0.18.0"),
+    Migration("0.19.0"),
+    Migration("0.20.0"),
+    Migration("0.21.0"),
+    Migration("0.22.0"),
+    Migration("0.23.0"),
+    Migration("0.24.0"),
+    Migration("0.25.0"),
+)
+"""The migrations to each version after the initial 0.8.0, in order."""
+
+_VERSIONS: Final = ["0.8.0", *(migration.version for migration in MIGRATIONS)]
+
+
+def migrations(
+    source: str, target: str = FmuResultsSchema.VERSION
+) -> tuple[Migration, ...]:
+    """Returns the migrations upgrading documents from one version to another.
+
+    Raises:
+        ValueError: If a version is unknown, or the target is before the source.
+    """
+    for version in (source, target):
+        if version not in _VERSIONS:
+            raise ValueError(
+                f"Unknown version '{version}', expected one of: {', '.join(_VERSIONS)}"
+            )
+    start, stop = _VERSIONS.index(source), _VERSIONS.index(target)
+    if stop < start:
+        raise ValueError(f"Cannot downgrade from version {source} to {target}")
+    return MIGRATIONS[start:stop]
+
+
+def upgrade(
+    documents: list[Document], target: str = FmuResultsSchema.VERSION
+) -> list[Document]:
+    """Upgrades documents of mixed versions to a version, in place.
+
+    The documents are grouped by version, and each migration is applied to all
+    documents it upgrades at once.
+
+    Args:
+        documents: The documents to upgrade.
+        target: The version to upgrade to. The current version by default.
+
+    Returns:
+        The documents.
+
+    Raises:
+        ValueError: If the version of a document is unknown or later than the
+            target.
+    """
+    pending: dict[str, list[Document]] = {}
+    for document in documents:
+        pending.setdefault(version_of(document), []).append(document)
+    for version in pending:
+        migrations(version, target)
+
+    # Documents of a version join those upgraded to it, so every migration is
+    # applied once to all documents it upgrades
+    batch: list[Document] = []
+    for previous, migration in zip(
+        _VERSIONS, migrations(_VERSIONS[0], target), strict=False
+    ):
+        batch += pending.pop(previous, [])
+        if batch:
+            migration.apply(batch)
+    return documents
+
+
+def upgrade_stream(
+    documents: Iterable[Document],
+    target: str = FmuResultsSchema.VERSION,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Document]:
+    """Upgrades a stream of documents of mixed versions to a version.
+
+    The documents are upgraded in place, in batches, and yielded in input order.
+    See :func:`upgrade`.
+
+    Args:
+        documents: The documents to upgrade.
+        target: The version to upgrade to. The current version by default.
+        batch_size: The number of documents upgraded at a time.
+
+    Raises:
+        ValueError: If the version of a document is unknown or later than the
+            target.
+    """
+    iterator = iter(documents)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield from upgrade(batch, target)
@@ -0,0 +1,252 @@
+"""Projection of FMU results metadata onto its contractual fields.
+
+Consumers like search indexes only rely on the fields listed in
+:attr:`FmuResultsSchema.CONTRACTUAL`. This module derives a reduced Pydantic model
+from :class:`FmuResults` that has only those fields, so that they can be validated
+and extracted without validating the rest of the metadata.
+
+A contractual field has the type it has in any of the metadata, data or
+specification models it is a field of, and is optional unless every model at its
+path requires it. The reduced model does not know which concrete model the tags of
+the metadata select, so it checks that each field is valid in some model rather
+than in the selected one.
+
+Example:
+    >>> from fmu.datamodels.fmu_results.projection import project_json
+    >>> record = project_json(path.read_bytes())
+    >>> record["data.content"], record["fmu.case"]["name"]
+    ('depth', 'my_case')
+"""
+
+from __future__ import annotations
+
+import functools
+import keyword
+import operator
+import types
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, Field, RootModel, create_model
+from pydantic_core import PydanticUndefined
+
+from fmu.datamodels._json import json_input
+
+from .fmu_results import FmuResults, FmuResultsSchema
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pydantic.fields import FieldInfo
+
+    from fmu.datamodels._json import JsonInput
+
+_Tree = dict[str, "_Tree"]
+
+
+def _tree(paths: list[str]) -> _Tree:
+    """Nests dotted paths, i.e. ``['a.b', 'a.c']`` as ``{'a': {'b': {}, 'c': {}}}``."""
+    tree: _Tree = {}
+    for path in paths:
+        node = tree
+        for key in path.split("."):
+            node = node.setdefault(key, {})
+    return tree
+
+
+def model_members(annotation: Any) -> tuple[bool, list[type[BaseModel]]]:
+    """Returns whether an annotation is of a list, and the models in it.
+
+    Unions, ``Annotated`` and root models are looked through, i.e. the members of
+    ``FmuResults`` are the metadata models its root is a union of.
+
+    Example:
+        >>> model_members(FmuResults)
+        (False, [CaseMetadata, ObjectMetadata, RealizationMetadata, ...])
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return model_members(get_args(annotation)[0])
+    if origin in (Union, types.UnionType):
+        is_list, models = False, []
+        for arg in get_args(annotation):
+            arg_is_list, arg_models = model_members(arg)
+            is_list |= arg_is_list
+            models += [model for model in arg_models if model not in models]
+        return is_list, models
+    if origin is list:
+        return True, model_members(get_args(annotation)[0])[1]
+    if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return False, []
+    # Resolves the forward references of models only built as fields of others
+    annotation.model_rebuild()
+    if issubclass(annotation, RootModel):
+        return model_members(annotation.model_fields["root"].annotation)
+    return False, [annotation]
+
+
+def _field(model: type[BaseModel], key: str) -> FieldInfo | None:
+    """Returns the field of a model by its name in JSON."""
+    for name, info in model.model_fields.items():
+        if (info.alias or name) == key:
+            return info
+    return None
+
+
+def _leaf_type(infos: list[FieldInfo]) -> Any:
+    """Returns the union of the types of a field in all its models.
+
+    The literals of tags, like ``data.content``, are merged into one literal of all
+    values, which validates far faster than a union of one literal per model.
+    """
+    leaves: list[Any] = []
+    values: list[Any] = []
+    for info in infos:
+        if get_origin(info.annotation) is Literal and not info.metadata:
+            values += [
+                value for value in get_args(info.annotation) if value not in values
+            ]
+            continue
+        leaf = (
+            Annotated[(info.annotation, *info.metadata)]
+            if info.metadata
+            else info.annotation
+        )
+        if leaf not in leaves:
+            leaves.append(leaf)
+    values = [
+        value
+        for value in values
+        if not any(
+            isinstance(leaf, type) and isinstance(value, leaf) for leaf in leaves
+        )
+    ]
+    if values:
+        leaves.append(Literal[tuple(values)])
+    return functools.reduce(operator.or_, leaves)
+
+
+def _default(infos: list[FieldInfo]) -> Any:
+    """Returns the default of a field if it is the same in all its models, or else
+    None."""
+    defaults = {repr(info.default) for info in infos}
+    if len(defaults) == 1 and infos[0].default is not PydanticUndefined:
+        return infos[0].default
+    return None
+
+
+def _build(name: str, models: list[type[BaseModel]], tree: _Tree) -> type[BaseModel]:
+    """Builds the reduced model of the fields in a tree of the given models."""
+    fields: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        infos = [info for model in models if (info := _field(model, key))]
+        if not infos:
+            raise ValueError(f"'{key}' is not a field of {name}")
+
+        if subtree:
+            is_list, members = False, []
+            for info in infos:
+                info_is_list, info_models = model_members(info.annotation)
+                is_list |= info_is_list
+                members += [model for model in info_models if model not in members]
+            annotation: Any = _build(f"{name}{key.title()}", members, subtree)
+            if is_list:
+                annotation = list[annotation]
+        else:
+            annotation = _leaf_type(infos)
+
+        if len(infos) == len(models) and all(info.is_required() for info in infos):
+            default: Any = ...
+        else:
+            annotation |= None
+            default = _default(infos) if not subtree else None
+
+        field_name = (
+            key if key.isidentifier() and not keyword.iskeyword(key) else f"{key}_"
+        )
+        fields[field_name] = (annotation, Field(default, alias=key))
+    return create_model(name.replace("_", ""), **fields)
+
+
+@functools.cache
+def _contractual_tree() -> _Tree:
+    return _tree(FmuResultsSchema.CONTRACTUAL)
+
+
+@functools.cache
+def contractual_model() -> type[BaseModel]:
+    """Returns the reduced model of the contractual fields of FMU results metadata.
+
+    The model is built once, from the models of :class:`FmuResults`.
+    """
+    _, models = model_members(FmuResults)
+    return _build("Contractual", models, _contractual_tree())
+
+
+def _flatten(
+    value: Any, tree: _Tree, prefix: str, flat: dict[str, Any]
+) -> dict[str, Any]:
+    """Adds the values at the leaves of a tree to a flat record."""
+    for key, subtree in tree.items():
+        path = f"{prefix}{key}"
+        child = value.get(key) if isinstance(value, dict) else None
+        if not subtree:
+            flat[path] = child
+        elif isinstance(child, list):
+            items = [_flatten(item, subtree, "", {}) for item in child]
+            for leaf in _flatten(None, subtree, "", {}):
+                flat[f"{path}.{leaf}"] = [item[leaf] for item in items]
+        else:
+            _flatten(child, subtree, f"{path}.", flat)
+    return flat
+
+
+def record(contractual: BaseModel) -> dict[str, Any]:
+    """Returns the flat record of a validated :func:`contractual_model`.
+
+    The record maps every contractual path to its value as JSON, or None if the
+    metadata does not have it. Paths through a list, like ``tracklog.event``, have
+    a list of the values of each item.
+    """
+    dumped = contractual.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return _flatten(dumped, _contractual_tree(), "", {})
+
+
+def project(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Validates and extracts the contractual fields of metadata.
+
+    Args:
+        payload: The FMU results metadata, as loaded from JSON or YAML.
+
+    Returns:
+        The flat record of the contractual fields, see :func:`record`.
+
+    Raises:
+        ValidationError: If a contractual field is invalid.
+    """
+    return record(contractual_model().model_validate(payload))
+
+
+def project_json(data: JsonInput) -> dict[str, Any]:
+    """Validates and extracts the contractual fields of metadata from raw JSON.
+
+    The JSON is parsed while validating, and fields that are not contractual are
+    skipped without being validated.
+
+    Args:
+        data: The raw JSON, i.e. the contents of a metadata file.
+
+    Returns:
+        The flat record of the contractual fields, see :func:`record`.
+
+    Raises:
+        ValidationError: If the JSON is malformed or a contractual field invalid.
+    """
+    return record(contractual_model().model_validate_json(json_input(data)))
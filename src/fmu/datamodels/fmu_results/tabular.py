@@ -0,0 +1,162 @@
+"""Export of many FMU results documents to one flat Arrow table.
+
+Documents are converted to Arrow in batches, and their nested objects are flattened
+by Arrow into one column per dotted path, i.e. ``fmu.realization.id`` or
+``data.bbox.xmin``. Lists, like ``tracklog``, are kept as list columns. The batches
+are combined into one table with the columns of all of them, so documents of
+different classes and contents can be exported together.
+
+Columns of fields that are enumerations or literals in the models, like ``class``,
+``data.content`` or ``data.format``, are dictionary encoded.
+
+This module requires ``pyarrow``, installed with the ``arrow`` extra:
+
+    $ pip install fmu-datamodels[arrow]
+
+Example:
+    >>> from fmu.datamodels.fmu_results.tabular import write_parquet
+    >>> documents = (json.loads(path.read_bytes()) for path in paths)
+    >>> write_parquet(documents, "metadata.parquet")
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import types
+from collections.abc import Iterable, Iterator, Mapping
+from enum import Enum
+from pathlib import Path
+from typing import IO, Annotated, Any, Final, Literal, Union, cast, get_args, get_origin
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from .fmu_results import FmuResults
+from .projection import model_members
+
+Document = FmuResults | BaseModel | Mapping[str, Any]
+"""An FMU results document, as a model or as loaded from JSON or YAML."""
+
+DEFAULT_BATCH_SIZE: Final = 1000
+"""The default number of documents converted to Arrow at a time."""
+
+
+def _is_categorical(annotation: Any) -> bool:
+    """Returns True if an annotation only has a fixed set of values."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _is_categorical(get_args(annotation)[0])
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return all(_is_categorical(arg) for arg in args)
+    if origin is Literal:
+        return True
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+def _categorical_paths(models: list[type[BaseModel]], prefix: str) -> Iterator[str]:
+    for model in models:
+        for name, info in model.model_fields.items():
+            path = f"{prefix}{info.alias or name}"
+            is_list, members = model_members(info.annotation)
+            if members:
+                if not is_list:
+                    yield from _categorical_paths(members, f"{path}.")
+            elif _is_categorical(info.annotation):
+                yield path
+
+
+@functools.cache
+def categorical_paths() -> frozenset[str]:
+    """Returns the dotted paths of the fields that only have a fixed set of values
+    in any of the models of :class:`FmuResults`, like ``data.content``."""
+    _, models = model_members(FmuResults)
+    return frozenset(_categorical_paths(models, ""))
+
+
+def _as_dict(document: Document) -> Mapping[str, Any]:
+    if isinstance(document, BaseModel):
+        return document.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return document
+
+
+def _flatten(table: pa.Table) -> pa.Table:
+    """Flattens nested structs into columns named by their dotted paths."""
+    while any(pa.types.is_struct(column.type) for column in table.columns):
+        table = table.flatten()
+    return table
+
+
+def iter_tables(
+    documents: Iterable[Document], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.Table]:
+    """Converts documents to flat Arrow tables, one batch of documents at a time.
+
+    The columns of each table are those of the documents in its batch. Columns are
+    not dictionary encoded, see :func:`to_table`.
+
+    Args:
+        documents: The documents to convert.
+        batch_size: The number of documents in each table.
+    """
+    iterator = iter(documents)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        # Unlike Table.from_pylist, which only looks at the first document, a struct
+        # array has the fields of all documents of the batch
+        rows: list[Any] = [_as_dict(document) for document in batch]
+        yield _flatten(
+            pa.Table.from_struct_array(cast("pa.StructArray", pa.array(rows)))
+        )
+
+
+def _dictionary_encode(table: pa.Table, paths: frozenset[str]) -> pa.Table:
+    for index, name in enumerate(table.column_names):
+        column = table.column(index)
+        if name in paths and (
+            pa.types.is_string(column.type) or pa.types.is_large_string(column.type)
+        ):
+            table = table.set_column(index, name, column.dictionary_encode())
+    return table
+
+
+def to_table(
+    documents: Iterable[Document], batch_size: int = DEFAULT_BATCH_SIZE
+) -> pa.Table:
+    """Exports documents to one flat Arrow table, with a row per document.
+
+    The table has the columns of all documents, null where a document does not
+    have the field. A column that has integers in some batches and floats in
+    others becomes a float column.
+
+    Args:
+        documents: The documents to export, as :class:`FmuResults` or other models,
+            or as dictionaries loaded from JSON or YAML.
+        batch_size: The number of documents converted to Arrow at a time.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a field has values of incompatible types.
+    """
+    tables = list(iter_tables(documents, batch_size))
+    if not tables:
+        return pa.table({})
+    table = pa.concat_tables(tables, promote_options="permissive")
+    return _dictionary_encode(table, categorical_paths())
+
+
+def write_parquet(
+    documents: Iterable[Document],
+    where: str | Path | IO[bytes],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **kwargs: Any,
+) -> None:
+    """Exports documents to a Parquet file. See :func:`to_table`.
+
+    Args:
+        documents: The documents to export.
+        where: The path or binary file object to write to.
+        batch_size: The number of documents converted to Arrow at a time.
+        kwargs: Passed on to ``pyarrow.parquet.write_table``.
+    """
+    pq.write_table(to_table(documents, batch_size), where, **kwargs)
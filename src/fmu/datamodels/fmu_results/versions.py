@@ -0,0 +1,170 @@
+"""Validation of FMU results metadata against the schema of its own version.
+
+Only the current version of :class:`FmuResults` exists as Pydantic models, but
+every published version of ``fmu_results.json`` is in the schema store. A
+:class:`VersionRegistry` compiles the schema of a version when first needed and
+keeps the most recently used validators, so that an archive of metadata of mixed
+versions can be validated in one pass.
+
+Example:
+    >>> from fmu.datamodels.fmu_results.versions import VersionRegistry
+    >>> registry = VersionRegistry()
+    >>> errors = registry.validate_many(documents)
+    >>> [e for e in errors if e is not None]
+    [(('data', 'content'), "'nope' is not one of ['depth', ...]")]
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Final
+
+from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, version_key
+from fmu.datamodels._schema_urls import FmuSchemaUrls
+from fmu.datamodels.schema_compiler import compile_schema
+from fmu.datamodels.schema_store import SchemaStore, default_store
+
+from .fmu_results import FmuResultsSchema
+
+if TYPE_CHECKING:
+    from fmu.datamodels.schema_compiler import CompiledSchema, SchemaError
+
+DEFAULT_MAXSIZE: Final = 8
+"""The default number of compiled validators kept."""
+
+_VERSION: Final = re.compile(r"\d+\.\d+\.\d+")
+
+SCHEMA_URL_VERSION: Final = re.compile(
+    rf"/{FMU_SCHEMAS_PATH}/(?P<version>[^/]+)/{re.escape(FmuResultsSchema.FILENAME)}$"
+)
+"""Matches the version in the URL of a ``fmu_results.json``."""
+
+
+def version_of(document: Mapping[str, Any]) -> str:
+    """Returns the schema version of a document.
+
+    The version is read from ``version``, or else from the URL in ``$schema``.
+
+    Raises:
+        ValueError: If the document has neither.
+    """
+    version = document.get("version")
+    if isinstance(version, str):
+        return version
+    schema = document.get("$schema")
+    if isinstance(schema, str) and (match := SCHEMA_URL_VERSION.search(schema)):
+        return match["version"]
+    raise ValueError(
+        "Cannot determine the schema version, the document has no 'version' "
+        "and no '$schema' URL of a schema version"
+    )
+
+
+class VersionRegistry:
+    """Validators of every published version of ``fmu_results.json``.
+
+    Validators are compiled from the schema store when first used, see
+    :mod:`fmu.datamodels.schema_compiler`, and the least recently used are
+    discarded when more than ``maxsize`` are kept.
+    """
+
+    def __init__(
+        self, store: SchemaStore | None = None, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        """
+        Args:
+            store: The store of the schemas. The default store if not given.
+            maxsize: The number of compiled validators to keep.
+        """
+        self.store = store or default_store()
+        self.validator = functools.lru_cache(maxsize=maxsize)(self._compile)
+
+    def versions(self) -> list[str]:
+        """Returns all versions of ``fmu_results.json`` in the store, oldest first."""
+        return sorted(
+            (
+                path.parent.name
+                for path in self.store.root.glob(f"*/{FmuResultsSchema.FILENAME}")
+            ),
+            key=version_key,
+        )
+
+    def url(self, version: str) -> str:
+        """Returns the URL of a version of ``fmu_results.json``."""
+        return (
+            f"{FmuSchemaUrls.DEV_URL}/{FMU_SCHEMAS_PATH}/{version}/"
+            f"{FmuResultsSchema.FILENAME}"
+        )
+
+    def _compile(self, version: str) -> CompiledSchema:
+        """Compiles the schema of a version. Cached as :meth:`validator`.
+
+        Raises:
+            ValueError: If the version is not in the store.
+        """
+        try:
+            if not _VERSION.fullmatch(version):
+                raise FileNotFoundError(version)
+            # Not through the caches of the store, so that evicted validators and
+            # their schemas are freed
+            schema = json.loads(self.store.read_bytes(self.url(version)))
+        except FileNotFoundError:
+            raise ValueError(
+                f"No {FmuResultsSchema.FILENAME} of version '{version}', expected "
+                f"one of: {', '.join(self.versions())}"
+            ) from None
+        return compile_schema(schema)
+
+    def version_of(self, document: Mapping[str, Any]) -> str:
+        """Returns the schema version of a document. See :func:`version_of`."""
+        return version_of(document)
+
+    def first_error(self, document: Mapping[str, Any]) -> SchemaError | None:
+        """Validates a document against the schema of its version.
+
+        Returns:
+            The path and message of the first violation, or None if valid.
+
+        Raises:
+            ValueError: If the version of the document cannot be determined or is
+                not in the store.
+        """
+        return self.validator(self.version_of(document)).first_error(document)
+
+    def validate_many(
+        self, documents: Iterable[Mapping[str, Any]]
+    ) -> list[SchemaError | None]:
+        """Validates documents of mixed versions against the schema of each.
+
+        The documents are validated grouped by version, so that each validator is
+        compiled at most once, however many versions there are and however few
+        validators are kept.
+
+        Returns:
+            The first violation of each document, or None if valid, in input
+            order. A document of unknown version has an error on ``version``.
+        """
+        documents = list(documents)
+        errors: list[SchemaError | None] = [None] * len(documents)
+        by_version: dict[str, list[int]] = {}
+        for index, document in enumerate(documents):
+            try:
+                version = self.version_of(document)
+            except ValueError as e:
+                errors[index] = (("version",), str(e))
+            else:
+                by_version.setdefault(version, []).append(index)
+
+        for version, indices in by_version.items():
+            try:
+                validator = self.validator(version)
+            except ValueError as e:
+                for index in indices:
+                    errors[index] = (("version",), str(e))
+                continue
+            for index in indices:
+                errors[index] = validator.first_error(documents[index])
+        return errors
@@ -0,0 +1,156 @@
+"""Parallel validation of metadata files.
+
+Validating the metadata of all objects in an ensemble is CPU-bound, so the files
+are sharded across a pool of processes. Each worker builds and warms its own
+validator once, and the results are streamed back in input order.
+
+JSON files are validated directly from their bytes. YAML files, like the
+``.<name>.yml`` metadata files written next to exported objects, require
+``PyYAML``.
+
+Example:
+    >>> from fmu.datamodels.parallel import validate_files
+    >>> paths = Path("realization-0").rglob(".*.yml")
+    >>> for result in validate_files(paths, max_workers=8):
+    ...     if not result.is_valid:
+    ...         print(result.path, result.errors)
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from fmu.datamodels.validators import get_adapter, registry
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+    from pydantic_core import ErrorDetails
+
+DEFAULT_CHUNKSIZE = 16
+"""The default number of files sent to a worker at a time."""
+
+YAML_SUFFIXES = frozenset({".yml", ".yaml"})
+"""File suffixes read as YAML. Other files are read as JSON."""
+
+
+@dataclass(frozen=True)
+class FileValidationResult:
+    """The result of validating one metadata file."""
+
+    path: Path
+    """The validated file."""
+
+    errors: list[ErrorDetails] = field(default_factory=list)
+    """The validation errors, without their input values. Empty if valid."""
+
+    model: Any | None = None
+    """The validated model, if requested and valid."""
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the file is valid."""
+        return not self.errors
+
+
+_adapter: TypeAdapter[Any] | None = None
+_return_models = False
+
+
+def _init_worker(name: str, version: str | None, return_models: bool) -> None:
+    """Builds the validator of a worker process once, before it gets any files."""
+    global _adapter, _return_models
+    _adapter = get_adapter(name, version)
+    _return_models = return_models
+
+
+def _file_error(error_type: str, message: str) -> ErrorDetails:
+    # Without an input value, like the validation errors from include_input=False
+    return {"type": error_type, "loc": (), "msg": message}  # type: ignore[typeddict-item]
+
+
+def _load_yaml(path: Path, data: bytes) -> Any | FileValidationResult:
+    """Loads a YAML document, or returns the result of a file that is not valid
+    YAML."""
+    # PyYAML is optional and untyped
+    yaml: Any = importlib.import_module("yaml")
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(data, Loader=loader)
+    except yaml.YAMLError as e:
+        return FileValidationResult(path, [_file_error("yaml_invalid", str(e))])
+
+
+def _validate_file(path: Path) -> FileValidationResult:
+    """Validates one file in a worker process."""
+    assert _adapter is not None
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        return FileValidationResult(path, [_file_error("file_not_readable", str(e))])
+
+    try:
+        if path.suffix.lower() in YAML_SUFFIXES:
+            obj = _load_yaml(path, data)
+            if isinstance(obj, FileValidationResult):
+                return obj
+            model = _adapter.validate_python(obj)
+        else:
+            model = _adapter.validate_json(data)
+    except ValidationError as e:
+        return FileValidationResult(
+            path, e.errors(include_url=False, include_input=False)
+        )
+    return FileValidationResult(path, model=model if _return_models else None)
+
+
+def validate_files(
+    paths: Iterable[str | Path],
+    name: str = "fmu_results",
+    version: str | None = None,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    return_models: bool = False,
+) -> Iterator[FileValidationResult]:
+    """Validates metadata files in parallel, yielding the results in input order.
+
+    Args:
+        paths: The JSON or YAML files to validate.
+        name: The schema or model name to validate against. Defaults to
+            ``fmu_results``.
+        version: The version of the schema. Defaults to the current version.
+        max_workers: The number of worker processes. Defaults to the number of
+            CPUs. With a single worker the files are validated in this process.
+        chunksize: The number of files sent to a worker at a time. Larger chunks
+            reduce the overhead of inter-process communication for many small
+            files.
+        return_models: If True, the validated models are sent back from the
+            workers. This adds the cost of pickling every model.
+
+    Raises:
+        ImportError: If a YAML file is given and PyYAML is not installed.
+        KeyError: If no validator is registered for the name and version.
+    """
+    # Fail early, in this process, on an unknown schema, without building its
+    # validator that only the workers use
+    if version not in registry.versions(name) and version is not None:
+        raise KeyError(f"No validator registered for '{name}' version {version}")
+    path_iter = (Path(p) for p in paths)
+
+    if max_workers == 1:
+        _init_worker(name, version, return_models)
+        yield from map(_validate_file, path_iter)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(name, version, return_models),
+    ) as executor:
+        yield from executor.map(_validate_file, path_iter, chunksize=chunksize)
@@ -0,0 +1,621 @@
+"""Compiles JSON schemas into Python validation functions.
+
+Interpreting a JSON schema walks the schema for every instance validated. For the
+deep ``oneOf`` of :class:`FmuResults`, an interpreter also tries every member of
+the union until one matches. This module instead generates the source of a
+module with one function per subschema, with every keyword resolved at compile
+time. A ``oneOf`` with a ``discriminator``, i.e. on ``class`` and
+``data.content``, is compiled into a lookup of the member by its tag, so only
+that member is validated.
+
+The generated module depends only on the standard library, so it can be shipped
+and used without this package. It provides ``validate(data)``, raising its
+``SchemaValidationError`` on the first violation, ``is_valid(data)`` and
+``first_error(data)``, returning the path and message of the first violation or
+None.
+
+Only the keywords used by the schemas of this package are supported, see
+:data:`KEYWORDS`. ``format`` is an annotation, as by default in JSON schema draft
+2020-12, and is not asserted. ``dependencies`` is validated as in earlier drafts,
+as used by the schemas of this package.
+
+This module only depends on the standard library, so that it can also be used
+where this package is not installed, like when building the schema server.
+
+Example:
+    >>> from fmu.datamodels.schema_compiler import compile_schema
+    >>> validator = compile_schema(FmuResultsSchema.dump())
+    >>> validator.is_valid(metadata)
+    True
+    >>> Path("fmu_results.py").write_text(validator.source)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+JsonPath = tuple[str | int, ...]
+"""The path to a value in a JSON document, i.e. ``("data", "spec", 0)``."""
+
+SchemaError = tuple[JsonPath, str]
+"""The path to an invalid value and the violation."""
+
+KEYWORDS: Final = frozenset(
+    {
+        "$ref",
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "const",
+        "dependencies",
+        "else",
+        "enum",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "if",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minimum",
+        "not",
+        "oneOf",
+        "pattern",
+        "properties",
+        "required",
+        "then",
+        "type",
+    }
+)
+"""Keywords that are validated."""
+
+UNSUPPORTED_KEYWORDS: Final = frozenset(
+    {
+        "$dynamicRef",
+        "contains",
+        "dependentRequired",
+        "dependentSchemas",
+        "maxContains",
+        "maxProperties",
+        "minContains",
+        "minProperties",
+        "multipleOf",
+        "patternProperties",
+        "prefixItems",
+        "propertyNames",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+        "uniqueItems",
+    }
+)
+"""Keywords that affect validation but are not supported. Other keywords, like
+``title`` or ``$contractual``, are annotations and are ignored."""
+
+_TYPE_CHECKS: Final = {
+    "array": "isinstance(data, list)",
+    "boolean": "isinstance(data, bool)",
+    "integer": "(isinstance(data, int) and not isinstance(data, bool)) "
+    "or (isinstance(data, float) and data.is_integer())",
+    "null": "data is None",
+    "number": "isinstance(data, (int, float)) and not isinstance(data, bool)",
+    "object": "isinstance(data, dict)",
+    "string": "isinstance(data, str)",
+}
+
+_HEADER: Final = '''\
+"""Validates instances of the JSON schema in ``SCHEMA_ID``.
+
+Generated by fmu.datamodels.schema_compiler. Do not edit.
+"""
+
+import re
+
+SCHEMA_ID = {id}
+
+
+class SchemaValidationError(ValueError):
+    """An instance is invalid."""
+
+    def __init__(self, path, message):
+        location = "$" + "".join(
+            f"[{{p}}]" if isinstance(p, int) else f".{{p}}" for p in path
+        )
+        super().__init__(f"{{location}}: {{message}}")
+        self.path = path
+        self.message = message
+
+
+def first_error(data):
+    """Returns the path and message of the first violation, or None if valid."""
+    return {root}(data)
+
+
+def is_valid(data):
+    """Returns True if the instance is valid."""
+    return {root}(data) is None
+
+
+def validate(data):
+    """Raises SchemaValidationError if the instance is invalid."""
+    error = {root}(data)
+    if error is not None:
+        raise SchemaValidationError(*error)
+
+
+def _valid(data):
+    return None
+
+
+def _invalid(data):
+    return ((), "False schema does not allow " + repr(data))
+
+
+def _equal(a, b):
+    """Returns True if two JSON values are equal, without 1 being equal to True."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    return type(a) is type(b) and a == b
+
+
+def _no_match(data, errors):
+    best = max(errors, key=lambda e: len(e[0]))
+    if best[0]:
+        return best
+    return ((), repr(data) + " is not valid under any of the given schemas")
+'''
+
+
+class SchemaValidationError(ValueError):
+    """An instance is invalid against a compiled schema."""
+
+    def __init__(self, path: JsonPath, message: str) -> None:
+        location = "$" + "".join(
+            f"[{p}]" if isinstance(p, int) else f".{p}" for p in path
+        )
+        super().__init__(f"{location}: {message}")
+        self.path = path
+        self.message = message
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A compiled JSON schema."""
+
+    source: str
+    """The source of the generated module."""
+
+    first_error: Callable[[Any], SchemaError | None]
+    """Returns the path and message of the first violation, or None if valid."""
+
+    def is_valid(self, data: Any) -> bool:
+        """Returns True if the instance is valid."""
+        return self.first_error(data) is None
+
+    def validate(self, data: Any) -> None:
+        """Validates an instance, as loaded from JSON.
+
+        Raises:
+            SchemaValidationError: On the first violation of the schema.
+        """
+        error = self.first_error(data)
+        if error is not None:
+            raise SchemaValidationError(*error)
+
+
+class _Compiler:
+    """Generates a function for each subschema of a schema."""
+
+    def __init__(self, schema: Mapping[str, Any]) -> None:
+        self.schema = schema
+        self.functions: list[str] = []
+        self.constants: list[str] = []
+        self.refs: dict[str, str] = {}
+
+    def _name(self, prefix: str) -> str:
+        return f"_{prefix}{len(self.functions) + len(self.constants)}"
+
+    def _constant(self, prefix: str, value: str) -> str:
+        name = self._name(prefix)
+        self.constants.append(f"{name} = {value}")
+        return name
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local references are supported, got '{ref}'")
+        node: Any = self.schema
+        for part in ref[1:].split("/")[1:]:
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return node
+
+    def ref(self, ref: str) -> str:
+        """Returns the function of a referenced subschema, compiling it once."""
+        if ref not in self.refs:
+            schema = self._resolve(ref)
+            if not isinstance(schema, dict):
+                self.refs[ref] = self.compile(schema)
+            else:
+                # Named before compiling, as the subschema may refer to itself
+                self.refs[ref] = name = self._name("s")
+                self._function(name, schema)
+        return self.refs[ref]
+
+    def compile(self, schema: Any) -> str:
+        """Returns the function of a subschema."""
+        if schema is True or schema == {}:
+            return "_valid"
+        if schema is False:
+            return "_invalid"
+        keywords = schema.keys() & KEYWORDS
+        if not keywords and not schema.keys() & UNSUPPORTED_KEYWORDS:
+            return "_valid"
+        if keywords == {"$ref"}:
+            return self.ref(schema["$ref"])
+        return self._function(self._name("s"), schema)
+
+    def _function(self, name: str, schema: dict[str, Any]) -> str:
+        """Compiles a subschema into a function and returns its name."""
+        # The slot is taken before compiling the body, which may add functions
+        self.functions.append("")
+        index = len(self.functions) - 1
+        body = [*self._body(schema), "return None"]
+        self.functions[index] = "\n".join([f"def {name}(data):", *_indent(body)])
+        return name
+
+    def _body(self, schema: dict[str, Any]) -> list[str]:
+        if unsupported := schema.keys() & UNSUPPORTED_KEYWORDS:
+            raise ValueError(f"Unsupported keywords: {sorted(unsupported)}")
+
+        lines: list[str] = []
+        if "$ref" in schema:
+            lines += _check(f"{self.ref(schema['$ref'])}(data)")
+        if "type" in schema:
+            lines += self._type(schema["type"])
+        if "const" in schema:
+            const = schema["const"]
+            expected = repr(const)
+            if isinstance(const, str):
+                condition = f"isinstance(data, str) and data == {expected}"
+            else:
+                condition = f"_equal(data, {expected})"
+            lines += [
+                f"if not ({condition}):",
+                f"    return ((), {expected + ' was expected'!r})",
+            ]
+        if "enum" in schema:
+            values = tuple(schema["enum"])
+            message = f" is not one of {list(values)!r}"
+            if all(isinstance(value, str) for value in values):
+                condition = f"isinstance(data, str) and data in {values!r}"
+            else:
+                condition = f"any(_equal(data, v) for v in {values!r})"
+            lines += [
+                f"if not ({condition}):",
+                f"    return ((), repr(data) + {message!r})",
+            ]
+        lines += self._number(schema)
+        lines += self._string(schema)
+        lines += self._array(schema)
+        lines += self._object(schema)
+        lines += self._applicators(schema)
+        return lines
+
+    def _type(self, types: str | list[str]) -> list[str]:
+        types = [types] if isinstance(types, str) else types
+        condition = " or ".join(f"({_TYPE_CHECKS[t]})" for t in types)
+        expected = ", ".join(repr(t) for t in types)
+        return [
+            f"if not ({condition}):",
+            f"    return ((), repr(data) + {' is not of type ' + expected!r})",
+        ]
+
+    def _number(self, schema: dict[str, Any]) -> list[str]:
+        checks = {
+            "minimum": ("<", "less than the minimum of"),
+            "maximum": (">", "greater than the maximum of"),
+            "exclusiveMinimum": ("<=", "less than or equal to the minimum of"),
+            "exclusiveMaximum": (">=", "greater than or equal to the maximum of"),
+        }
+        lines = []
+        for keyword, (operator, message) in checks.items():
+            if keyword in schema:
+                limit = _limit(schema, keyword)
+                lines += [
+                    f"if data {operator} {limit!r}:",
+                    f"    return ((), repr(data) + {f' is {message} {limit!r}'!r})",
+                ]
+        if not lines:
+            return []
+        return [
+            "if isinstance(data, (int, float)) and not isinstance(data, bool):",
+            *_indent(lines),
+        ]
+
+    def _string(self, schema: dict[str, Any]) -> list[str]:
+        lines = []
+        if "minLength" in schema:
+            length = _count(schema, "minLength")
+            lines += [
+                f"if len(data) < {length!r}:",
+                "    return ((), repr(data) + "
+                f"{f' is shorter than {length} characters'!r})",
+            ]
+        if "maxLength" in schema:
+            length = _count(schema, "maxLength")
+            lines += [
+                f"if len(data) > {length!r}:",
+                "    return ((), repr(data) + "
+                f"{f' is longer than {length} characters'!r})",
+            ]
+        if "pattern" in schema:
+            re.compile(schema["pattern"])
+            pattern = self._constant("p", f"re.compile({schema['pattern']!r})")
+            lines += [
+                f"if {pattern}.search(data) is None:",
+                "    return ((), repr(data) + "
+                f"{' does not match ' + repr(schema['pattern'])!r})",
+            ]
+        if not lines:
+            return []
+        return ["if isinstance(data, str):", *_indent(lines)]
+
+    def _array(self, schema: dict[str, Any]) -> list[str]:
+        lines = []
+        if "minItems" in schema:
+            count = _count(schema, "minItems")
+            lines += [
+                f"if len(data) < {count!r}:",
+                "    return ((), repr(data) + "
+                f"{f' should have at least {count} items'!r})",
+            ]
+        if "maxItems" in schema:
+            count = _count(schema, "maxItems")
+            lines += [
+                f"if len(data) > {count!r}:",
+                "    return ((), repr(data) + "
+                f"{f' should have at most {count} items'!r})",
+            ]
+        if "items" in schema:
+            if isinstance(schema["items"], list):
+                raise ValueError("Only a schema is supported as 'items'")
+            items = self.compile(schema["items"])
+            if items != "_valid":
+                lines += [
+                    "for i, item in enumerate(data):",
+                    f"    e = {items}(item)",
+                    "    if e is not None:",
+                    "        return ((i, *e[0]), e[1])",
+                ]
+        if not lines:
+            return []
+        return ["if isinstance(data, list):", *_indent(lines)]
+
+    def _object(self, schema: dict[str, Any]) -> list[str]:
+        lines = []
+        for key in schema.get("required", []):
+            lines += [
+                f"if {key!r} not in data:",
+                f"    return ((), {repr(key) + ' is a required property'!r})",
+            ]
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            function = self.compile(subschema)
+            if function != "_valid":
+                lines += [
+                    f"if {key!r} in data:",
+                    f"    e = {function}(data[{key!r}])",
+                    "    if e is not None:",
+                    f"        return (({key!r}, *e[0]), e[1])",
+                ]
+        if "additionalProperties" in schema:
+            function = self.compile(schema["additionalProperties"])
+            known = self._constant("k", repr(frozenset(properties)))
+            if function == "_invalid":
+                lines += [
+                    "for key in data:",
+                    f"    if key not in {known}:",
+                    "        return ((), 'Additional properties are not allowed ('"
+                    " + repr(key) + ' was unexpected)')",
+                ]
+            elif function != "_valid":
+                lines += [
+                    "for key, value in data.items():",
+                    f"    if key not in {known}:",
+                    f"        e = {function}(value)",
+                    "        if e is not None:",
+                    "            return ((key, *e[0]), e[1])",
+                ]
+        for key, dependency in schema.get("dependencies", {}).items():
+            if isinstance(dependency, list):
+                dependency = {"required": dependency}
+            lines += [
+                f"if {key!r} in data:",
+                *_indent(_check(f"{self.compile(dependency)}(data)")),
+            ]
+        if not lines:
+            return []
+        return ["if isinstance(data, dict):", *_indent(lines)]
+
+    def _applicators(self, schema: dict[str, Any]) -> list[str]:
+        lines = []
+        for subschema in schema.get("allOf", []):
+            lines += _check(f"{self.compile(subschema)}(data)")
+        if "anyOf" in schema:
+            functions = ", ".join(self.compile(s) for s in schema["anyOf"])
+            lines += [
+                "errors = []",
+                f"for f in ({functions},):",
+                "    e = f(data)",
+                "    if e is None:",
+                "        break",
+                "    errors.append(e)",
+                "else:",
+                "    return _no_match(data, errors)",
+            ]
+        if "oneOf" in schema:
+            lines += self._one_of(schema)
+        if "not" in schema:
+            lines += [
+                f"if {self.compile(schema['not'])}(data) is None:",
+                "    return ((), repr(data) + "
+                f"{' should not be valid under ' + json.dumps(schema['not'])!r})",
+            ]
+        if "if" in schema:
+            then = self.compile(schema.get("then", True))
+            otherwise = self.compile(schema.get("else", True))
+            lines += [
+                f"if {self.compile(schema['if'])}(data) is None:",
+                *_indent(_check(f"{then}(data)")),
+                "else:",
+                *_indent(_check(f"{otherwise}(data)")),
+            ]
+        return lines
+
+    def _one_of(self, schema: dict[str, Any]) -> list[str]:
+        functions = ", ".join(self.compile(s) for s in schema["oneOf"])
+        lines = [
+            "matches = 0",
+            "errors = []",
+            f"for f in ({functions},):",
+            "    e = f(data)",
+            "    if e is None:",
+            "        matches += 1",
+            "    else:",
+            "        errors.append(e)",
+            "if not matches:",
+            "    return _no_match(data, errors)",
+            "if matches > 1:",
+            "    return ((), repr(data) + ' is valid under each of several of the "
+            "given schemas')",
+        ]
+        tags = self._discriminator(schema)
+        if tags is None:
+            return lines
+        table = self._constant(
+            "d", "{" + ", ".join(f"{t!r}: {f}" for t, f in tags.items()) + "}"
+        )
+        prop = schema["discriminator"]["propertyName"]
+        # Every member restricts the tag, so only the member of the tag can match
+        message = f" is not one of {list(tags)!r}"
+        return [
+            f"if isinstance(data, dict) and {prop!r} in data:",
+            f"    tag = data[{prop!r}]",
+            f"    f = {table}.get(tag) if isinstance(tag, str) else None",
+            "    if f is None:",
+            f"        return (({prop!r},), repr(tag) + {message!r})",
+            *_indent(_check("f(data)")),
+            "else:",
+            *_indent(lines),
+        ]
+
+    def _discriminator(self, schema: dict[str, Any]) -> dict[str, str] | None:
+        """Maps the tags of a discriminated oneOf to the functions of its members.
+
+        Returns None if a member does not restrict the tag to constants, or if the
+        constants overlap, as validating only the member of a tag is then not the
+        same as validating the oneOf.
+        """
+        discriminator = schema.get("discriminator")
+        if not isinstance(discriminator, dict):
+            return None
+        prop = discriminator["propertyName"]
+        tags: dict[str, str] = {}
+        for member in schema["oneOf"]:
+            resolved = self._resolve(member["$ref"]) if "$ref" in member else member
+            tag_schema = resolved.get("properties", {}).get(prop, {})
+            if "const" in tag_schema:
+                values = [tag_schema["const"]]
+            elif "enum" in tag_schema:
+                values = tag_schema["enum"]
+            else:
+                return None
+            for value in values:
+                if not isinstance(value, str) or value in tags:
+                    return None
+                tags[value] = self.compile(member)
+        return tags
+
+
+def _count(schema: dict[str, Any], keyword: str) -> int:
+    """Returns the value of a keyword that must be a non-negative integer."""
+    value = schema[keyword]
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"'{keyword}' must be a non-negative integer, got {value!r}")
+    return value
+
+
+def _limit(schema: dict[str, Any], keyword: str) -> int | float:
+    """Returns the value of a keyword that must be a finite number."""
+    value = schema[keyword]
+    if (
+        not isinstance(value, int | float)
+        or isinstance(value, bool)
+        or not math.isfinite(value)
+    ):
+        raise ValueError(f"'{keyword}' must be a finite number, got {value!r}")
+    return value
+
+
+def _indent(lines: list[str]) -> list[str]:
+    return [f"    {line}" for line in lines]
+
+
+def _check(call: str) -> list[str]:
+    return ["e = " + call, "if e is not None:", "    return e"]
+
+
+def generate_source(schema: Mapping[str, Any]) -> str:
+    """Returns the source of a module validating instances of a JSON schema.
+
+    Args:
+        schema: The JSON schema, i.e. as dumped by a :class:`SchemaBase`.
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword or a non-local
+            reference.
+    """
+    compiler = _Compiler(schema)
+    root = compiler.compile(dict(schema))
+    return (
+        "\n\n\n".join(
+            [
+                _HEADER.format(
+                    id=repr(schema.get("$id", schema.get("title"))), root=root
+                ),
+                *compiler.functions,
+                "\n".join(compiler.constants),
+            ]
+        ).rstrip()
+        + "\n"
+    )
+
+
+def compile_schema(schema: Mapping[str, Any]) -> CompiledSchema:
+    """Compiles a JSON schema into a validator.
+
+    Args:
+        schema: The JSON schema, i.e. as dumped by a :class:`SchemaBase`.
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword or a non-local
+            reference.
+    """
+    source = generate_source(schema)
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<{schema.get('$id', 'schema')}>", "exec"), namespace)
+    return CompiledSchema(source=source, first_error=namespace["first_error"])
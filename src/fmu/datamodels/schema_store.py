@@ -0,0 +1,203 @@
+"""Offline access to the published JSON schemas.
+
+The ``$id`` of every schema points at the schema server, i.e.
+``https://main-fmu-schemas-prod.radix.equinor.com/schemas/0.25.0/fmu_results.json``.
+A :class:`SchemaStore` resolves these URLs, of either the dev or prod server, to the
+schema files on the local filesystem. This lets JSON schema validators run without
+network access.
+
+The schemas are looked up, in order, in:
+
+1. The directory given by the ``FMU_SCHEMAS_DIR`` environment variable.
+2. The schemas installed with this package.
+3. The ``schemas/`` directory of a checkout of this repository.
+
+Example:
+    >>> from fmu.datamodels import FmuResultsSchema
+    >>> from fmu.datamodels.schema_store import resolve
+    >>> schema = resolve(FmuResultsSchema.url())
+
+    With the ``jsonschema`` and ``referencing`` packages, references are resolved
+    from the store rather than fetched:
+
+    >>> registry = referencing.Registry(
+    ...     retrieve=lambda url: referencing.Resource.from_contents(resolve(url))
+    ... )
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from pathlib import Path
+from typing import Any, Final
+
+from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, freeze_schema
+from fmu.datamodels._schema_urls import FmuSchemaUrls
+from fmu.datamodels.schema_compiler import CompiledSchema, compile_schema
+
+SCHEMAS_DIR_ENV: Final[str] = "FMU_SCHEMAS_DIR"
+"""The environment variable giving a directory of schemas to use."""
+
+PACKAGE_SCHEMAS_DIR: Final[Path] = Path(__file__).parent / "_schemas"
+"""The schemas installed as package data."""
+
+CHECKOUT_SCHEMAS_DIR: Final[Path] = Path(__file__).parents[3] / FMU_SCHEMAS_PATH
+"""The schemas of a checkout of this repository."""
+
+
+def find_schemas_dir() -> Path:
+    """Returns the directory of the local schemas, as described in the module
+    documentation.
+
+    Raises:
+        FileNotFoundError: If ``FMU_SCHEMAS_DIR`` is set to a path that is not a
+            directory, or if no schemas are found.
+    """
+    if env_dir := os.environ.get(SCHEMAS_DIR_ENV):
+        path = Path(env_dir)
+        if not path.is_dir():
+            raise FileNotFoundError(
+                f"{SCHEMAS_DIR_ENV} is set to '{env_dir}', which is not a directory"
+            )
+        return path
+    for path in (PACKAGE_SCHEMAS_DIR, CHECKOUT_SCHEMAS_DIR):
+        if path.is_dir():
+            return path
+    raise FileNotFoundError(
+        "No local schemas found. Set the "
+        f"{SCHEMAS_DIR_ENV} environment variable to a directory of schemas."
+    )
+
+
+class SchemaStore:
+    """A read-only store of schemas on the local filesystem.
+
+    The directory has the layout of ``schemas/`` on the schema server, i.e.
+    ``0.25.0/fmu_results.json``. The parsed schemas are cached.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Args:
+            root: The directory of schemas.
+        """
+        self.root = root
+        self._cache: dict[str, dict[str, Any]] = {}
+        self._compiled: dict[str, CompiledSchema] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.root)!r})"
+
+    def paths(self) -> list[Path]:
+        """Returns the paths of all schemas relative to the schema server, i.e.
+        ``schemas/0.25.0/fmu_results.json``."""
+        return sorted(
+            FMU_SCHEMAS_PATH / path.relative_to(self.root)
+            for path in self.root.rglob("*.json")
+        )
+
+    def urls(self) -> dict[str, Path]:
+        """Maps the dev and prod URLs of all schemas to their local files."""
+        return {
+            f"{base}/{path.as_posix()}": self.root.joinpath(*path.parts[1:])
+            for path in self.paths()
+            for base in (FmuSchemaUrls.DEV_URL, FmuSchemaUrls.PROD_URL)
+        }
+
+    def path(self, url: str) -> Path:
+        """Returns the local file of a schema URL.
+
+        Args:
+            url: The URL of a schema on the dev or prod schema server.
+
+        Raises:
+            ValueError: If the URL is not on a schema server, or its path leads
+                out of the store, i.e. with ``..``.
+            FileNotFoundError: If the schema is not in the store.
+        """
+        for base in (FmuSchemaUrls.DEV_URL, FmuSchemaUrls.PROD_URL):
+            prefix = f"{base}/{FMU_SCHEMAS_PATH}/"
+            if url.startswith(prefix):
+                path = self.root / url.removeprefix(prefix).split("#")[0]
+                if not path.resolve().is_relative_to(self.root.resolve()):
+                    raise ValueError(f"Schema '{url}' is outside of {self}")
+                if not path.is_file():
+                    raise FileNotFoundError(f"Schema '{url}' not found in {self}")
+                return path
+        raise ValueError(
+            f"'{url}' is not a schema URL, expected one starting with "
+            f"'{FmuSchemaUrls.DEV_URL}' or '{FmuSchemaUrls.PROD_URL}'"
+        )
+
+    def read_bytes(self, url: str) -> bytes:
+        """Returns the raw JSON of a schema as served from its URL.
+
+        The schemas are stored with dev URLs. As on the prod schema server, these
+        are replaced with prod URLs when a prod URL is read.
+
+        Args:
+            url: The URL of a schema on the dev or prod schema server.
+
+        Raises:
+            ValueError: If the URL is not on a schema server.
+            FileNotFoundError: If the schema is not in the store.
+        """
+        data = self.path(url).read_bytes()
+        if url.startswith(FmuSchemaUrls.PROD_URL):
+            data = data.replace(
+                FmuSchemaUrls.DEV_URL.encode(), FmuSchemaUrls.PROD_URL.encode()
+            )
+        return data
+
+    def resolve(self, url: str) -> dict[str, Any]:
+        """Returns the schema of a URL.
+
+        The schema is cached and immutable. Use ``copy.deepcopy()`` to get a
+        mutable copy.
+
+        Args:
+            url: The URL of a schema on the dev or prod schema server. A fragment,
+                i.e. ``#/$defs/Data``, is ignored.
+
+        Raises:
+            ValueError: If the URL is not on a schema server.
+            FileNotFoundError: If the schema is not in the store.
+        """
+        url = url.split("#")[0]
+        if url not in self._cache:
+            self._cache[url] = freeze_schema(json.loads(self.read_bytes(url)))
+        return self._cache[url]
+
+    def compile(self, url: str) -> CompiledSchema:
+        """Returns a validator compiled from the schema of a URL.
+
+        The validator is compiled once and cached. See
+        :mod:`fmu.datamodels.schema_compiler`.
+
+        Args:
+            url: The URL of a schema on the dev or prod schema server.
+
+        Raises:
+            ValueError: If the URL is not on a schema server.
+            FileNotFoundError: If the schema is not in the store.
+        """
+        url = url.split("#")[0]
+        if url not in self._compiled:
+            self._compiled[url] = compile_schema(self.resolve(url))
+        return self._compiled[url]
+
+
+@functools.cache
+def default_store() -> SchemaStore:
+    """Returns the store of the schemas found by :func:`find_schemas_dir`."""
+    return SchemaStore(find_schemas_dir())
+
+
+def resolve(url: str) -> dict[str, Any]:
+    """Returns the schema of a URL from the default store.
+
+    See :meth:`SchemaStore.resolve`.
+    """
+    return default_store().resolve(url)
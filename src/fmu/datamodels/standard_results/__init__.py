@@ -1,57 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fmu.datamodels import _lazy
+
 from .enums import StandardResultName
-from .ert_observations_breakthrough import (
-    ErtObservationsBreakthroughResult,
-    ErtObservationsBreakthroughSchema,
-)
-from .ert_observations_rft import (
-    ErtObservationsRftResult,
-    ErtObservationsRftSchema,
-)
-from .ert_observations_summary import (
-    ErtObservationsSummaryResult,
-    ErtObservationsSummarySchema,
-)
-from .ert_parameters import (
-    ErtDistribution,
-    ErtParameterMetadata,
-    ErtParametersResult,
-    ErtParametersSchema,
-)
-from .field_outline import FieldOutlineResult, FieldOutlineSchema
-from .fluid_contact_outline import FluidContactOutlineResult, FluidContactOutlineSchema
-from .inplace_volumes import InplaceVolumesResult, InplaceVolumesSchema
-from .simulator_fipregions_mapping import (
-    SimulatorFipregionsMappingResult,
-    SimulatorFipregionsMappingSchema,
-)
-from .stratigraphy_mapping import StratigraphyMappingResult, StratigraphyMappingSchema
-from .structure_depth_fault_lines import (
-    StructureDepthFaultLinesResult,
-    StructureDepthFaultLinesSchema,
-)
 
-__all__ = [
-    "ErtDistribution",
-    "ErtObservationsRftResult",
-    "ErtObservationsRftSchema",
-    "ErtObservationsSummaryResult",
-    "ErtObservationsSummarySchema",
-    "ErtObservationsBreakthroughResult",
-    "ErtObservationsBreakthroughSchema",
-    "ErtParameterMetadata",
-    "ErtParametersResult",
-    "ErtParametersSchema",
-    "FieldOutlineResult",
-    "FieldOutlineSchema",
-    "InplaceVolumesResult",
-    "InplaceVolumesSchema",
-    "SimulatorFipregionsMappingResult",
-    "SimulatorFipregionsMappingSchema",
-    "StratigraphyMappingResult",
-    "StratigraphyMappingSchema",
-    "StructureDepthFaultLinesSchema",
-    "StructureDepthFaultLinesResult",
-    "FluidContactOutlineSchema",
-    "FluidContactOutlineResult",
-    "StandardResultName",
-]
+if TYPE_CHECKING:
+    # Explicit re-exports, as __all__ is derived from _LAZY_EXPORTS below
+    from .ert_observations_breakthrough import (
+        ErtObservationsBreakthroughResult as ErtObservationsBreakthroughResult,
+        ErtObservationsBreakthroughSchema as ErtObservationsBreakthroughSchema,
+    )
+    from .ert_observations_rft import (
+        ErtObservationsRftResult as ErtObservationsRftResult,
+        ErtObservationsRftSchema as ErtObservationsRftSchema,
+    )
+    from .ert_observations_summary import (
+        ErtObservationsSummaryResult as ErtObservationsSummaryResult,
+        ErtObservationsSummarySchema as ErtObservationsSummarySchema,
+    )
+    from .ert_parameters import (
+        ErtDistribution as ErtDistribution,
+        ErtParameterMetadata as ErtParameterMetadata,
+        ErtParametersResult as ErtParametersResult,
+        ErtParametersSchema as ErtParametersSchema,
+    )
+    from .field_outline import (
+        FieldOutlineResult as FieldOutlineResult,
+        FieldOutlineSchema as FieldOutlineSchema,
+    )
+    from .fluid_contact_outline import (
+        FluidContactOutlineResult as FluidContactOutlineResult,
+        FluidContactOutlineSchema as FluidContactOutlineSchema,
+    )
+    from .inplace_volumes import (
+        InplaceVolumesResult as InplaceVolumesResult,
+        InplaceVolumesSchema as InplaceVolumesSchema,
+    )
+    from .simulator_fipregions_mapping import (
+        SimulatorFipregionsMappingResult as SimulatorFipregionsMappingResult,
+        SimulatorFipregionsMappingSchema as SimulatorFipregionsMappingSchema,
+    )
+    from .stratigraphy_mapping import (
+        StratigraphyMappingResult as StratigraphyMappingResult,
+        StratigraphyMappingSchema as StratigraphyMappingSchema,
+    )
+    from .structure_depth_fault_lines import (
+        StructureDepthFaultLinesResult as StructureDepthFaultLinesResult,
+        StructureDepthFaultLinesSchema as StructureDepthFaultLinesSchema,
+    )
+
+# The standard results are imported on first access, so that e.g. the enums can be
+# used without building the core schemas of all standard results.
+_LAZY_EXPORTS = {
+    "ErtObservationsBreakthroughResult": ".ert_observations_breakthrough",
+    "ErtObservationsBreakthroughSchema": ".ert_observations_breakthrough",
+    "ErtObservationsRftResult": ".ert_observations_rft",
+    "ErtObservationsRftSchema": ".ert_observations_rft",
+    "ErtObservationsSummaryResult": ".ert_observations_summary",
+    "ErtObservationsSummarySchema": ".ert_observations_summary",
+    "ErtDistribution": ".ert_parameters",
+    "ErtParameterMetadata": ".ert_parameters",
+    "ErtParametersResult": ".ert_parameters",
+    "ErtParametersSchema": ".ert_parameters",
+    "FieldOutlineResult": ".field_outline",
+    "FieldOutlineSchema": ".field_outline",
+    "FluidContactOutlineResult": ".fluid_contact_outline",
+    "FluidContactOutlineSchema": ".fluid_contact_outline",
+    "InplaceVolumesResult": ".inplace_volumes",
+    "InplaceVolumesSchema": ".inplace_volumes",
+    "SimulatorFipregionsMappingResult": ".simulator_fipregions_mapping",
+    "SimulatorFipregionsMappingSchema": ".simulator_fipregions_mapping",
+    "StratigraphyMappingResult": ".stratigraphy_mapping",
+    "StratigraphyMappingSchema": ".stratigraphy_mapping",
+    "StructureDepthFaultLinesResult": ".structure_depth_fault_lines",
+    "StructureDepthFaultLinesSchema": ".structure_depth_fault_lines",
+}
+
+__all__ = [*_LAZY_EXPORTS, "StandardResultName"]
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,655 @@
+"""Columnar validation of standard result tables.
+
+The ``*Result`` root models validate a table one row at a time, which requires
+converting every row into a dictionary first. The functions in this module validate
+the columns of a table as a whole using Arrow compute kernels instead.
+
+The checks are derived from the fields of a ``*ResultRow`` model and its ``Field``
+constraints, so there is no separate validator to maintain for each table. They are
+compiled once per model into a :class:`ValidationPlan`.
+
+This module requires ``pyarrow``, installed with the ``arrow`` extra:
+
+    $ pip install fmu-datamodels[arrow]
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import types
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum, StrEnum
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+from uuid import UUID
+
+import annotated_types
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+
+from fmu.datamodels.standard_results.enums import InplaceVolumes
+from fmu.datamodels.standard_results.inplace_volumes import InplaceVolumesResult
+
+if TYPE_CHECKING:
+    from fmu.datamodels.fmu_results.attribute_specification import (
+        AttributeSpecification,
+    )
+
+BoundType = Literal[
+    "greater_than_equal", "greater_than", "less_than_equal", "less_than"
+]
+
+_UUID_PATTERN = (
+    r"^\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{12}\}?$"
+)
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+_TIMESTAMP_TYPES = (pa.timestamp("us"), pa.timestamp("us", tz="UTC"))
+"""The types strings are cast to, without and with a time zone offset."""
+
+_BOUND_SYMBOLS: dict[str, str] = {
+    "greater_than_equal": ">=",
+    "greater_than": ">",
+    "less_than_equal": "<=",
+    "less_than": "<",
+}
+
+_BOUND_KERNELS: dict[str, Callable[..., Any]] = {
+    "greater_than_equal": pc.greater_equal,
+    "greater_than": pc.greater,
+    "less_than_equal": pc.less_equal,
+    "less_than": pc.less,
+}
+
+_BOUND_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "greater_than_equal": operator.ge,
+    "greater_than": operator.gt,
+    "less_than_equal": operator.le,
+    "less_than": operator.lt,
+}
+
+
+_BOUND_CONSTRAINTS: dict[type, tuple[str, BoundType]] = {
+    annotated_types.Ge: ("ge", "greater_than_equal"),
+    annotated_types.Gt: ("gt", "greater_than"),
+    annotated_types.Le: ("le", "less_than_equal"),
+    annotated_types.Lt: ("lt", "less_than"),
+}
+
+
+class ColumnKind(StrEnum):
+    """The kind of values a column holds, derived from the field annotation."""
+
+    string = "string"
+    number = "number"
+    integer = "integer"
+    boolean = "boolean"
+    datetime = "datetime"
+    uuid = "uuid"
+
+
+_ARROW_TYPES: dict[ColumnKind, pa.DataType] = {
+    ColumnKind.string: pa.string(),
+    ColumnKind.number: pa.float64(),
+    ColumnKind.integer: pa.int64(),
+    ColumnKind.boolean: pa.bool_(),
+    ColumnKind.datetime: pa.timestamp("us"),
+    ColumnKind.uuid: pa.string(),
+}
+
+_DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+@dataclass(frozen=True)
+class Bound:
+    """A numeric bound on the values in a column, i.e. from ``Field(ge=0.0)``."""
+
+    type: BoundType
+    """The kind of bound, named like the Pydantic error raised when violated."""
+
+    value: float
+    """The value of the bound."""
+
+    @property
+    def symbol(self) -> str:
+        """The comparison operator a valid value satisfies."""
+        return _BOUND_SYMBOLS[self.type]
+
+    def is_satisfied(self, column: Any) -> Any:
+        """Returns a boolean mask of the values satisfying this bound."""
+        return _BOUND_KERNELS[self.type](column, pa.scalar(self.value))
+
+    def is_satisfied_by_range(self, minimum: Any, maximum: Any) -> bool:
+        """Returns True if every value from minimum to maximum satisfies this bound,
+        i.e. the range of a column given by its Parquet statistics."""
+        value = maximum if self.type.startswith("less") else minimum
+        return bool(_BOUND_OPERATORS[self.type](value, self.value))
+
+
+@dataclass(frozen=True)
+class ColumnError:
+    """A validation error for a single column of a table."""
+
+    column: str
+    """The name of the column that failed validation."""
+
+    type: str
+    """The kind of error, i.e. 'missing', 'dtype', 'null', 'enum', or the name of the
+    violated bound like 'greater_than_equal'."""
+
+    message: str
+    """A human readable description of the error."""
+
+    rows: pa.Array = field(default_factory=lambda: pa.array([], type=pa.uint64()))
+    """The indices of the rows failing validation. Empty for errors concerning the
+    column as a whole, like a missing column or a wrong dtype."""
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows failing validation."""
+        return len(self.rows)
+
+
+@dataclass
+class ColumnarValidationReport:
+    """The result of validating a table column by column."""
+
+    num_rows: int
+    """The number of rows in the validated table."""
+
+    errors: list[ColumnError] = field(default_factory=list)
+    """All errors found in the table."""
+
+    offset: int = 0
+    """The index of the first row of the table, if it is a batch of a larger
+    table. Row indices in the errors are relative to the larger table."""
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no errors were found."""
+        return not self.errors
+
+
+@dataclass(frozen=True)
+class ColumnCheck:
+    """The checks applied to a single column."""
+
+    name: str
+    """The name of the column."""
+
+    kind: ColumnKind
+    """The kind of values the column must hold."""
+
+    required: bool
+    """If True, the column must be present in the table."""
+
+    nullable: bool
+    """If True, the column may contain null values."""
+
+    values: tuple[str, ...] | None = None
+    """The allowed values of the column, if it is an enumeration."""
+
+    bounds: tuple[Bound, ...] = ()
+    """The numeric bounds on the values of the column."""
+
+    def accepts_dtype(self, dtype: pa.DataType) -> bool:
+        """Returns True if a column with this Arrow dtype can hold valid values.
+
+        Integer columns must have an integer dtype, even though Pydantic accepts
+        floats without a fractional part."""
+        if pa.types.is_null(dtype):
+            return True
+        if pa.types.is_dictionary(dtype):
+            return self.accepts_dtype(dtype.value_type)
+        if self.kind == ColumnKind.string:
+            return _is_string(dtype)
+        if self.kind == ColumnKind.number:
+            return pa.types.is_floating(dtype) or pa.types.is_integer(dtype)
+        if self.kind == ColumnKind.integer:
+            return pa.types.is_integer(dtype)
+        if self.kind == ColumnKind.boolean:
+            return pa.types.is_boolean(dtype)
+        if self.kind == ColumnKind.datetime:
+            return (
+                pa.types.is_timestamp(dtype)
+                or pa.types.is_date(dtype)
+                or _is_string(dtype)
+            )
+        return _is_string(dtype) or (
+            pa.types.is_fixed_size_binary(dtype) and dtype.byte_width == 16
+        )
+
+    def arrow_field(self, dictionary: bool = False) -> pa.Field:
+        """Returns the Arrow field of this column.
+
+        Args:
+            dictionary: If True, a string column is dictionary encoded. Columns of
+                enumerations are always dictionary encoded.
+        """
+        dtype = _ARROW_TYPES[self.kind]
+        if self.kind == ColumnKind.string and (dictionary or self.values is not None):
+            dtype = _DICTIONARY_TYPE
+        return pa.field(self.name, dtype, nullable=self.nullable)
+
+    def check_dtype(self, dtype: pa.DataType) -> ColumnError | None:
+        """Returns an error if a column with this Arrow dtype cannot hold valid
+        values, or else None. See :meth:`accepts_dtype`."""
+        if self.accepts_dtype(dtype):
+            return None
+        return ColumnError(
+            self.name,
+            "dtype",
+            f"Column '{self.name}' has dtype '{dtype}', expected {self.kind}",
+        )
+
+    def validate(self, column: pa.ChunkedArray) -> list[ColumnError]:
+        """Validates the values of a column present in a table."""
+        if error := self.check_dtype(column.type):
+            return [error]
+
+        errors = []
+        if not self.nullable and column.null_count > 0:
+            errors.append(
+                ColumnError(
+                    self.name,
+                    "null",
+                    f"Column '{self.name}' is required but contains null values",
+                    pc.indices_nonzero(pc.is_null(column)),
+                )
+            )
+        if pa.types.is_null(column.type):
+            return errors
+
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+
+        if self.values is not None:
+            value_set = pa.array(self.values)
+            rows = _row_indices(pc.invert(pc.is_in(column, value_set=value_set)))
+            if rows is not None:
+                errors.append(
+                    ColumnError(
+                        self.name,
+                        "enum",
+                        f"Column '{self.name}' contains values other than "
+                        f"{list(self.values)}",
+                        rows,
+                    )
+                )
+
+        if self.kind == ColumnKind.uuid and _is_string(column.type):
+            rows = _row_indices(
+                pc.invert(pc.match_substring_regex(column, _UUID_PATTERN))
+            )
+            if rows is not None:
+                errors.append(
+                    ColumnError(
+                        self.name,
+                        "uuid_parsing",
+                        f"Column '{self.name}' contains values that are not UUIDs",
+                        rows,
+                    )
+                )
+
+        if self.kind == ColumnKind.datetime and _is_string(column.type):
+            rows = _invalid_datetimes(column)
+            if rows is not None:
+                errors.append(
+                    ColumnError(
+                        self.name,
+                        "datetime_parsing",
+                        f"Column '{self.name}' contains values that are not datetimes",
+                        rows,
+                    )
+                )
+
+        for bound in self.bounds:
+            rows = _row_indices(pc.invert(bound.is_satisfied(column)))
+            if rows is not None:
+                errors.append(
+                    ColumnError(
+                        self.name,
+                        bound.type,
+                        f"Column '{self.name}' contains values not "
+                        f"{bound.symbol} {bound.value}",
+                        rows,
+                    )
+                )
+        return errors
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """The columnar checks compiled from a row model. See :func:`compile_plan`."""
+
+    model: type[BaseModel]
+    """The row model the checks are derived from."""
+
+    columns: tuple[ColumnCheck, ...]
+    """The checks for each column, in the order of the model fields."""
+
+    is_complete: bool
+    """False if the row model has field or model validators. These contain
+    arbitrary Python code and are not part of the columnar checks."""
+
+    def column(self, name: str) -> ColumnCheck:
+        """Returns the checks for the column with the given name."""
+        for check in self.columns:
+            if check.name == name:
+                return check
+        raise KeyError(f"No column '{name}' in {self.model.__name__}")
+
+    def validate(
+        self,
+        data: pa.Table | pa.RecordBatch | Mapping[str, Any],
+        required_columns: Sequence[str] | None = None,
+    ) -> ColumnarValidationReport:
+        """Validates a table against this plan.
+
+        Args:
+            data: The table to validate. See :func:`to_arrow_table`.
+            required_columns: Columns that must be present in addition to those
+                required by the row model.
+
+        Returns:
+            A report containing all errors found in the table.
+        """
+        table = to_arrow_table(data)
+        report = ColumnarValidationReport(num_rows=table.num_rows)
+        report.errors = self._missing(table.column_names, required_columns)
+        for check in self.columns:
+            if check.name in table.column_names:
+                report.errors.extend(check.validate(table.column(check.name)))
+        return report
+
+    def check_schema(
+        self, schema: pa.Schema, required_columns: Sequence[str] | None = None
+    ) -> list[ColumnError]:
+        """Checks the columns of a table from its schema alone.
+
+        Only missing columns and columns of the wrong dtype are found, as no values
+        are read.
+
+        Args:
+            schema: The Arrow schema of the table.
+            required_columns: Columns that must be present in addition to those
+                required by the row model.
+
+        Returns:
+            The errors found.
+        """
+        errors = self._missing(schema.names, required_columns)
+        for check in self.columns:
+            if check.name in schema.names and (
+                error := check.check_dtype(schema.field(check.name).type)
+            ):
+                errors.append(error)
+        return errors
+
+    def _missing(
+        self, names: Sequence[str], required_columns: Sequence[str] | None
+    ) -> list[ColumnError]:
+        required = [c.name for c in self.columns if c.required]
+        required += [name for name in required_columns or () if name not in required]
+        return missing_columns(names, required)
+
+
+def missing_columns(names: Sequence[str], required: Sequence[str]) -> list[ColumnError]:
+    """Returns an error for each required column not among the column names."""
+    present = set(names)
+    return [
+        ColumnError(name, "missing", f"Required column '{name}' is missing")
+        for name in required
+        if name not in present
+    ]
+
+
+def attribute_bounds(specification: AttributeSpecification) -> tuple[Bound, ...]:
+    """Returns the bounds of the values of a property from its attribute
+    specification, i.e. ``>= 0`` and ``<= 1`` for porosity."""
+    bounds = []
+    if specification.min_value is not None:
+        bounds.append(Bound("greater_than_equal", float(specification.min_value)))
+    if specification.max_value is not None:
+        bounds.append(Bound("less_than_equal", float(specification.max_value)))
+    return tuple(bounds)
+
+
+def to_arrow_table(data: pa.Table | pa.RecordBatch | Mapping[str, Any]) -> pa.Table:
+    """Returns the given data as an Arrow table.
+
+    Args:
+        data: An Arrow table or record batch, or a mapping of column names to
+            array-likes such as NumPy arrays.
+    """
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    return pa.table(dict(data))
+
+
+def _is_string(dtype: pa.DataType) -> bool:
+    if pa.types.is_dictionary(dtype):
+        return _is_string(dtype.value_type)
+    return (
+        pa.types.is_string(dtype)
+        or pa.types.is_large_string(dtype)
+        or pa.types.is_string_view(dtype)
+    )
+
+
+def _row_indices(mask: Any) -> pa.Array | None:
+    """Returns the indices of the rows set in a boolean mask, or None if there are
+    none. Null entries in the mask are not considered set."""
+    mask = pc.fill_null(mask, False)
+    if not pc.any(mask).as_py():
+        return None
+    return pc.indices_nonzero(mask)
+
+
+def _is_datetime(value: object) -> bool:
+    try:
+        _DATETIME_ADAPTER.validate_python(value)
+    except ValidationError:
+        return False
+    return True
+
+
+def _invalid_datetimes(column: pa.ChunkedArray) -> pa.Array | None:
+    """Returns the indices of the strings that are not datetimes, or None if there
+    are none.
+
+    The strings are cast to timestamps, which parses ISO 8601 in Arrow. Only if the
+    cast fails are the distinct strings parsed one by one by Pydantic, so that the
+    rows found are those failing row validation, which also accepts e.g. Unix
+    times."""
+    for dtype in _TIMESTAMP_TYPES:
+        try:
+            pc.cast(column, dtype)
+        except pa.ArrowInvalid:
+            continue
+        return None
+    invalid = [
+        value
+        for value in pc.unique(column).drop_null().to_pylist()
+        if not _is_datetime(value)
+    ]
+    if not invalid:
+        return None
+    return pc.indices_nonzero(pc.is_in(column, value_set=pa.array(invalid)))
+
+
+def _row_model(model: type[BaseModel]) -> type[BaseModel]:
+    """Returns the row model of a ``*Result`` root model holding a list of rows."""
+    if not issubclass(model, RootModel):
+        return model
+    annotation = model.model_fields["root"].annotation
+    args = get_args(annotation)
+    if get_origin(annotation) is not list or not (
+        isinstance(args[0], type) and issubclass(args[0], BaseModel)
+    ):
+        raise TypeError(f"{model.__name__} is not a list of rows")
+    return args[0]
+
+
+def _bounds(metadata: list[Any]) -> tuple[Bound, ...]:
+    bounds = []
+    for constraint in metadata:
+        for constraint_type, (attr, bound_type) in _BOUND_CONSTRAINTS.items():
+            if isinstance(constraint, constraint_type):
+                bounds.append(Bound(bound_type, float(getattr(constraint, attr))))
+    return tuple(bounds)
+
+
+def _column_check(
+    name: str, annotation: Any, metadata: list[Any], required: bool
+) -> ColumnCheck:
+    nullable = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        nullable = len(args) < len(get_args(annotation))
+        if len(args) != 1:
+            raise TypeError(f"Column '{name}' has unsupported type {annotation}")
+        annotation = args[0]
+
+    values: tuple[str, ...] | None = None
+    if get_origin(annotation) is Literal:
+        values = tuple(str(arg) for arg in get_args(annotation))
+        kind = ColumnKind.string
+    elif isinstance(annotation, type) and issubclass(annotation, Enum):
+        values = tuple(str(member.value) for member in annotation)
+        kind = ColumnKind.string
+    elif annotation is str:
+        kind = ColumnKind.string
+    elif annotation is bool:
+        kind = ColumnKind.boolean
+    elif annotation is int:
+        kind = ColumnKind.integer
+    elif annotation is float:
+        kind = ColumnKind.number
+    elif annotation in (datetime, date):
+        kind = ColumnKind.datetime
+    elif annotation is UUID:
+        kind = ColumnKind.uuid
+    else:
+        raise TypeError(f"Column '{name}' has unsupported type {annotation}")
+
+    return ColumnCheck(
+        name=name,
+        kind=kind,
+        required=required,
+        nullable=nullable,
+        values=values,
+        bounds=_bounds(metadata),
+    )
+
+
+@functools.cache
+def compile_plan(model: type[BaseModel]) -> ValidationPlan:
+    """Compiles the columnar checks for a row model.
+
+    The checks are derived from the field annotations and their ``Field``
+    constraints. Optional fields become nullable columns, enumerations and literals
+    restrict the values of a column, and ``ge``, ``gt``, ``le`` and ``lt`` become
+    bounds. Plans are cached per model.
+
+    Args:
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows.
+
+    Returns:
+        The compiled plan.
+    """
+    row = _row_model(model)
+    columns = tuple(
+        _column_check(
+            field_info.alias or field_name,
+            field_info.annotation,
+            field_info.metadata,
+            field_info.is_required(),
+        )
+        for field_name, field_info in row.model_fields.items()
+    )
+    decorators = row.__pydantic_decorators__
+    return ValidationPlan(
+        model=row,
+        columns=columns,
+        is_complete=not (decorators.field_validators or decorators.model_validators),
+    )
+
+
+@functools.cache
+def arrow_schema(
+    model: type[BaseModel], index_columns: tuple[str, ...] = ()
+) -> pa.Schema:
+    """Derives the Arrow schema of a standard result table from its row model.
+
+    Columns are in the order of the model fields. Required columns are not
+    nullable, numbers are ``float64``, integers ``int64`` and datetimes
+    ``timestamp[us]``. String index columns and columns of enumerations are
+    dictionary encoded. Schemas are cached per model.
+
+    Writers can use the schema to write typed Parquet files without inferring the
+    types from the data, and readers to check the schema of a file.
+
+    Args:
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows.
+        index_columns: The index columns of the table, i.e.
+            ``InplaceVolumes.index_columns()``.
+
+    Returns:
+        The Arrow schema.
+    """
+    return pa.schema(
+        check.arrow_field(dictionary=check.name in index_columns)
+        for check in compile_plan(model).columns
+    )
+
+
+def validate_table(
+    model: type[BaseModel],
+    data: pa.Table | pa.RecordBatch | Mapping[str, Any],
+    required_columns: Sequence[str] | None = None,
+) -> ColumnarValidationReport:
+    """Validates a table against a standard result without creating a model per row.
+
+    Field and model validators on the row model are not applied, see
+    :attr:`ValidationPlan.is_complete`.
+
+    Args:
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows, i.e. :class:`FieldOutlineResult`.
+        data: The table to validate. See :func:`to_arrow_table`.
+        required_columns: Columns that must be present in addition to those
+            required by the row model.
+
+    Returns:
+        A report containing all errors found in the table.
+    """
+    return compile_plan(model).validate(data, required_columns)
+
+
+def validate_inplace_volumes_table(
+    data: pa.Table | pa.RecordBatch | Mapping[str, Any],
+) -> ColumnarValidationReport:
+    """Validates an inplace volumes table without creating a model per row.
+
+    In addition to the checks derived from the row model, all columns in
+    ``InplaceVolumes.required_columns()`` must be present.
+
+    Args:
+        data: The inplace volumes table. See :func:`to_arrow_table`.
+
+    Returns:
+        A report containing all errors found in the table.
+    """
+    return validate_table(
+        InplaceVolumesResult, data, required_columns=InplaceVolumes.required_columns()
+    )
@@ -0,0 +1,463 @@
+"""Vectorized prior distributions of Ert parameters.
+
+The metadata models of :mod:`.ert_parameters` describe the prior distribution of
+each parameter of an Ert parameters table. This module evaluates the distributions
+of all parameters of a table at once, so that the priors of thousands of parameters
+and realizations are sampled and evaluated without looping over the values.
+
+Like Ert, parameters are sampled as standard normal scores, which are transformed
+to the values of their distributions. :meth:`ParameterDistributions.transform` is
+the transform Ert applies to the scores.
+
+This module requires ``numpy`` and ``scipy``, installed with the ``distributions``
+extra:
+
+    $ pip install fmu-datamodels[distributions]
+
+Example:
+    >>> result = ErtParametersResult.from_pa_schema(pq.read_schema(path))
+    >>> distributions = ParameterDistributions.from_result(result)
+    >>> values = distributions.sample(100, rng=1234)
+    >>> values.shape
+    (100, 2000)
+    >>> densities = distributions.pdf(values)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Literal, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy import special, stats
+
+from fmu.datamodels.standard_results.ert_parameters import (
+    ErtDistribution,
+    ErtParameterMetadata,
+    ErtParametersResult,
+)
+
+_Args = dict[str, NDArray[np.float64]]
+"""The arguments of the parameters of a distribution, like their 'min', as arrays
+broadcast against the last axis of the values."""
+
+_Values = NDArray[np.float64]
+
+_TOLERANCE = 1e-9
+"""The tolerance when finding the step of a value of a discrete distribution."""
+
+_METADATA_FIELDS = {"group", "input_source", "distribution"}
+
+
+class _Distribution(ABC):
+    """The vectorized functions of a distribution."""
+
+    @staticmethod
+    @abstractmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        """Transforms standard normal scores to values of the distribution."""
+
+    @staticmethod
+    @abstractmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        """Returns the cumulative distribution function of values."""
+
+    @staticmethod
+    @abstractmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        """Returns the probability density of values, or the probability mass of
+        discrete distributions."""
+
+
+class _Uniform(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return args["min"] + special.ndtr(z) * (args["max"] - args["min"])
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.uniform.cdf(x, args["min"], args["max"] - args["min"])
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.uniform.pdf(x, args["min"], args["max"] - args["min"])
+
+
+class _LogUnif(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        log_min, log_max = np.log(args["min"]), np.log(args["max"])
+        return np.exp(log_min + special.ndtr(z) * (log_max - log_min))
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.loguniform.cdf(x, args["min"], args["max"])
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.loguniform.pdf(x, args["min"], args["max"])
+
+
+class _Normal(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return args["mean"] + z * args["std"]
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return special.ndtr((x - args["mean"]) / args["std"])
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.norm.pdf(x, args["mean"], args["std"])
+
+
+class _LogNormal(_Distribution):
+    """The mean and standard deviation are those of the logarithm of the values."""
+
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return np.exp(args["mean"] + z * args["std"])
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.lognorm.cdf(x, args["std"], scale=np.exp(args["mean"]))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.lognorm.pdf(x, args["std"], scale=np.exp(args["mean"]))
+
+
+class _TruncatedNormal(_Distribution):
+    """Ert clips normal values to the bounds, so the bounds themselves have the
+    probability of the tails. The density excludes these."""
+
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return np.clip(args["mean"] + z * args["std"], args["min"], args["max"])
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        cdf = special.ndtr((x - args["mean"]) / args["std"])
+        return np.where(x < args["min"], 0.0, np.where(x >= args["max"], 1.0, cdf))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        inside = (x >= args["min"]) & (x <= args["max"])
+        return np.where(inside, stats.norm.pdf(x, args["mean"], args["std"]), 0.0)
+
+
+class _Raw(_Distribution):
+    """The values are the standard normal scores."""
+
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return z
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return special.ndtr(x)
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.norm.pdf(x)
+
+
+class _Const(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return np.broadcast_to(args["value"], z.shape)
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return np.where(x >= args["value"], 1.0, 0.0)
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return np.where(x == args["value"], 1.0, 0.0)
+
+
+def _position(args: _Args, x: _Values) -> _Values:
+    """Returns the position of values among the steps of a discrete distribution,
+    which has ``steps`` values evenly spaced from 'min' to 'max'."""
+    return (x - args["min"]) / (args["max"] - args["min"]) * (args["steps"] - 1)
+
+
+def _step_value(args: _Args, step: _Values) -> _Values:
+    """Returns the value of steps of a discrete distribution."""
+    return args["min"] + step / (args["steps"] - 1) * (args["max"] - args["min"])
+
+
+def _last_step(args: _Args, x: _Values) -> _Values:
+    """Returns the last step of a discrete distribution at or below values."""
+    return np.floor(_position(args, x) + _TOLERANCE)
+
+
+def _nearest_step(args: _Args, x: _Values) -> tuple[_Values, NDArray[np.bool_]]:
+    """Returns the nearest step of a discrete distribution to values, and whether
+    the values are on it."""
+    position = _position(args, x)
+    nearest = np.round(position)
+    on_step = (
+        (np.abs(position - nearest) <= _TOLERANCE)
+        & (nearest >= 0)
+        & (nearest <= args["steps"] - 1)
+    )
+    return nearest, on_step
+
+
+class _DUnif(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        # A score so large that its probability rounds to 1 is the last step
+        step = np.floor(special.ndtr(z) * args["steps"])
+        return _step_value(args, np.minimum(step, args["steps"] - 1))
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return np.clip((_last_step(args, x) + 1) / args["steps"], 0.0, 1.0)
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        _, on_step = _nearest_step(args, x)
+        return np.where(on_step, 1.0 / args["steps"], 0.0)
+
+
+def _triang(args: _Args) -> tuple[_Values, _Values, _Values]:
+    """Returns the shape, location and scale of triangular distributions."""
+    width = args["max"] - args["min"]
+    return (args["mode"] - args["min"]) / width, args["min"], width
+
+
+class _Triangular(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return stats.triang.ppf(special.ndtr(z), *_triang(args))
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.triang.cdf(x, *_triang(args))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.triang.pdf(x, *_triang(args))
+
+
+def _errf_score(args: _Args, u: _Values) -> _Values:
+    """Returns the standard normal score of the probabilities of the error
+    function, the inverse of ``norm.cdf((z + skewness) / width)``."""
+    return args["width"] * special.ndtri(u) - args["skewness"]
+
+
+class _Errf(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        u = special.ndtr((z + args["skewness"]) / args["width"])
+        return args["min"] + u * (args["max"] - args["min"])
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        u = np.clip((x - args["min"]) / (args["max"] - args["min"]), 0.0, 1.0)
+        return special.ndtr(_errf_score(args, u))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        width = args["max"] - args["min"]
+        u = (x - args["min"]) / width
+        inside = (u > 0.0) & (u < 1.0)
+        u = np.where(inside, u, 0.5)
+        pdf = (
+            stats.norm.pdf(_errf_score(args, u))
+            * args["width"]
+            / (stats.norm.pdf(special.ndtri(u)) * width)
+        )
+        return np.where(inside, pdf, 0.0)
+
+
+def _derrf_cdf(args: _Args, step: _Values) -> _Values:
+    """Returns the probability of the steps of a discrete error function up to and
+    including a step."""
+    u = np.clip((step + 1) / args["steps"], 0.0, 1.0)
+    return special.ndtr(_errf_score(args, u))
+
+
+class _Derrf(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        u = special.ndtr((z + args["skewness"]) / args["width"])
+        step = np.clip(np.ceil(u * args["steps"]) - 1, 0, args["steps"] - 1)
+        return _step_value(args, step)
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return _derrf_cdf(args, _last_step(args, x))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        step, on_step = _nearest_step(args, x)
+        mass = _derrf_cdf(args, step) - _derrf_cdf(args, step - 1)
+        return np.where(on_step, mass, 0.0)
+
+
+def _pert(args: _Args) -> tuple[_Values, _Values, _Values, _Values]:
+    """Returns the shapes, location and scale of the beta distributions of PERT
+    distributions."""
+    width = args["max"] - args["min"]
+    a = 1 + args["scale"] * (args["mode"] - args["min"]) / width
+    b = 1 + args["scale"] * (args["max"] - args["mode"]) / width
+    return a, b, args["min"], width
+
+
+class _Pert(_Distribution):
+    @staticmethod
+    def transform(args: _Args, z: _Values) -> ArrayLike:
+        return stats.beta.ppf(special.ndtr(z), *_pert(args))
+
+    @staticmethod
+    def cdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.beta.cdf(x, *_pert(args))
+
+    @staticmethod
+    def pdf(args: _Args, x: _Values) -> ArrayLike:
+        return stats.beta.pdf(x, *_pert(args))
+
+
+_DISTRIBUTIONS: dict[ErtDistribution, type[_Distribution]] = {
+    ErtDistribution.uniform: _Uniform,
+    ErtDistribution.logunif: _LogUnif,
+    ErtDistribution.normal: _Normal,
+    ErtDistribution.lognormal: _LogNormal,
+    ErtDistribution.truncated_normal: _TruncatedNormal,
+    ErtDistribution.raw: _Raw,
+    ErtDistribution.const: _Const,
+    ErtDistribution.dunif: _DUnif,
+    ErtDistribution.triangular: _Triangular,
+    ErtDistribution.errf: _Errf,
+    ErtDistribution.derrf: _Derrf,
+    ErtDistribution.pert: _Pert,
+}
+
+
+def _args(parameters: list[ErtParameterMetadata]) -> _Args:
+    """Returns the arguments of parameters of the same distribution as arrays."""
+    dumps = [p.model_dump(exclude=_METADATA_FIELDS) for p in parameters]
+    return {
+        name: np.array([dump[name] for dump in dumps], dtype=np.float64)
+        for name in dumps[0]
+    }
+
+
+class ParameterDistributions:
+    """The prior distributions of the parameters of an Ert parameters table.
+
+    Values are arrays with the parameters along the last axis, in the order they
+    were given, i.e. of shape ``(num_realizations, num_parameters)``. Each function
+    is evaluated for all parameters of a distribution at once.
+
+    Example:
+        >>> distributions = ParameterDistributions.from_result(result)
+        >>> scores = rng.standard_normal((100, distributions.num_parameters))
+        >>> values = distributions.transform(scores)
+    """
+
+    def __init__(self, parameters: Mapping[str, ErtParameterMetadata]) -> None:
+        """Initializes the distributions.
+
+        Args:
+            parameters: The metadata of each parameter, by name.
+        """
+        self.names = list(parameters)
+        """The names of the parameters, in the order of the last axis of values."""
+
+        metadata = list(parameters.values())
+        indices: dict[ErtDistribution, list[int]] = {}
+        for index, parameter in enumerate(metadata):
+            indices.setdefault(parameter.distribution, []).append(index)
+        self._groups = [
+            (
+                _DISTRIBUTIONS[distribution],
+                np.array(group, dtype=np.intp),
+                _args([metadata[i] for i in group]),
+            )
+            for distribution, group in indices.items()
+        ]
+
+    @classmethod
+    def from_result(cls, result: ErtParametersResult) -> Self:
+        """Creates the distributions of the parameters of an Ert parameters table."""
+        return cls({name: column.metadata for name, column in result.root.items()})
+
+    @property
+    def num_parameters(self) -> int:
+        """The number of parameters."""
+        return len(self.names)
+
+    def _evaluate(
+        self, function: Literal["transform", "cdf", "pdf"], values: ArrayLike
+    ) -> _Values:
+        array = np.asarray(values, dtype=np.float64)
+        if array.shape[-1:] != (self.num_parameters,):
+            raise ValueError(
+                f"Expected the {self.num_parameters} parameters along the last axis, "
+                f"got values of shape {array.shape}"
+            )
+        result = np.empty_like(array)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for distribution, columns, args in self._groups:
+                result[..., columns] = getattr(distribution, function)(
+                    args, array[..., columns]
+                )
+        return result
+
+    def transform(self, scores: ArrayLike) -> _Values:
+        """Transforms standard normal scores to parameter values, as Ert does.
+
+        Args:
+            scores: The standard normal scores, with the parameters along the last
+                axis.
+
+        Raises:
+            ValueError: If the last axis does not have the number of parameters.
+        """
+        return self._evaluate("transform", scores)
+
+    def sample(self, n: int, rng: np.random.Generator | int | None = None) -> _Values:
+        """Samples parameter values from their prior distributions.
+
+        Args:
+            n: The number of samples, i.e. realizations, of each parameter.
+            rng: The random number generator, or a seed for one.
+
+        Returns:
+            The values, of shape ``(n, num_parameters)``.
+        """
+        scores = np.random.default_rng(rng).standard_normal((n, self.num_parameters))
+        return self.transform(scores)
+
+    def cdf(self, values: ArrayLike) -> _Values:
+        """Returns the cumulative distribution function of parameter values.
+
+        Args:
+            values: The values, with the parameters along the last axis.
+
+        Raises:
+            ValueError: If the last axis does not have the number of parameters.
+        """
+        return self._evaluate("cdf", values)
+
+    def pdf(self, values: ArrayLike) -> _Values:
+        """Returns the probability density of parameter values.
+
+        Discrete distributions, 'dunif', 'derrf' and 'const', have the probability
+        of each value instead. The bounds of 'truncated_normal', which Ert clips
+        values to, have the density of the normal distribution.
+
+        Args:
+            values: The values, with the parameters along the last axis.
+
+        Raises:
+            ValueError: If the last axis does not have the number of parameters.
+        """
+        return self._evaluate("pdf", values)
@@ -1,11 +1,16 @@
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
+from fmu.datamodels.standard_results.enums import ErtObservations
 from fmu.datamodels.types import VersionStr
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class ErtObservationsRftResultRow(BaseModel):
     """Represents the columns of a row in a Ert rft observation export.
@@ -49,7 +54,7 @@ class ErtObservationsRftResultRow(BaseModel):
     """The measured depth along the well this row represents. Optional."""
 
 
-class ErtObservationsRftResult(RootModel):
+class ErtObservationsRftResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant Ert rft observations parquet file, which is
     naturally a list of rows.
 
@@ -80,6 +85,18 @@ class ErtObservationsRftSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> "pa.Schema":
+        """Returns the Arrow schema of an rft observations table. Requires ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(
+            ErtObservationsRftResult, tuple(ErtObservations.RftColumns.index_columns())
+        )
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return ErtObservationsRftResult.model_json_schema(
@@ -1,12 +1,17 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
+from fmu.datamodels.standard_results.enums import ErtObservations
 from fmu.datamodels.types import VersionStr
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class ErtObservationsSummaryResultRow(BaseModel):
     """Represents the columns of a row in a Ert summary observation export.
@@ -35,7 +40,7 @@ class ErtObservationsSummaryResultRow(BaseModel):
     """The north coordinate this row represents. Optional."""
 
 
-class ErtObservationsSummaryResult(RootModel):
+class ErtObservationsSummaryResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant Ert summary observations parquet file, which is
     naturally a list of rows.
 
@@ -66,6 +71,20 @@ class ErtObservationsSummarySchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> "pa.Schema":
+        """Returns the Arrow schema of a summary observations table. Requires
+        ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(
+            ErtObservationsSummaryResult,
+            tuple(ErtObservations.SummaryColumns.index_columns()),
+        )
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return ErtObservationsSummaryResult.model_json_schema(
@@ -3,15 +3,53 @@
 These schemas are used for Parquet column metadata in Ert parameter tables."""
 
 import json
+import re
 from enum import StrEnum
 from pathlib import Path
-from typing import Annotated, Any, Literal, Self
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Self
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
 from fmu.datamodels.types import VersionStr
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_ARROW_TYPE_NAMES = {"double": "float64"}
+"""Arrow type names that differ from the column types of the schema."""
+
+_JSON_KEY = re.compile(rb"[A-Za-z_][A-Za-z0-9_]*")
+"""Metadata keys that are JSON strings when quoted, like the field names."""
+
+_JSON_SCALAR = re.compile(
+    rb'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|"[^"\\\x00-\x1f]*"'
+)
+"""Metadata values that are a single JSON number or string without escapes."""
+
+
+def _json_key(key: bytes) -> bytes:
+    """Returns a metadata key as a JSON string."""
+    if _JSON_KEY.fullmatch(key):
+        return b'"%s"' % key
+    return json.dumps(key.decode("utf-8")).encode("utf-8")
+
+
+def _json_value(value: bytes) -> bytes:
+    """Returns a metadata value as a single JSON value.
+
+    Values that are not plainly a number or a string are decoded like in
+    :meth:`GenKwParameterMetadata.from_pa_metadata` and encoded again, so that
+    e.g. ``0.0,"max":1.0`` is rejected rather than read as two values.
+
+    Raises:
+        ValueError: If the value is not JSON.
+    """
+    if _JSON_SCALAR.fullmatch(value):
+        return value
+    return json.dumps(json.loads(value.decode("utf-8"))).encode("utf-8")
+
 
 class ErtDistribution(StrEnum):
     """All currently known Ert distributions."""
@@ -205,7 +243,7 @@ class ErtParameterColumn(BaseModel):
     metadata: ErtParameterMetadata
 
 
-class ErtParametersResult(RootModel[dict[str, ErtParameterColumn]]):
+class ErtParametersResult(FromJsonBytesMixin, RootModel[dict[str, ErtParameterColumn]]):
     """
     Represents the Ert parameters exported as a Parquet file.
 
@@ -218,6 +256,68 @@ class ErtParametersResult(RootModel[dict[str, ErtParameterColumn]]):
     def all_column_names(self) -> list[str]:
         return ["REAL", *self.root.keys()]
 
+    @classmethod
+    def from_pa_schema(cls, schema: "pa.Schema") -> Self:
+        """Creates an instance from the schema of an Ert parameters table.
+
+        The column metadata of all parameters is validated at once. Its values are
+        already JSON, so they are joined into one JSON document without being
+        decoded, and validated in a single pass. This is far faster than
+        :meth:`GenKwParameterMetadata.from_pa_metadata` for each column of tables
+        with thousands of parameters. Values that are not plainly a number or a
+        string are decoded on their own first, so both accept the same metadata.
+
+        Args:
+            schema: The Arrow schema of the table, i.e. from
+                ``pyarrow.parquet.read_schema``.
+
+        Raises:
+            ValidationError: If a column type or its metadata is invalid.
+            ValueError: If a metadata value is not JSON.
+        """
+        columns = []
+        for field in schema:
+            if field.name == "REAL":
+                continue
+            metadata = b",".join(
+                b"%s:%s" % (_json_key(key), _json_value(value))
+                for key, value in (field.metadata or {}).items()
+            )
+            dtype = _ARROW_TYPE_NAMES.get(str(field.type), str(field.type))
+            columns.append(
+                b'%s:{"type":"%s","metadata":{%s}}'
+                % (json.dumps(field.name).encode(), dtype.encode(), metadata)
+            )
+        return cls.model_validate_json(b"{" + b",".join(columns) + b"}")
+
+    def to_pa_schema(self) -> "pa.Schema":
+        """Returns the Arrow schema of the table, with the column metadata of each
+        parameter. Requires ``pyarrow``.
+
+        The metadata is the same as from
+        :meth:`GenKwParameterMetadata.to_pa_metadata`, but all parameters are dumped
+        at once. The 'REAL' column comes first.
+        """
+        import pyarrow as pa
+
+        dumped = self.model_dump(mode="json")
+        # The few distinct strings, like the groups, are encoded once each
+        encoded_strings: dict[str, bytes] = {}
+
+        fields: list[pa.Field] = [pa.field("REAL", pa.int64())]
+        for name, column in dumped.items():
+            metadata = {}
+            for key, value in column["metadata"].items():
+                if isinstance(value, str):
+                    if value not in encoded_strings:
+                        encoded_strings[value] = json.dumps(value).encode()
+                    metadata[key.encode()] = encoded_strings[value]
+                else:
+                    metadata[key.encode()] = json.dumps(value).encode()
+            dtype = pa.type_for_alias(column["type"])
+            fields.append(pa.field(name, dtype, metadata=metadata))
+        return pa.schema(fields)
+
 
 class ErtParametersSchema(SchemaBase):
     """This class represents the schema that is used to validate the fault lines
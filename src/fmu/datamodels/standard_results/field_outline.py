@@ -4,12 +4,15 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
 
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any
 
+    import pyarrow as pa
+
     from fmu.datamodels.types import VersionStr
 
 
@@ -34,7 +37,7 @@ class FieldOutlineResultRow(BaseModel):
     """Index column. The id of the polygon which this row represents. Required."""
 
 
-class FieldOutlineResult(RootModel):
+class FieldOutlineResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant field outline parquet file, which is
     naturally a list of rows.
 
@@ -65,6 +68,16 @@ class FieldOutlineSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> pa.Schema:
+        """Returns the Arrow schema of a field outline table. Requires ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(FieldOutlineResult)
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return FieldOutlineResult.model_json_schema(
@@ -5,13 +5,19 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
 from fmu.datamodels.standard_results.enums import InplaceVolumes
 from fmu.datamodels.types import VersionStr
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any
 
+    import pyarrow as pa
+
+    from fmu.datamodels.standard_results.columnar import ColumnarValidationReport
+
 
 class InplaceVolumesResultRow(BaseModel):
     """Represents the columns of a row in a static inplace volumes export.
@@ -63,7 +69,7 @@ class InplaceVolumesResultRow(BaseModel):
     """The associated oil volume of the fluid-type given in ``FLUID``. Optional."""
 
 
-class InplaceVolumesResult(RootModel):
+class InplaceVolumesResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant static inplace volumes parquet file, which is naturally
     a list of rows.
 
@@ -72,6 +78,21 @@ class InplaceVolumesResult(RootModel):
 
     root: list[InplaceVolumesResultRow]
 
+    @classmethod
+    def validate_columns(
+        cls, data: pa.Table | pa.RecordBatch | Mapping[str, Any]
+    ) -> ColumnarValidationReport:
+        """Validates an inplace volumes table column by column, without converting it
+        into a list of rows first. Requires ``pyarrow``.
+
+        See :func:`.columnar.validate_inplace_volumes_table`.
+        """
+        from fmu.datamodels.standard_results.columnar import (
+            validate_inplace_volumes_table,
+        )
+
+        return validate_inplace_volumes_table(data)
+
 
 class InplaceVolumesSchema(SchemaBase):
     """This class represents the schema that is used to validate the inplace volumes
@@ -93,6 +114,16 @@ class InplaceVolumesSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> pa.Schema:
+        """Returns the Arrow schema of an inplace volumes table. Requires ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(InplaceVolumesResult, tuple(InplaceVolumes.index_columns()))
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return InplaceVolumesResult.model_json_schema(
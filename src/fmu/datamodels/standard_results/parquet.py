@@ -0,0 +1,399 @@
+"""Validation of standard result Parquet files.
+
+Parquet files are validated incrementally, one record batch at a time, so that the
+memory used is bounded by the batch size rather than the size of the file. The
+columns of a file can also be checked from its footer alone, see
+:func:`check_parquet_schema`, and the values of row groups proven valid by their
+column statistics need not be read, see :func:`validate_parquet_row_groups`.
+
+This module requires ``pyarrow``, installed with the ``arrow`` extra:
+
+    $ pip install fmu-datamodels[arrow]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from fmu.datamodels.standard_results.columnar import (
+    Bound,
+    ColumnarValidationReport,
+    ColumnCheck,
+    ColumnError,
+    ColumnKind,
+    compile_plan,
+    missing_columns,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+DEFAULT_BATCH_SIZE = 65536
+"""The default number of rows read and validated at a time."""
+
+
+def _open(source: str | Path | IO[bytes] | pq.ParquetFile) -> pq.ParquetFile:
+    return source if isinstance(source, pq.ParquetFile) else pq.ParquetFile(source)
+
+
+@dataclass
+class ValidationSummary:
+    """The aggregated result of validating a table in batches."""
+
+    num_rows: int = 0
+    """The number of rows validated."""
+
+    num_batches: int = 0
+    """The number of batches validated."""
+
+    num_invalid_batches: int = 0
+    """The number of batches containing at least one error."""
+
+    error_counts: dict[tuple[str, str], int] = field(default_factory=dict)
+    """The number of invalid rows per column and error type. Errors concerning a
+    column as a whole, like a missing column, count every row in the batch."""
+
+    num_skipped_batches: int = 0
+    """The number of batches proven valid without reading their values, i.e. row
+    groups proven valid by their statistics."""
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no errors were found."""
+        return not self.error_counts
+
+
+class StreamingValidator:
+    """Validates a table of a standard result one batch at a time.
+
+    Row indices in the per-batch reports are relative to the start of the stream,
+    and the errors of all batches are aggregated into :attr:`summary`. Only counts
+    are aggregated, so memory use does not grow with the number of batches.
+
+    Example:
+        >>> validator = StreamingValidator(InplaceVolumesResult)
+        >>> for report in validator.iter_parquet("volumes.parquet"):
+        ...     handle(report)
+        >>> validator.summary.is_valid
+    """
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        required_columns: Sequence[str] | None = None,
+    ) -> None:
+        """Initializes the validator.
+
+        Args:
+            model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list
+                of rows.
+            required_columns: Columns that must be present in addition to those
+                required by the row model.
+        """
+        self.plan = compile_plan(model)
+        self.required_columns = required_columns
+        self.summary = ValidationSummary()
+
+    def validate_batch(
+        self, batch: pa.RecordBatch | pa.Table
+    ) -> ColumnarValidationReport:
+        """Validates the next batch of the stream and adds it to the summary."""
+        offset = self.summary.num_rows
+        report = self.plan.validate(batch, self.required_columns)
+        report.offset = offset
+        if offset:
+            report.errors = [
+                dataclasses.replace(
+                    e, rows=pc.add(e.rows, pa.scalar(offset, pa.uint64()))
+                )
+                for e in report.errors
+            ]
+        self._add(report)
+        return report
+
+    def _add(self, report: ColumnarValidationReport) -> None:
+        """Adds the report of the next batch of the stream to the summary."""
+        self.summary.num_rows += report.num_rows
+        self.summary.num_batches += 1
+        if not report.is_valid:
+            self.summary.num_invalid_batches += 1
+        for error in report.errors:
+            key = (error.column, error.type)
+            num_invalid = error.num_rows or report.num_rows
+            self.summary.error_counts[key] = (
+                self.summary.error_counts.get(key, 0) + num_invalid
+            )
+
+    def iter_batches(
+        self, batches: Iterable[pa.RecordBatch | pa.Table]
+    ) -> Iterator[ColumnarValidationReport]:
+        """Validates a stream of batches, yielding a report for each batch."""
+        for batch in batches:
+            yield self.validate_batch(batch)
+
+    def iter_parquet(
+        self,
+        source: str | Path | IO[bytes] | pq.ParquetFile,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[ColumnarValidationReport]:
+        """Validates a Parquet file batch by batch, yielding a report for each batch.
+
+        Only the columns known to the row model are read. If the file has none of
+        them, no values are read, and a single report of the missing columns is
+        yielded for the whole file, see :func:`check_parquet_schema`.
+
+        Args:
+            source: The Parquet file, as a path, a binary file object or an opened
+                ``pyarrow.parquet.ParquetFile``.
+            batch_size: The maximum number of rows in each batch.
+        """
+        parquet_file = _open(source)
+        names = set(parquet_file.schema_arrow.names)
+        columns = [c.name for c in self.plan.columns if c.name in names]
+        if not columns:
+            report = check_parquet_schema(
+                parquet_file, self.plan.model, self.required_columns
+            )
+            report.offset = self.summary.num_rows
+            self._add(report)
+            yield report
+            return
+        yield from self.iter_batches(
+            parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+        )
+
+
+def validate_parquet(
+    model: type[BaseModel],
+    source: str | Path | IO[bytes] | pq.ParquetFile,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    required_columns: Sequence[str] | None = None,
+) -> ValidationSummary:
+    """Validates a Parquet file of a standard result with bounded memory.
+
+    Args:
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows.
+        source: The Parquet file. See :meth:`StreamingValidator.iter_parquet`.
+        batch_size: The maximum number of rows validated at a time.
+        required_columns: Columns that must be present in addition to those
+            required by the row model.
+
+    Returns:
+        The aggregated result of validating all batches.
+    """
+    validator = StreamingValidator(model, required_columns)
+    for _ in validator.iter_parquet(source, batch_size):
+        pass
+    return validator.summary
+
+
+def check_parquet_schema(
+    source: str | Path | IO[bytes] | pq.ParquetFile,
+    model: type[BaseModel] | None = None,
+    required_columns: Sequence[str] | None = None,
+) -> ColumnarValidationReport:
+    """Checks the columns of a Parquet file from its footer alone.
+
+    No row data is read, so the time taken does not depend on the size of the
+    file. Missing columns, misnamed columns and columns stored with the wrong type,
+    like an integer column stored as floats, are found. The values are not
+    checked, see :func:`validate_parquet`.
+
+    The Arrow schema stored in the key-value metadata of the footer is used if
+    present, so that dictionary encoded and timestamp columns have the types they
+    were written with.
+
+    Example:
+        >>> report = check_parquet_schema(
+        ...     "volumes.parquet",
+        ...     InplaceVolumesResult,
+        ...     InplaceVolumes.required_columns(),
+        ... )
+
+    Args:
+        source: The Parquet file. See :meth:`StreamingValidator.iter_parquet`.
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows. If not given, only the required columns are checked, i.e. for
+            tables with no row model like ``SimulatorTables.PvtColumns``.
+        required_columns: Columns that must be present in addition to those
+            required by the row model.
+
+    Returns:
+        A report of the errors found. The errors concern columns as a whole and
+        have no rows.
+    """
+    parquet_file = _open(source)
+    schema = parquet_file.schema_arrow
+    report = ColumnarValidationReport(num_rows=parquet_file.metadata.num_rows)
+    if model is None:
+        report.errors = missing_columns(schema.names, required_columns or ())
+    else:
+        report.errors = compile_plan(model).check_schema(schema, required_columns)
+    return report
+
+
+def _checks(
+    model: type[BaseModel] | None, bounds: Mapping[str, Sequence[Bound]] | None
+) -> list[ColumnCheck]:
+    """Returns the checks of the columns of a model, with additional bounds."""
+    checks = list(compile_plan(model).columns) if model is not None else []
+    for name, extra in (bounds or {}).items():
+        index = next((i for i, c in enumerate(checks) if c.name == name), None)
+        if index is None:
+            checks.append(
+                ColumnCheck(name, ColumnKind.number, False, True, bounds=tuple(extra))
+            )
+        else:
+            checks[index] = dataclasses.replace(
+                checks[index], bounds=checks[index].bounds + tuple(extra)
+            )
+    return checks
+
+
+def _is_proven(
+    check: ColumnCheck, statistics: pq.Statistics | None, check_nan: bool
+) -> bool:
+    """Returns True if the statistics of a column chunk prove its values valid.
+
+    The dtype of the column is assumed to have been checked from the schema.
+    """
+    if statistics is None or statistics.null_count is None:
+        return False
+    if not check.nullable and statistics.null_count > 0:
+        return False
+    if check.kind == ColumnKind.datetime and statistics.physical_type == "BYTE_ARRAY":
+        # Datetimes stored as strings must be parsed
+        return statistics.num_values == 0
+    if check.values is None and not check.bounds and check.kind != ColumnKind.uuid:
+        return True
+    if statistics.num_values == 0:
+        # All values are null
+        return True
+    if not statistics.has_min_max or check.kind == ColumnKind.uuid:
+        return False
+    if check.values is not None:
+        return statistics.min == statistics.max and str(statistics.min) in check.values
+    if check_nan and statistics.physical_type in ("FLOAT", "DOUBLE"):
+        # NaN is not included in the statistics, and violates every bound
+        return False
+    return all(
+        bound.is_satisfied_by_range(statistics.min, statistics.max)
+        for bound in check.bounds
+    )
+
+
+def validate_parquet_row_groups(
+    source: str | Path | IO[bytes] | pq.ParquetFile,
+    model: type[BaseModel] | None = None,
+    required_columns: Sequence[str] | None = None,
+    bounds: Mapping[str, Sequence[Bound]] | None = None,
+    check_nan: bool | Collection[str] = True,
+) -> ValidationSummary:
+    """Validates a Parquet file row group by row group, consulting the column
+    statistics in its footer before reading any values.
+
+    A column of a row group is proven valid by its statistics if it has no nulls
+    where none are allowed, and its minimum and maximum satisfy its bounds. Only
+    the columns not proven valid are read, and row groups with all columns proven
+    valid are skipped, so a large well behaved file is validated at little more
+    than the cost of reading its footer. Enumerations are only proven if a row
+    group has a single value, and UUIDs and datetimes stored as strings are always
+    read.
+
+    Parquet statistics do not account for NaN values, which violate every bound.
+    Floating point columns with bounds are therefore always read by default, so no
+    row group of an inplace volumes table, whose volumes are bounded, is skipped.
+    The statistics only prove them valid if they are not checked for NaN: with
+    ``check_nan`` False, or if they are not among the columns given as
+    ``check_nan``. Files written from
+    pandas store NaN as null, which is found from the null counts, so NaN need
+    not be checked for in them.
+
+    Example:
+        >>> summary = validate_parquet_row_groups(
+        ...     "volumes.parquet", InplaceVolumesResult, check_nan=False
+        ... )
+        >>> summary.num_skipped_batches, summary.num_batches
+
+    Args:
+        source: The Parquet file. See :meth:`StreamingValidator.iter_parquet`.
+        model: A ``*ResultRow`` model, or a ``*Result`` root model holding a list of
+            rows. If not given, only the required columns and bounds are checked.
+        required_columns: Columns that must be present in addition to those
+            required by the row model.
+        bounds: Bounds on the values of columns in addition to those of the row
+            model, i.e. from :func:`~fmu.datamodels.standard_results.columnar.
+            attribute_bounds`.
+        check_nan: If False, floating point columns are assumed to have no NaN
+            values, and are proven valid by their statistics like other columns.
+            If the names of columns, only those are assumed to possibly have NaN
+            values. Defaults to True, where every floating point column is read.
+
+    Returns:
+        The aggregated result of validating all row groups, with a batch per row
+        group.
+    """
+    parquet_file = _open(source)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    checks = _checks(model, bounds)
+    nan_columns = (
+        {c.name for c in checks} if check_nan is True else set(check_nan or ())
+    )
+
+    required = [c.name for c in checks if c.required]
+    required += [name for name in required_columns or () if name not in required]
+    column_errors = missing_columns(schema.names, required)
+    present = []
+    for check in checks:
+        if check.name not in schema.names:
+            continue
+        if error := check.check_dtype(schema.field(check.name).type):
+            column_errors.append(error)
+        else:
+            present.append(check)
+
+    # Statistics are stored for the leaf columns of the Parquet schema
+    leaves = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    summary = ValidationSummary()
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        unproven = [
+            check
+            for check in present
+            if check.name not in leaves
+            or not _is_proven(
+                check,
+                row_group.column(leaves[check.name]).statistics,
+                check.name in nan_columns,
+            )
+        ]
+
+        errors: list[ColumnError] = list(column_errors)
+        if unproven:
+            table = parquet_file.read_row_group(
+                index, columns=[check.name for check in unproven]
+            )
+            for check in unproven:
+                errors.extend(check.validate(table.column(check.name)))
+        elif not errors:
+            summary.num_skipped_batches += 1
+
+        summary.num_rows += row_group.num_rows
+        summary.num_batches += 1
+        if errors:
+            summary.num_invalid_batches += 1
+        for error in errors:
+            key = (error.column, error.type)
+            num_invalid = error.num_rows or row_group.num_rows
+            summary.error_counts[key] = summary.error_counts.get(key, 0) + num_invalid
+    return summary
@@ -5,12 +5,16 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
+from fmu.datamodels.standard_results.enums import SimulatorFipregionsMapping
 from fmu.datamodels.types import VersionStr
 
 if TYPE_CHECKING:
     from typing import Any
 
+    import pyarrow as pa
+
 
 class SimulatorFipregionsMappingResultRow(BaseModel):
     """Represents the columns of a row in a simulator fipregions mapping export.
@@ -30,7 +34,7 @@ class SimulatorFipregionsMappingResultRow(BaseModel):
     """Index column. The region that the fipregion corresponds to. Required."""
 
 
-class SimulatorFipregionsMappingResult(RootModel):
+class SimulatorFipregionsMappingResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant simulator fipregions mapping parquet file, which is
     naturally a list of rows.
 
@@ -60,6 +64,20 @@ class SimulatorFipregionsMappingSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> pa.Schema:
+        """Returns the Arrow schema of a simulator fipregions mapping table. Requires
+        ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(
+            SimulatorFipregionsMappingResult,
+            tuple(SimulatorFipregionsMapping.index_columns()),
+        )
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return SimulatorFipregionsMappingResult.model_json_schema(
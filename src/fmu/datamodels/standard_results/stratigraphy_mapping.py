@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from pydantic import RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
 from fmu.datamodels.context.mappings import (
     StratigraphyIdentifierMapping,
@@ -14,6 +15,8 @@ from fmu.datamodels.types import VersionStr
 if TYPE_CHECKING:
     from typing import Any
 
+    import pyarrow as pa
+
 
 class StratigraphyMappingResultRow(StratigraphyIdentifierMapping):
     """Represents the columns of a row in a stratigraphy mapping export.
@@ -24,7 +27,7 @@ class StratigraphyMappingResultRow(StratigraphyIdentifierMapping):
     specification (i.e. they are a patch, minor, or major change)."""
 
 
-class StratigraphyMappingResult(RootModel):
+class StratigraphyMappingResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant stratigraphy mapping parquet file, which is
     naturally a list of rows.
 
@@ -54,6 +57,17 @@ class StratigraphyMappingSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> pa.Schema:
+        """Returns the Arrow schema of a stratigraphy mapping table. Requires
+        ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(StratigraphyMappingResult)
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return StratigraphyMappingResult.model_json_schema(
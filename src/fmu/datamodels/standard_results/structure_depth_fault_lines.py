@@ -4,12 +4,16 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, RootModel
 
+from fmu.datamodels._json import FromJsonBytesMixin
 from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
+from fmu.datamodels.standard_results.enums import FaultLines
 
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any
 
+    import pyarrow as pa
+
     from fmu.datamodels.types import VersionStr
 
 
@@ -37,7 +41,7 @@ class StructureDepthFaultLinesResultRow(BaseModel):
     """Index column. The name of the fault this row represents. Required."""
 
 
-class StructureDepthFaultLinesResult(RootModel):
+class StructureDepthFaultLinesResult(FromJsonBytesMixin, RootModel):
     """Represents the resultant structure depth fault lines parquet file, which is
     naturally a list of rows.
 
@@ -68,6 +72,18 @@ class StructureDepthFaultLinesSchema(SchemaBase):
     PATH: Path = FMU_SCHEMAS_PATH / "file_formats" / VERSION / FILENAME
     """The local and URL path of this schema."""
 
+    @classmethod
+    def arrow_schema(cls) -> pa.Schema:
+        """Returns the Arrow schema of a fault lines table. Requires ``pyarrow``.
+
+        See :func:`.columnar.arrow_schema`.
+        """
+        from fmu.datamodels.standard_results.columnar import arrow_schema
+
+        return arrow_schema(
+            StructureDepthFaultLinesResult, tuple(FaultLines.index_columns())
+        )
+
     @classmethod
     def dump(cls) -> dict[str, Any]:
         return StructureDepthFaultLinesResult.model_json_schema(
@@ -0,0 +1,442 @@
+"""Cached validators for the FMU results and standard result models.
+
+Building a Pydantic validator for a type is costly for large discriminated unions
+like :class:`FmuResults`. This module keeps a registry of ``TypeAdapter`` objects
+that are built lazily on first use and then reused for the lifetime of the process.
+
+Validators are registered by schema name and version. The schema name is the
+filename of the schema without its suffix, i.e. ``fmu_results`` or
+``inplace_volumes``. The root models of the FMU results schema are also registered
+by their class name, i.e. ``ObjectMetadata``.
+
+Example:
+    >>> from fmu.datamodels.validators import get_adapter
+    >>> adapter = get_adapter("fmu_results")
+    >>> metadata = adapter.validate_python(data)
+"""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import TypeAdapter, ValidationError, WrapValidator
+
+from fmu.datamodels._json import JsonInput, json_input
+from fmu.datamodels._schema_base import version_key
+
+if TYPE_CHECKING:
+    from pydantic_core import ErrorDetails
+
+
+class _Invalid:
+    """Takes the place of an item that failed validation in a list."""
+
+    __slots__ = ("errors",)
+
+    def __init__(self, errors: list[ErrorDetails]) -> None:
+        self.errors = errors
+
+
+def _isolate(value: Any, handler: Callable[[Any], Any]) -> Any:
+    """Validates an item of a list, returning its errors instead of raising them so
+    that one invalid item does not fail the validation of the whole list."""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _Invalid(e.errors(include_url=False))
+
+
+class ValidatorRegistry:
+    """A registry of lazily built and cached ``TypeAdapter`` objects."""
+
+    def __init__(self) -> None:
+        self._targets: dict[tuple[str, str], Callable[[], Any]] = {}
+        self._adapters: dict[tuple[str, str], TypeAdapter[Any]] = {}
+        self._list_adapters: dict[tuple[str, str], TypeAdapter[list[Any]]] = {}
+        self._build_times: dict[tuple[str, str], float] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, version: str, target: Callable[[], Any]) -> None:
+        """Registers a type to build a validator for.
+
+        Args:
+            name: The schema or model name to register the validator under.
+            version: The version of the schema.
+            target: A callable returning the type to validate. It is called when
+                the validator is first requested, which allows the type to be
+                imported lazily.
+        """
+        with self._lock:
+            self._targets[(name, version)] = target
+            self._adapters.pop((name, version), None)
+            self._list_adapters.pop((name, version), None)
+            self._build_times.pop((name, version), None)
+
+    def keys(self) -> list[tuple[str, str]]:
+        """Returns the names and versions of all registered validators."""
+        with self._lock:
+            return sorted(self._targets)
+
+    def versions(self, name: str) -> list[str]:
+        """Returns the registered versions of a schema, oldest first."""
+        with self._lock:
+            versions = [v for n, v in self._targets if n == name]
+        if not versions:
+            raise KeyError(f"No validator registered for '{name}'")
+        return sorted(versions, key=version_key)
+
+    def get(self, name: str, version: str | None = None) -> TypeAdapter[Any]:
+        """Returns the validator for a schema, building it if needed.
+
+        Args:
+            name: The schema or model name.
+            version: The version of the schema. Defaults to the newest registered
+                version.
+        """
+        key = (name, version or self.versions(name)[-1])
+        adapter = self._adapters.get(key)
+        if adapter is not None:
+            return adapter
+
+        with self._lock:
+            if key in self._adapters:
+                return self._adapters[key]
+            if key not in self._targets:
+                raise KeyError(f"No validator registered for '{name}' version {key[1]}")
+
+            start = time.perf_counter()
+            adapter = TypeAdapter(self._targets[key]())
+            self._build_times[key] = time.perf_counter() - start
+            self._adapters[key] = adapter
+            return adapter
+
+    def get_list(self, name: str, version: str | None = None) -> TypeAdapter[list[Any]]:
+        """Returns the validator for a list of items of a schema, building it if
+        needed.
+
+        Invalid items do not fail the validation of the list. They are returned in
+        place as objects holding their errors. Use :func:`validate_many` rather
+        than this validator directly.
+
+        Args:
+            name: The schema or model name.
+            version: The version of the schema. Defaults to the newest registered
+                version.
+        """
+        key = (name, version or self.versions(name)[-1])
+        adapter = self._list_adapters.get(key)
+        if adapter is not None:
+            return adapter
+
+        with self._lock:
+            if key in self._list_adapters:
+                return self._list_adapters[key]
+            if key not in self._targets:
+                raise KeyError(f"No validator registered for '{name}' version {key[1]}")
+
+            target = self._targets[key]()
+            item = Annotated[target, WrapValidator(_isolate)]  # type: ignore[valid-type]
+            adapter = TypeAdapter(list[item])
+            self._list_adapters[key] = adapter
+            return adapter
+
+    def warm(self) -> None:
+        """Builds all registered validators that have not been built yet."""
+        for name, version in self.keys():
+            self.get(name, version)
+
+    def build_times(self) -> dict[tuple[str, str], float]:
+        """Returns the time in seconds spent building each validator built so far.
+
+        This includes the time spent importing the validated type, if it was
+        imported lazily."""
+        with self._lock:
+            return dict(self._build_times)
+
+    def clear(self) -> None:
+        """Discards all built validators. They are rebuilt on next use."""
+        with self._lock:
+            self._adapters.clear()
+            self._list_adapters.clear()
+            self._build_times.clear()
+
+
+def _returns(target: Any) -> Callable[[], Any]:
+    return lambda: target
+
+
+def _register_defaults(registry: ValidatorRegistry) -> None:
+    """Registers validators for all schemas in :data:`fmu.datamodels.schemas` and
+    the root models of the FMU results schema."""
+    # Lazy: importing the models builds their core schemas
+    from fmu.datamodels import fmu_results, standard_results
+    from fmu.datamodels.fmu_results import fmu_results as fmu_results_module
+
+    schema_models: list[tuple[Any, Any]] = [
+        (fmu_results.FmuResultsSchema, fmu_results.FmuResults),
+        (
+            standard_results.ErtObservationsBreakthroughSchema,
+            standard_results.ErtObservationsBreakthroughResult,
+        ),
+        (
+            standard_results.ErtObservationsRftSchema,
+            standard_results.ErtObservationsRftResult,
+        ),
+        (
+            standard_results.ErtObservationsSummarySchema,
+            standard_results.ErtObservationsSummaryResult,
+        ),
+        (standard_results.ErtParametersSchema, standard_results.ErtParametersResult),
+        (standard_results.FieldOutlineSchema, standard_results.FieldOutlineResult),
+        (
+            standard_results.FluidContactOutlineSchema,
+            standard_results.FluidContactOutlineResult,
+        ),
+        (standard_results.InplaceVolumesSchema, standard_results.InplaceVolumesResult),
+        (
+            standard_results.SimulatorFipregionsMappingSchema,
+            standard_results.SimulatorFipregionsMappingResult,
+        ),
+        (
+            standard_results.StratigraphyMappingSchema,
+            standard_results.StratigraphyMappingResult,
+        ),
+        (
+            standard_results.StructureDepthFaultLinesSchema,
+            standard_results.StructureDepthFaultLinesResult,
+        ),
+    ]
+    for schema, model in schema_models:
+        name = schema.FILENAME.removesuffix(".json")
+        registry.register(name, schema.VERSION, _returns(model))
+        registry.register(model.__name__, schema.VERSION, _returns(model))
+
+    for model in (
+        fmu_results_module.CaseMetadata,
+        fmu_results_module.IterationMetadata,
+        fmu_results_module.EnsembleMetadata,
+        fmu_results_module.RealizationMetadata,
+        fmu_results_module.ObjectMetadata,
+    ):
+        registry.register(
+            model.__name__,
+            fmu_results.FmuResultsSchema.VERSION,
+            _returns(model),
+        )
+
+
+class _DefaultValidatorRegistry(ValidatorRegistry):
+    """The registry of the validators shipped with this package. The defaults are
+    registered on first use, so importing this module stays cheap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._registered = False
+
+    def _ensure_registered(self) -> None:
+        if not self._registered:
+            with self._lock:
+                if not self._registered:
+                    self._registered = True
+                    _register_defaults(self)
+
+    def keys(self) -> list[tuple[str, str]]:
+        self._ensure_registered()
+        return super().keys()
+
+    def versions(self, name: str) -> list[str]:
+        self._ensure_registered()
+        return super().versions(name)
+
+    def get(self, name: str, version: str | None = None) -> TypeAdapter[Any]:
+        self._ensure_registered()
+        return super().get(name, version)
+
+    def get_list(self, name: str, version: str | None = None) -> TypeAdapter[list[Any]]:
+        self._ensure_registered()
+        return super().get_list(name, version)
+
+
+registry: ValidatorRegistry = _DefaultValidatorRegistry()
+"""The registry of validators for all models in this package."""
+
+
+def get_adapter(name: str, version: str | None = None) -> TypeAdapter[Any]:
+    """Returns the cached validator for a schema or model from the default registry.
+
+    Args:
+        name: The schema name, i.e. ``fmu_results``, or the model name, i.e.
+            ``ObjectMetadata``.
+        version: The version of the schema. Defaults to the current version.
+    """
+    return registry.get(name, version)
+
+
+def validate_json(name: str, data: JsonInput, version: str | None = None) -> Any:
+    """Validates raw JSON against a schema or model with its cached validator.
+
+    The JSON is parsed by pydantic-core while validating, without building
+    intermediate Python objects.
+
+    Args:
+        name: The schema name, i.e. ``fmu_results``, or the model name, i.e.
+            ``ObjectMetadata``.
+        data: The raw JSON. A ``memoryview`` or memory-mapped file is also
+            accepted.
+        version: The version of the schema. Defaults to the current version.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        ValidationError: If the JSON is malformed or invalid.
+    """
+    return registry.get(name, version).validate_json(json_input(data))
+
+
+@dataclass
+class BulkValidationResult:
+    """The result of validating many items with :func:`validate_many`."""
+
+    models: list[Any] = field(default_factory=list)
+    """The validated models of the valid items, in input order."""
+
+    indices: list[int] = field(default_factory=list)
+    """The input index of each validated model."""
+
+    errors: dict[int, list[ErrorDetails]] = field(default_factory=dict)
+    """The validation errors of each invalid item, keyed by input index."""
+
+    @property
+    def is_valid(self) -> bool:
+        """True if all items are valid."""
+        return not self.errors
+
+
+def _collect(
+    result: BulkValidationResult, indices: list[int], validated: list[Any]
+) -> None:
+    for index, item in zip(indices, validated, strict=True):
+        if isinstance(item, _Invalid):
+            result.errors[index] = item.errors
+        else:
+            result.indices.append(index)
+            result.models.append(item)
+
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pauses the cyclic garbage collector of the process.
+
+    Validating many items allocates many objects that are all kept alive, which
+    repeatedly triggers collections that scan the growing set of models without
+    freeing anything.
+
+    The collector is global to the process, so the pauses are counted and it is
+    enabled again, if it was enabled before the first, when the last ends. Pauses
+    may overlap across threads, but the collector must not be enabled or disabled
+    by other code while paused."""
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def validate_many(
+    items: Iterable[Mapping[str, Any] | bytes | bytearray | str],
+    name: str = "fmu_results",
+    version: str | None = None,
+    validator_registry: ValidatorRegistry | None = None,
+    pause_gc: bool = False,
+) -> BulkValidationResult:
+    """Validates many items of a schema in one pass.
+
+    The items are validated as one list with a cached validator, rather than one
+    at a time. An invalid item does not stop the validation of the others; its
+    errors are returned by its index instead.
+
+    Raw JSON documents are parsed and validated one by one, by the JSON parser of
+    Pydantic, so that a malformed document is reported with a ``json_invalid``
+    error rather than combined with its neighbours.
+
+    Collections of the cyclic garbage collector triggered by allocating the
+    models can dominate the validation time of large batches. With ``pause_gc``
+    the collector is paused while validating. This affects the whole process,
+    including other threads, which may then use more memory until it ends.
+
+    Example:
+        >>> result = validate_many(documents)
+        >>> for index, errors in result.errors.items():
+        ...     log.warning("Document %d is invalid: %s", index, errors)
+
+    Args:
+        items: Dictionaries, or JSON documents as bytes or strings. Each JSON
+            document must hold exactly one item.
+        name: The schema or model name. Defaults to ``fmu_results``.
+        version: The version of the schema. Defaults to the current version.
+        validator_registry: The registry to get the validator from. Defaults to
+            the registry of this package.
+        pause_gc: If True, the cyclic garbage collector of the process is paused
+            while validating.
+
+    Returns:
+        The valid models and the errors of the invalid items, by input index.
+    """
+    validators = validator_registry or registry
+    list_adapter = validators.get_list(name, version)
+
+    objects: list[Any] = []
+    object_indices: list[int] = []
+    documents: list[bytes] = []
+    document_indices: list[int] = []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            item = item.encode()
+        if isinstance(item, bytes | bytearray):
+            documents.append(bytes(item))
+            document_indices.append(index)
+        else:
+            objects.append(item)
+            object_indices.append(index)
+
+    result = BulkValidationResult()
+    with _gc_paused() if pause_gc else nullcontext():
+        if objects:
+            _collect(result, object_indices, list_adapter.validate_python(objects))
+        if documents:
+            adapter = validators.get(name, version)
+            for index, document in zip(document_indices, documents, strict=True):
+                try:
+                    model = adapter.validate_json(document)
+                except ValidationError as e:
+                    result.errors[index] = e.errors(include_url=False)
+                else:
+                    result.indices.append(index)
+                    result.models.append(model)
+
+    if objects and documents:
+        order = sorted(range(len(result.indices)), key=result.indices.__getitem__)
+        result.indices = [result.indices[i] for i in order]
+        result.models = [result.models[i] for i in order]
+    result.errors = dict(sorted(result.errors.items()))
+    return result
@@ -564,3 +564,26 @@ def property_metadata() -> dict:
     return ObjectMetadata.model_validate(object_metadata_dict).model_dump(
         mode="json", exclude_none=True, by_alias=True
     )
+
+
+METADATA_FIXTURES = [
+    "case_metadata",
+    "fluid_contact_metadata",
+    "field_outline_metadata",
+    "field_region_metadata",
+    "seismic_metadata",
+    "volumes_metadata",
+    "property_metadata",
+]
+
+
+@pytest.fixture(scope="function", params=METADATA_FIXTURES)
+def any_metadata(request: pytest.FixtureRequest) -> dict:
+    """Each of the valid metadata examples above, in turn"""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(scope="function")
+def all_metadata(request: pytest.FixtureRequest) -> list[dict]:
+    """All of the valid metadata examples above"""
+    return [request.getfixturevalue(fixture) for fixture in METADATA_FIXTURES]
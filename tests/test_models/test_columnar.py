@@ -0,0 +1,298 @@
+from typing import Any, get_args
+from uuid import uuid4
+
+import numpy as np
+import pyarrow as pa
+import pytest
+from pydantic import BaseModel
+
+import fmu.datamodels.standard_results as standard_results
+from fmu.datamodels.standard_results import (
+    ErtObservationsBreakthroughResult,
+    ErtObservationsRftResult,
+    ErtObservationsSummaryResult,
+    ErtParametersResult,
+    FieldOutlineResult,
+    FluidContactOutlineResult,
+    InplaceVolumesResult,
+    SimulatorFipregionsMappingResult,
+    StratigraphyMappingResult,
+    StructureDepthFaultLinesResult,
+)
+from fmu.datamodels.standard_results.columnar import (
+    Bound,
+    ColumnarValidationReport,
+    ColumnCheck,
+    ColumnKind,
+    arrow_schema,
+    compile_plan,
+    validate_table,
+)
+
+
+@pytest.fixture
+def inplace_volumes_table() -> dict[str, Any]:
+    return {
+        "FLUID": ["oil", "gas", "water"],
+        "ZONE": ["Valysar", "Therys", "Volon"],
+        "REGION": ["WestLowland", "CentralSouth", "EastMound"],
+        "BULK": [10.0, 20.0, 30.0],
+        "NET": [5.0, 10.0, 15.0],
+        "PORV": [1.0, 2.0, 3.0],
+        "HCPV": [0.5, None, 1.5],
+        "STOIIP": [0.4, None, None],
+    }
+
+
+def _errors(report: ColumnarValidationReport) -> dict[tuple[str, str], list[Any]]:
+    return {(e.column, e.type): e.rows.to_pylist() for e in report.errors}
+
+
+def test_inplace_volumes_validate_columns_valid(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """A valid table validates columnar and row-wise."""
+    InplaceVolumesResult.model_validate(pa.table(inplace_volumes_table).to_pylist())
+    report = InplaceVolumesResult.validate_columns(pa.table(inplace_volumes_table))
+    assert report.is_valid
+    assert report.num_rows == 3
+
+
+def test_inplace_volumes_validate_columns_from_numpy(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """A dict of NumPy arrays is accepted."""
+    data = {k: np.array(v) for k, v in inplace_volumes_table.items()}
+    data["HCPV"] = np.array([0.5, 1.0, 1.5])
+    data["STOIIP"] = np.array([0.4, 0.0, 0.0])
+    assert InplaceVolumesResult.validate_columns(data).is_valid
+
+
+def test_inplace_volumes_validate_columns_missing_required(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """Columns from InplaceVolumes.required_columns() must be present."""
+    del inplace_volumes_table["BULK"]
+    del inplace_volumes_table["HCPV"]
+    report = InplaceVolumesResult.validate_columns(inplace_volumes_table)
+    assert _errors(report) == {("BULK", "missing"): [], ("HCPV", "missing"): []}
+
+
+def test_inplace_volumes_validate_columns_reports_rows(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """Invalid values are reported with their row indices."""
+    inplace_volumes_table["FLUID"] = ["oil", "condensate", "water"]
+    inplace_volumes_table["BULK"] = [-1.0, 20.0, float("nan")]
+    inplace_volumes_table["ZONE"] = ["Valysar", None, "Volon"]
+    inplace_volumes_table["STOIIP"] = [0.4, -0.1, None]
+    report = InplaceVolumesResult.validate_columns(inplace_volumes_table)
+    assert _errors(report) == {
+        ("FLUID", "enum"): [1],
+        ("ZONE", "null"): [1],
+        ("BULK", "greater_than_equal"): [0, 2],
+        ("STOIIP", "greater_than_equal"): [1],
+    }
+
+
+def test_inplace_volumes_validate_columns_dtype(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """Columns with the wrong dtype are reported."""
+    inplace_volumes_table["NET"] = ["5", "10", "15"]
+    inplace_volumes_table["REGION"] = [1, 2, 3]
+    report = InplaceVolumesResult.validate_columns(inplace_volumes_table)
+    assert _errors(report) == {("REGION", "dtype"): [], ("NET", "dtype"): []}
+
+
+def test_inplace_volumes_validate_columns_dictionary_encoded(
+    inplace_volumes_table: dict[str, Any],
+) -> None:
+    """Dictionary encoded index columns are validated by their values."""
+    table = pa.table(inplace_volumes_table)
+    fluid = table.column("FLUID").dictionary_encode()
+    table = table.set_column(0, "FLUID", fluid)
+    assert InplaceVolumesResult.validate_columns(table).is_valid
+
+    bad_fluid = pa.chunked_array([pa.array(["oil", "oil", "brine"])])
+    table = table.set_column(0, "FLUID", bad_fluid.dictionary_encode())
+    report = InplaceVolumesResult.validate_columns(table)
+    assert _errors(report) == {("FLUID", "enum"): [2]}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ErtObservationsBreakthroughResult,
+        ErtObservationsRftResult,
+        ErtObservationsSummaryResult,
+        FieldOutlineResult,
+        FluidContactOutlineResult,
+        InplaceVolumesResult,
+        SimulatorFipregionsMappingResult,
+        StratigraphyMappingResult,
+        StructureDepthFaultLinesResult,
+    ],
+)
+def test_compile_plan_for_all_row_based_standard_results(
+    model: type[BaseModel],
+) -> None:
+    """Every standard result holding a list of rows compiles into a plan, with a
+    check per field."""
+    plan = compile_plan(model)
+    assert plan is compile_plan(model)
+    (row_annotation,) = get_args(model.model_fields["root"].annotation)
+    assert plan.model is row_annotation
+    assert [c.name for c in plan.columns] == list(row_annotation.model_fields)
+
+
+def test_compile_plan_derives_checks_from_fields() -> None:
+    """Field annotations and constraints are compiled into column checks."""
+    plan = compile_plan(InplaceVolumesResult)
+    assert plan.is_complete
+    assert plan.column("FLUID") == ColumnCheck(
+        name="FLUID",
+        kind=ColumnKind.string,
+        required=True,
+        nullable=False,
+        values=("oil", "gas", "water"),
+    )
+    assert plan.column("HCPV") == ColumnCheck(
+        name="HCPV",
+        kind=ColumnKind.number,
+        required=False,
+        nullable=True,
+        bounds=(Bound("greater_than_equal", 0.0),),
+    )
+    assert compile_plan(FieldOutlineResult).column("POLY_ID").kind == "integer"
+
+    with pytest.raises(KeyError, match="No column 'BULK'"):
+        compile_plan(FieldOutlineResult).column("BULK")
+
+
+def test_compile_plan_flags_models_with_validators() -> None:
+    """Custom validators are not part of the plan, which is marked incomplete."""
+    assert not compile_plan(StratigraphyMappingResult).is_complete
+
+
+def test_compile_plan_rejects_non_tabular_models() -> None:
+    """Only root models holding a list of rows can be compiled."""
+    with pytest.raises(TypeError, match="is not a list of rows"):
+        compile_plan(ErtParametersResult)
+
+
+def test_validate_table_field_outline() -> None:
+    """Integer columns must have an integer dtype and respect their bounds."""
+    table = {
+        "X_UTME": [1.0, 2.0, 3.0],
+        "Y_UTMN": [1.0, 2.0, 3.0],
+        "Z_TVDSS": [1.0, 2.0, 3.0],
+        "POLY_ID": [0, -1, 1],
+    }
+    report = validate_table(FieldOutlineResult, table)
+    assert _errors(report) == {("POLY_ID", "greater_than_equal"): [1]}
+
+    table["POLY_ID"] = [0.0, 1.0, 1.0]
+    report = validate_table(FieldOutlineResult, table)
+    assert _errors(report) == {("POLY_ID", "dtype"): []}
+
+
+def test_validate_table_datetime_and_uuid_columns() -> None:
+    """Datetime and UUID columns are validated by dtype and value."""
+    summary = {
+        "response_key": ["FOPR"],
+        "time": pa.array([0], type=pa.timestamp("ms")),
+        "observation_value": [1.0],
+        "observation_error": [0.1],
+    }
+    assert validate_table(ErtObservationsSummaryResult, summary).is_valid
+
+    summary["time"] = pa.array([0.0])
+    report = validate_table(ErtObservationsSummaryResult, summary)
+    assert _errors(report) == {("time", "dtype"): []}
+
+    summary = {
+        "response_key": ["FOPR"] * 5,
+        "time": [
+            "2020-01-01T00:00:00",
+            "2020-01-01",
+            "2020-13-01",
+            None,
+            "not a datetime",
+        ],
+        "observation_value": [1.0] * 5,
+        "observation_error": [0.1] * 5,
+    }
+    report = validate_table(ErtObservationsSummaryResult, summary)
+    assert _errors(report) == {
+        ("time", "null"): [3],
+        ("time", "datetime_parsing"): [2, 4],
+    }
+    summary["time"] = ["2020-01-01T00:00:00Z", "1577836800", "2020-01-01", None, None]
+    report = validate_table(ErtObservationsSummaryResult, summary)
+    assert _errors(report) == {("time", "null"): [3, 4]}
+
+    mapping = {
+        "source_system": ["rms", "rms"],
+        "target_system": ["smda", "smda"],
+        "relation_type": ["primary", "alias"],
+        "source_id": ["TopVolantis", "TopVOLANTIS"],
+        "target_id": ["VOLANTIS GP. Top", "VOLANTIS GP. Top"],
+        "target_uuid": [str(uuid4()), "not-a-uuid"],
+    }
+    report = validate_table(StratigraphyMappingResult, mapping)
+    assert _errors(report) == {("target_uuid", "uuid_parsing"): [1]}
+
+
+@pytest.mark.parametrize(
+    "result, schema",
+    [
+        (model, getattr(standard_results, model.__name__.replace("Result", "Schema")))
+        for model in (
+            ErtObservationsBreakthroughResult,
+            ErtObservationsRftResult,
+            ErtObservationsSummaryResult,
+            FieldOutlineResult,
+            FluidContactOutlineResult,
+            InplaceVolumesResult,
+            SimulatorFipregionsMappingResult,
+            StratigraphyMappingResult,
+            StructureDepthFaultLinesResult,
+        )
+    ],
+)
+def test_arrow_schema_for_all_row_based_standard_results(
+    result: type[BaseModel], schema: Any
+) -> None:
+    """Every row based standard result schema has a cached Arrow schema with a
+    field per column, nullable only if optional."""
+    arrow = schema.arrow_schema()
+    assert arrow is schema.arrow_schema()
+    plan = compile_plan(result)
+    assert arrow.names == [c.name for c in plan.columns]
+    for check in plan.columns:
+        assert arrow.field(check.name).nullable == check.nullable
+
+
+def test_arrow_schema_types(inplace_volumes_table: dict[str, Any]) -> None:
+    """Index columns and enumerations are dictionary encoded, and a table of the
+    schema is valid."""
+    schema = standard_results.InplaceVolumesSchema.arrow_schema()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    for name in ("FLUID", "ZONE", "REGION", "FACIES"):
+        assert schema.field(name).type == dictionary
+    assert schema.field("BULK").type == pa.float64()
+    assert not schema.field("BULK").nullable
+    assert schema.field("HCPV").nullable
+
+    rows = pa.table(inplace_volumes_table).to_pylist()
+    table = pa.Table.from_pylist(rows, schema=schema)
+    assert validate_table(InplaceVolumesResult, table).is_valid
+
+    assert arrow_schema(FieldOutlineResult).field("POLY_ID").type == pa.int64()
+    summary = standard_results.ErtObservationsSummarySchema.arrow_schema()
+    assert summary.field("time").type == pa.timestamp("us")
+    assert summary.field("response_key").type == dictionary
+    mapping = standard_results.StratigraphyMappingSchema.arrow_schema()
+    assert mapping.field("relation_type").type == dictionary
+    assert mapping.field("source_id").type == pa.string()
@@ -0,0 +1,58 @@
+from copy import deepcopy
+from typing import get_args
+
+import pytest
+
+from fmu.datamodels import FmuResults
+from fmu.datamodels.fmu_results.data import AnyData, SeismicData, VolumesData
+from fmu.datamodels.fmu_results.dispatch import Leaf, resolve, tables
+from fmu.datamodels.fmu_results.fmu_results import CaseMetadata, ObjectMetadata
+from fmu.datamodels.fmu_results.standard_result import (
+    AnyStandardResult,
+    InplaceVolumesStandardResult,
+)
+
+
+def test_tables_cover_all_union_members() -> None:
+    """Every member of the tagged unions can be dispatched to."""
+    metadata, data, standard_result = tables()
+    assert set(metadata.values()) == set(
+        get_args(FmuResults.model_fields["root"].annotation)
+    )
+    assert set(data.values()) == set(get_args(AnyData.model_fields["root"].annotation))
+    assert set(standard_result.values()) == set(
+        get_args(AnyStandardResult.model_fields["root"].annotation)
+    )
+    assert metadata["surface"] is ObjectMetadata
+    assert data["volumes"] is VolumesData
+    assert standard_result["inplace_volumes"] is InplaceVolumesStandardResult
+
+
+def test_resolve(
+    case_metadata: dict, seismic_metadata: dict, volumes_metadata: dict
+) -> None:
+    """The concrete models are resolved from the tags of the payload."""
+    assert resolve(case_metadata) == Leaf(CaseMetadata)
+    assert resolve(seismic_metadata) == Leaf(ObjectMetadata, SeismicData)
+
+    payload = deepcopy(volumes_metadata)
+    payload["data"]["standard_result"] = {"name": "inplace_volumes"}
+    assert resolve(payload) == Leaf(
+        ObjectMetadata, VolumesData, InplaceVolumesStandardResult
+    )
+
+
+def test_resolve_unknown_tags(volumes_metadata: dict) -> None:
+    """Missing and unknown tags raise a ValueError naming the tag."""
+    with pytest.raises(ValueError, match="Unknown 'class' None, expected one of"):
+        resolve({})
+
+    payload = deepcopy(volumes_metadata)
+    payload["data"]["content"] = "unknown"
+    with pytest.raises(ValueError, match="Unknown 'data.content' 'unknown'"):
+        resolve(payload)
+
+    payload = deepcopy(volumes_metadata)
+    payload["data"]["standard_result"] = {"name": ["unhashable"]}
+    with pytest.raises(ValueError, match="Unknown 'data.standard_result.name'"):
+        resolve(payload)
@@ -0,0 +1,185 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from fmu.datamodels.standard_results.ert_distributions import ParameterDistributions
+from fmu.datamodels.standard_results.ert_parameters import (
+    ErtParameterColumn,
+    ErtParametersResult,
+)
+
+CONTINUOUS: dict[str, dict[str, Any]] = {
+    "UNIFORM": {"distribution": "uniform", "min": -1.0, "max": 3.0},
+    "LOGUNIF": {"distribution": "logunif", "min": 0.01, "max": 10.0},
+    "NORMAL": {"distribution": "normal", "mean": 2.0, "std": 0.5},
+    "LOGNORMAL": {"distribution": "lognormal", "mean": 0.5, "std": 0.3},
+    "TRIANGULAR": {"distribution": "triangular", "min": 0.0, "max": 3.0, "mode": 1.0},
+    "ERRF": {
+        "distribution": "errf",
+        "min": 1.0,
+        "max": 2.0,
+        "skewness": 0.5,
+        "width": 2.0,
+    },
+    "PERT": {
+        "distribution": "pert",
+        "min": 0.0,
+        "max": 10.0,
+        "mode": 2.0,
+        "scale": 4.0,
+    },
+    "RAW": {"distribution": "raw"},
+}
+
+DISCRETE: dict[str, dict[str, Any]] = {
+    "DUNIF": {"distribution": "dunif", "min": 1.0, "max": 2.0, "steps": 5},
+    "DERRF": {
+        "distribution": "derrf",
+        "min": 0.0,
+        "max": 1.0,
+        "skewness": -1.0,
+        "width": 1.5,
+        "steps": 4.0,
+    },
+}
+
+
+def _distributions(parameters: dict[str, dict[str, Any]]) -> ParameterDistributions:
+    return ParameterDistributions.from_result(
+        ErtParametersResult.model_validate(
+            {
+                name: {
+                    "type": "float64",
+                    "metadata": {"group": "G", "input_source": "sampled", **value},
+                }
+                for name, value in parameters.items()
+            }
+        )
+    )
+
+
+def test_transform_like_ert() -> None:
+    """The normal scores are transformed like Ert transforms them."""
+    distributions = _distributions(
+        {
+            **CONTINUOUS,
+            **DISCRETE,
+            "CONST": {"distribution": "const", "value": 4.0},
+            "TRUNC": {
+                "distribution": "truncated_normal",
+                "min": 0.0,
+                "max": 1.0,
+                "mean": 0.5,
+                "std": 1.0,
+            },
+        }
+    )
+    scores = np.array([[-1.0], [0.0], [1.0]]) * np.ones(distributions.num_parameters)
+    values = dict(
+        zip(distributions.names, distributions.transform(scores).T, strict=True)
+    )
+
+    cdf = stats.norm.cdf([-1.0, 0.0, 1.0])
+    np.testing.assert_allclose(values["UNIFORM"], -1.0 + 4.0 * cdf)
+    np.testing.assert_allclose(values["LOGUNIF"], 0.01 * 1000.0**cdf)
+    np.testing.assert_allclose(values["NORMAL"], [1.5, 2.0, 2.5])
+    np.testing.assert_allclose(values["LOGNORMAL"], np.exp([0.2, 0.5, 0.8]))
+    np.testing.assert_allclose(values["TRUNC"], [0.0, 0.5, 1.0])
+    np.testing.assert_allclose(values["RAW"], [-1.0, 0.0, 1.0])
+    np.testing.assert_allclose(values["CONST"], [4.0, 4.0, 4.0])
+    np.testing.assert_allclose(values["DUNIF"], [1.0, 1.5, 2.0])
+    np.testing.assert_allclose(
+        values["ERRF"], 1.0 + stats.norm.cdf(np.array([-0.5, 0.5, 1.5]) / 2.0)
+    )
+    # The triangular mode is at the probability 1/3
+    assert values["TRIANGULAR"][0] < 1.0 < values["TRIANGULAR"][1]
+
+
+def test_derrf_like_ert() -> None:
+    """Discrete error function values are binned like Ert bins them."""
+    distributions = _distributions({"DERRF": DISCRETE["DERRF"]})
+    scores = np.linspace(-4, 4, 101)[:, np.newaxis]
+
+    y = stats.norm(loc=0, scale=1.5).cdf(scores[:, 0] - 1.0)
+    bins = np.digitize(y, np.linspace(0, 1, 5)[1:], right=True)
+    expected = np.linspace(0, 1, 4)[bins]
+    np.testing.assert_allclose(distributions.transform(scores)[:, 0], expected)
+
+
+def test_cdf_inverts_transform() -> None:
+    """The distribution function of transformed scores is their normal
+    probability."""
+    distributions = _distributions(CONTINUOUS)
+    scores = np.random.default_rng(0).standard_normal((50, len(CONTINUOUS)))
+    values = distributions.transform(scores)
+    np.testing.assert_allclose(
+        distributions.cdf(values), stats.norm.cdf(scores), atol=1e-9
+    )
+
+
+def test_pdf_is_derivative_of_cdf() -> None:
+    """The densities integrate to the distribution functions."""
+    distributions = _distributions(CONTINUOUS)
+    scores = np.linspace(-3, 3, 2001)[:, np.newaxis] * np.ones(len(CONTINUOUS))
+    values = distributions.transform(scores)
+    pdf = distributions.pdf(values)
+    cdf = distributions.cdf(values)
+    for i, name in enumerate(distributions.names):
+        integral = np.trapezoid(pdf[:, i], values[:, i])
+        assert integral == pytest.approx(cdf[-1, i] - cdf[0, i], rel=1e-3), name
+
+
+def test_discrete_probabilities() -> None:
+    """The probabilities of the steps sum to one, and match the sampled
+    frequencies."""
+    distributions = _distributions(DISCRETE)
+    samples = distributions.sample(100_000, rng=1)
+    for i, parameter in enumerate(DISCRETE.values()):
+        steps = np.linspace(parameter["min"], parameter["max"], int(parameter["steps"]))
+        values = np.zeros((len(steps), len(DISCRETE)))
+        values[:, i] = steps
+        probabilities = distributions.pdf(values)[:, i]
+        assert probabilities.sum() == pytest.approx(1.0)
+        np.testing.assert_allclose(
+            distributions.cdf(values)[:, i], np.cumsum(probabilities)
+        )
+
+        frequencies = [np.mean(np.isclose(samples[:, i], step)) for step in steps]
+        np.testing.assert_allclose(frequencies, probabilities, atol=0.01)
+    assert distributions.pdf([[1.1, 0.5]]).tolist() == [[0.0, 0.0]]
+
+
+def test_sample() -> None:
+    """Samples have a column per parameter, within the bounds, and are reproducible
+    from a seed."""
+    distributions = _distributions(CONTINUOUS)
+    samples = distributions.sample(1000, rng=42)
+    assert samples.shape == (1000, len(CONTINUOUS))
+    np.testing.assert_array_equal(samples, distributions.sample(1000, rng=42))
+
+    uniform = samples[:, distributions.names.index("UNIFORM")]
+    assert uniform.min() >= -1.0
+    assert uniform.max() <= 3.0
+
+
+def test_values_must_have_all_parameters() -> None:
+    """Values must have the parameters along the last axis."""
+    distributions = ParameterDistributions(
+        {
+            "A": ErtParameterColumn.model_validate(
+                {
+                    "type": "float64",
+                    "metadata": {
+                        "group": "G",
+                        "input_source": "sampled",
+                        **CONTINUOUS["NORMAL"],
+                    },
+                }
+            ).metadata
+        }
+    )
+    assert distributions.cdf([2.0]).tolist() == [0.5]
+    with pytest.raises(ValueError, match="last axis"):
+        distributions.cdf([[1.0, 2.0]])
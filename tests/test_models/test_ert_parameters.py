@@ -1,5 +1,6 @@
 import pyarrow as pa
 import pytest
+from pydantic import ValidationError
 
 from fmu.datamodels.standard_results.ert_parameters import (
     ConstParameter,
@@ -8,6 +9,7 @@ from fmu.datamodels.standard_results.ert_parameters import (
     ErrfParameter,
     ErtDistribution,
     ErtParameterMetadata,
+    ErtParametersResult,
     LogNormalParameter,
     LogUnifParameter,
     NormalParameter,
@@ -114,3 +116,107 @@ def test_from_pa_metadata_roundtrip(
     assert field.metadata is not None
     from_dist = parameter_class.from_pa_metadata(field.metadata)
     assert dist == from_dist
+
+
+@pytest.fixture
+def ert_parameters() -> ErtParametersResult:
+    return ErtParametersResult.model_validate(
+        {
+            "SEED": {
+                "type": "int64",
+                "metadata": {
+                    "group": "GLOBVAR",
+                    "input_source": "sampled",
+                    "distribution": "dunif",
+                    "min": 0.0,
+                    "max": 1.0,
+                    "steps": 100,
+                },
+            },
+            "MULT": {
+                "type": "float64",
+                "metadata": {
+                    "group": "MULTFLT",
+                    "input_source": "sampled",
+                    "distribution": "normal",
+                    "mean": 1.0,
+                    "std": 0.1,
+                },
+            },
+            'DESIGN "A"': {
+                "type": "string",
+                "metadata": {
+                    "group": "DESIGN_MATRIX",
+                    "input_source": "design_matrix",
+                    "distribution": "raw",
+                },
+            },
+        }
+    )
+
+
+def test_pa_schema_roundtrip(ert_parameters: ErtParametersResult) -> None:
+    """The schema has the column metadata of each parameter, and is read back."""
+    schema = ert_parameters.to_pa_schema()
+    assert schema.names == ert_parameters.all_column_names()
+    assert schema.types == [pa.int64(), pa.int64(), pa.float64(), pa.string()]
+    for name, column in ert_parameters.root.items():
+        assert schema.field(name).metadata == column.metadata.to_pa_metadata()
+
+    assert ErtParametersResult.from_pa_schema(schema) == ert_parameters
+
+
+def test_from_pa_schema_invalid(ert_parameters: ErtParametersResult) -> None:
+    """Invalid column types and metadata are reported per column."""
+    schema = ert_parameters.to_pa_schema()
+    schema = schema.set(1, schema.field(1).with_type(pa.float32()))
+    with pytest.raises(ValidationError, match="SEED.type"):
+        ErtParametersResult.from_pa_schema(schema)
+
+    schema = ert_parameters.to_pa_schema()
+    schema = schema.set(
+        2, schema.field(2).with_metadata({b"distribution": b'"normal"'})
+    )
+    with pytest.raises(ValidationError, match="MULT.metadata.normal.group"):
+        ErtParametersResult.from_pa_schema(schema)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {b"mean": b"1.0", b"std": b"0.1"},
+        {b"mean": b" 1.0 ", b"std": b"1e-1"},
+        {b"mean": b"NaN", b"std": b"0.1"},
+        {b"mean": b'1.0,"std":0.1'},
+        {b"mean": b'1.0}, "X": {"type": "int64"', b"std": b"0.1"},
+        {b'mean":1.0,"std': b"0.1"},
+        {b"mean": b'"1.\\u0030"', b"std": b"0.1"},
+        {b"mean": b"1.0", b"std": b"0.1,"},
+    ],
+)
+def test_from_pa_schema_reads_values_like_from_pa_metadata(
+    ert_parameters: ErtParametersResult, values: dict[bytes, bytes]
+) -> None:
+    """Each metadata value is read on its own, so the schema of the table is read
+    like the metadata of each column, and values cannot spill into other keys."""
+    schema = ert_parameters.to_pa_schema()
+    metadata = {
+        b"group": b'"MULTFLT"',
+        b"input_source": b'"sampled"',
+        b"distribution": b'"normal"',
+        **values,
+    }
+    schema = schema.set(
+        2, schema.field(2).with_metadata({k: v for k, v in metadata.items()})
+    )
+
+    try:
+        expected = NormalParameter.from_pa_metadata(metadata)
+    except ValueError:
+        with pytest.raises(ValueError):
+            ErtParametersResult.from_pa_schema(schema)
+    else:
+        result = ErtParametersResult.from_pa_schema(schema)
+        assert result.root["MULT"].metadata.model_dump() == pytest.approx(
+            expected.model_dump(), nan_ok=True
+        )
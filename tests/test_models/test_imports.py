@@ -0,0 +1,90 @@
+"""Tests that importing the package does not import the models eagerly."""
+
+import subprocess
+import sys
+
+import pytest
+
+import fmu.datamodels as models
+from fmu.datamodels import standard_results
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Runs code in a fresh interpreter and returns the fmu modules it imported."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport sys\n"
+            "print('\\n'.join(m for m in sys.modules if m.startswith('fmu.')))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import fmu.datamodels",
+        "from fmu.datamodels import Masterdata, SchemaBase",
+        "from fmu.datamodels.standard_results.enums import InplaceVolumes",
+        "from fmu.datamodels.standard_results import StandardResultName",
+    ],
+)
+def test_import_does_not_import_models(code: str) -> None:
+    """The FMU results and standard result models are not imported eagerly."""
+    modules = _imported_modules(code)
+    assert "fmu.datamodels.fmu_results.fmu_results" not in modules
+    assert "fmu.datamodels.fmu_results.data" not in modules
+    assert "fmu.datamodels.standard_results.inplace_volumes" not in modules
+
+
+def test_import_on_access() -> None:
+    """Accessing a model imports only the modules it needs."""
+    modules = _imported_modules(
+        "from fmu.datamodels import InplaceVolumesResult\nInplaceVolumesResult"
+    )
+    assert "fmu.datamodels.standard_results.inplace_volumes" in modules
+    assert "fmu.datamodels.fmu_results.fmu_results" not in modules
+
+
+@pytest.mark.parametrize("package", [models, standard_results])
+def test_lazy_exports(package: object) -> None:
+    """All names in __all__ can be accessed and are listed by dir()."""
+    for name in package.__all__:  # type: ignore[attr-defined]
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import fmu.datamodels\nfmu.datamodels.fmu_results.FmuResults",
+        "import fmu.datamodels\nfmu.datamodels.standard_results.StandardResultName",
+        "import fmu.datamodels\nfmu.datamodels.common.Masterdata",
+        "import fmu.datamodels.standard_results as s\ns.inplace_volumes",
+    ],
+)
+def test_submodule_access(code: str) -> None:
+    """Submodules are imported when accessed as attributes of their package."""
+    _imported_modules(code)
+
+
+def test_lazy_exports_are_all() -> None:
+    """The lazily exported names are exactly those in __all__."""
+    assert models.__all__ == list(models._LAZY_EXPORTS)
+    assert set(standard_results.__all__) == {
+        *standard_results._LAZY_EXPORTS,
+        "StandardResultName",
+    }
+
+
+def test_unknown_attribute_raises() -> None:
+    """Accessing an unknown name raises an AttributeError."""
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        models.Unknown  # noqa: B018
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        standard_results.unknown  # noqa: B018
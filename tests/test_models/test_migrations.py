@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import re
+from copy import deepcopy
+from uuid import uuid4
+
+import pytest
+
+from fmu.datamodels import FmuResults, FmuResultsSchema
+from fmu.datamodels.fmu_results.migrations import (
+    MIGRATIONS,
+    Duplicate,
+    Migration,
+    Remove,
+    Rename,
+    ReplaceValue,
+    migrations,
+    upgrade,
+    upgrade_stream,
+)
+from fmu.datamodels.fmu_results.versions import VersionRegistry
+
+
+def _downgrade(metadata: dict) -> dict:
+    """Returns metadata as it would have been written at version 0.8.0."""
+    old = deepcopy(metadata)
+    old["version"] = "0.8.0"
+    old["$schema"] = old["$schema"].replace(FmuResultsSchema.VERSION, "0.8.0")
+    if "ensemble" in old.get("fmu", {}):
+        old["fmu"]["iteration"] = old["fmu"].pop("ensemble")
+    if "standard_result" in old.get("data", {}):
+        old["data"]["product"] = old["data"].pop("standard_result")
+    return old
+
+
+def test_migrations_cover_changelog() -> None:
+    """Tests that there is a migration to every version in the changelog."""
+    changelog = re.findall(r"#### (\d+\.\d+\.\d+)", FmuResultsSchema.VERSION_CHANGELOG)
+    assert [m.version for m in MIGRATIONS] == sorted(
+        set(changelog) - {"0.8.0"}, key=lambda v: tuple(map(int, v.split(".")))
+    )
+    assert MIGRATIONS[-1].version == FmuResultsSchema.VERSION
+
+
+def test_migrations_between_versions() -> None:
+    """Tests the migrations selected, and the errors of unknown versions."""
+    assert [m.version for m in migrations("0.15.0", "0.16.1")] == [
+        "0.15.1",
+        "0.16.0",
+        "0.16.1",
+    ]
+    assert migrations(FmuResultsSchema.VERSION) == ()
+    with pytest.raises(ValueError, match="Unknown version '0.8.1'"):
+        migrations("0.8.1")
+    with pytest.raises(ValueError, match="Cannot downgrade from version 0.10.0"):
+        migrations("0.10.0", "0.9.0")
+
+
+def test_operations() -> None:
+    """Tests each operation, including documents without the fields."""
+    documents: list[dict] = [
+        {"a": {"b": 1, "c": "x"}},
+        {"a": {"b": 2, "d": 3}},
+        {"a": "not an object"},
+        {},
+    ]
+    Rename("a.b", "e.f").apply(documents)
+    Duplicate("a.c", "a.g").apply(documents)
+    Remove("a.d").apply(documents)
+    ReplaceValue("a.c", "x", "y").apply(documents)
+    assert documents == [
+        {"a": {"c": "y", "g": "x"}, "e": {"f": 1}},
+        {"a": {}, "e": {"f": 2}},
+        {"a": "not an object"},
+        {},
+    ]
+
+    with pytest.raises(ValueError, match="different parents"):
+        Duplicate("a.b", "c.b")
+
+
+def test_migration_sets_version() -> None:
+    """Tests that the version and the URL of the schema are updated."""
+    document = {"version": "0.8.0", "$schema": FmuResultsSchema.prod_url()}
+    document["$schema"] = document["$schema"].replace(FmuResultsSchema.VERSION, "0.8.0")
+    Migration("0.9.0").apply([document])
+    assert document == {
+        "version": "0.9.0",
+        "$schema": FmuResultsSchema.prod_url().replace(
+            FmuResultsSchema.VERSION, "0.9.0"
+        ),
+    }
+
+
+def test_upgrade_mixed_versions(
+    case_metadata: dict, seismic_metadata: dict, volumes_metadata: dict
+) -> None:
+    """Tests that documents of mixed versions are upgraded in place, in order, to
+    valid documents of the current version."""
+    intermediate = _downgrade(volumes_metadata)
+    Migration("0.9.0", MIGRATIONS[0].operations).apply([intermediate])
+    documents = [
+        _downgrade(seismic_metadata),
+        deepcopy(case_metadata),
+        intermediate,
+        _downgrade(case_metadata),
+    ]
+
+    assert upgrade(documents) is documents
+    assert documents == [
+        seismic_metadata,
+        case_metadata,
+        volumes_metadata,
+        case_metadata,
+    ]
+    assert VersionRegistry().validate_many(documents) == [None] * 4
+    for document in documents:
+        FmuResults.model_validate(document)
+
+
+def test_upgrade_stream_batches(seismic_metadata: dict) -> None:
+    """Tests that a stream is upgraded in batches, in order."""
+    old = _downgrade(seismic_metadata)
+    old["fmu"]["iteration"] = {"name": "iter-0", "uuid": str(uuid4())}
+    documents = [{**deepcopy(old), "index": i} for i in range(5)]
+    upgraded = list(upgrade_stream(iter(documents), "0.10.0", batch_size=2))
+    assert [d["index"] for d in upgraded] == list(range(5))
+    assert all(d["version"] == "0.10.0" for d in upgraded)
+    assert upgraded[0]["fmu"]["ensemble"] == upgraded[0]["fmu"]["iteration"]
+
+
+def test_upgrade_rejects_later_versions(case_metadata: dict) -> None:
+    """Tests that documents later than the target are not downgraded."""
+    with pytest.raises(ValueError, match="Cannot downgrade"):
+        upgrade([deepcopy(case_metadata)], "0.9.0")
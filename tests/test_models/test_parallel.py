@@ -0,0 +1,90 @@
+import json
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from fmu.datamodels.fmu_results.fmu_results import CaseMetadata
+from fmu.datamodels.parallel import validate_files
+from fmu.datamodels.validators import registry
+
+
+@pytest.fixture
+def metadata_files(
+    tmp_path: Path, case_metadata: dict, volumes_metadata: dict
+) -> list[Path]:
+    pytest.importorskip("yaml")
+    invalid = deepcopy(volumes_metadata)
+    invalid["fmu"]["case"]["uuid"] = "not a uuid"
+
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"realization-{i}" / ".volumes.csv.yml"
+        path.parent.mkdir()
+        # JSON is valid YAML
+        path.write_text(json.dumps(invalid if i == 3 else volumes_metadata))
+        paths.append(path)
+
+    path = tmp_path / "case.json"
+    path.write_text(json.dumps(case_metadata))
+    paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_validate_files(metadata_files: list[Path], max_workers: int) -> None:
+    """Results are returned in input order, with errors for the invalid file."""
+    results = list(validate_files(metadata_files, max_workers=max_workers, chunksize=3))
+    assert [r.path for r in results] == metadata_files
+    assert [i for i, r in enumerate(results) if not r.is_valid] == [3]
+    assert results[3].errors[0]["type"] == "uuid_parsing"
+    assert results[3].errors[0]["loc"][-3:] == ("fmu", "case", "uuid")
+    assert "input" not in results[3].errors[0]
+    assert all(r.model is None for r in results)
+
+
+def test_validate_files_return_models(metadata_files: list[Path]) -> None:
+    """Validated models can be sent back from the workers."""
+    results = list(
+        validate_files(
+            metadata_files[-1:], name="CaseMetadata", max_workers=2, return_models=True
+        )
+    )
+    assert isinstance(results[0].model, CaseMetadata)
+
+
+def test_validate_files_unreadable_and_malformed(tmp_path: Path) -> None:
+    """Files that cannot be read or parsed are reported."""
+    pytest.importorskip("yaml")
+    malformed_yaml = tmp_path / "malformed.yml"
+    malformed_yaml.write_text("a: [")
+    malformed_json = tmp_path / "malformed.json"
+    malformed_json.write_text("{")
+
+    results = list(
+        validate_files(
+            [tmp_path / "missing.yml", malformed_yaml, malformed_json], max_workers=1
+        )
+    )
+    assert [r.errors[0]["type"] for r in results] == [
+        "file_not_readable",
+        "yaml_invalid",
+        "json_invalid",
+    ]
+    assert not any("input" in r.errors[0] for r in results)
+
+
+def test_validate_files_unknown_schema() -> None:
+    """An unknown schema fails before any worker is started."""
+    with pytest.raises(KeyError, match="unknown"):
+        next(validate_files([], name="unknown"))
+    with pytest.raises(KeyError, match="version 0.0.0"):
+        next(validate_files([], version="0.0.0"))
+
+
+def test_validate_files_does_not_build_validator(mocker: MockerFixture) -> None:
+    """The validator is only built by the workers, not by this process."""
+    get = mocker.spy(registry, "get")
+    assert list(validate_files([], max_workers=2)) == []
+    get.assert_not_called()
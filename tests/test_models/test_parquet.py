@@ -0,0 +1,311 @@
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from fmu.datamodels.fmu_results.attribute_specification import (
+    PorosityAttributeSpecification,
+)
+from fmu.datamodels.fmu_results.enums import PropertyAttribute
+from fmu.datamodels.standard_results import (
+    ErtObservationsSummaryResult,
+    FieldOutlineResult,
+    InplaceVolumesResult,
+)
+from fmu.datamodels.standard_results.columnar import Bound, attribute_bounds
+from fmu.datamodels.standard_results.enums import InplaceVolumes, SimulatorTables
+from fmu.datamodels.standard_results.parquet import (
+    StreamingValidator,
+    check_parquet_schema,
+    validate_parquet,
+    validate_parquet_row_groups,
+)
+
+
+@pytest.fixture
+def inplace_volumes_parquet(tmp_path: Path) -> Path:
+    num_rows = 1000
+    table = pa.table(
+        {
+            "FLUID": ["oil", "gas", "water", "oil"] * (num_rows // 4),
+            "ZONE": ["Valysar"] * num_rows,
+            "REGION": ["WestLowland"] * num_rows,
+            "BULK": [float(i) for i in range(num_rows)],
+            "NET": [1.0] * num_rows,
+            "PORV": [1.0] * num_rows,
+            "HCPV": pa.array([None] * num_rows, type=pa.float64()),
+        }
+    )
+    path = tmp_path / "volumes.parquet"
+    pq.write_table(table, path, row_group_size=256)
+    return path
+
+
+def test_validate_parquet_valid(inplace_volumes_parquet: Path) -> None:
+    """A valid file validates in multiple batches."""
+    summary = validate_parquet(
+        InplaceVolumesResult,
+        inplace_volumes_parquet,
+        batch_size=100,
+        required_columns=InplaceVolumes.required_columns(),
+    )
+    assert summary.is_valid
+    assert summary.num_rows == 1000
+    assert summary.num_batches >= 10
+    assert summary.num_invalid_batches == 0
+
+
+def test_streaming_validator_reports_absolute_rows(
+    inplace_volumes_parquet: Path,
+) -> None:
+    """Row indices in the batch reports are relative to the start of the file."""
+    table = pq.read_table(inplace_volumes_parquet)
+    bulk = table.column("BULK").to_pylist()
+    bulk[5] = -1.0
+    bulk[950] = -1.0
+    table = table.set_column(3, "BULK", pa.array(bulk))
+    pq.write_table(table, inplace_volumes_parquet)
+
+    validator = StreamingValidator(InplaceVolumesResult)
+    reports = list(validator.iter_parquet(inplace_volumes_parquet, batch_size=100))
+
+    invalid = [r for r in reports if not r.is_valid]
+    assert [r.offset for r in invalid] == [0, 900]
+    assert [e.rows.to_pylist() for r in invalid for e in r.errors] == [[5], [950]]
+    assert validator.summary.num_invalid_batches == 2
+    assert validator.summary.error_counts == {("BULK", "greater_than_equal"): 2}
+
+
+def test_streaming_validator_counts_missing_columns(tmp_path: Path) -> None:
+    """A missing column counts every row of every batch as invalid."""
+    path = tmp_path / "summary.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "response_key": ["FOPR"] * 10,
+                "observation_value": [1.0] * 10,
+                "observation_error": [0.1] * 10,
+            }
+        ),
+        path,
+    )
+    summary = validate_parquet(ErtObservationsSummaryResult, path, batch_size=3)
+    assert not summary.is_valid
+    assert summary.num_batches == 4
+    assert summary.error_counts == {("time", "missing"): 10}
+
+
+def test_streaming_validator_reports_no_known_columns_once(tmp_path: Path) -> None:
+    """A file with none of the columns of the model is reported once from its
+    schema, with every row invalid."""
+    path = tmp_path / "unknown.parquet"
+    pq.write_table(pa.table({"A": list(range(10))}), path)
+    validator = StreamingValidator(ErtObservationsSummaryResult)
+    reports = list(validator.iter_parquet(path, batch_size=3))
+    assert len(reports) == 1
+    assert reports[0].num_rows == 10
+    assert [e.type for e in reports[0].errors] == ["missing"] * 4
+    assert validator.summary.num_rows == 10
+    assert validator.summary.num_invalid_batches == 1
+    assert validator.summary.error_counts[("time", "missing")] == 10
+
+
+def test_streaming_validator_iter_batches() -> None:
+    """Record batches from any source can be validated."""
+    batches = [
+        pa.record_batch({"response_key": ["A"], "time": [None]}),
+        pa.record_batch({"response_key": [None], "time": [None]}),
+    ]
+    validator = StreamingValidator(ErtObservationsSummaryResult)
+    reports = list(validator.iter_batches(batches))
+    assert [(e.column, e.type) for e in reports[1].errors][:2] == [
+        ("observation_value", "missing"),
+        ("observation_error", "missing"),
+    ]
+    assert validator.summary.error_counts[("response_key", "null")] == 1
+    assert validator.summary.error_counts[("time", "null")] == 2
+
+
+def test_check_parquet_schema_valid(inplace_volumes_parquet: Path) -> None:
+    """A file with the expected columns passes the check of its footer."""
+    report = check_parquet_schema(
+        inplace_volumes_parquet,
+        InplaceVolumesResult,
+        InplaceVolumes.required_columns(),
+    )
+    assert report.is_valid
+    assert report.num_rows == 1000
+
+
+def test_check_parquet_schema_reads_footer_only(tmp_path: Path) -> None:
+    """Missing and mistyped columns are found without reading any row data."""
+    path = tmp_path / "outline.parquet"
+    table = pa.table(
+        {
+            "X_UTME": [1.0] * 1000,
+            "y_utmn": [1.0] * 1000,
+            "Z_TVDSS": [1.0] * 1000,
+            "POLY_ID": [float(i) for i in range(1000)],
+        }
+    )
+    pq.write_table(table, path, compression="none")
+
+    # Corrupt the row data, leaving the footer intact
+    data = bytearray(path.read_bytes())
+    footer = int.from_bytes(data[-8:-4], "little") + 8
+    data[4 : len(data) - footer] = bytes(len(data) - footer - 4)
+    path.write_bytes(data)
+    with pytest.raises(OSError):
+        pq.read_table(path)
+
+    report = check_parquet_schema(path, FieldOutlineResult)
+    assert [(e.column, e.type) for e in report.errors] == [
+        ("Y_UTMN", "missing"),
+        ("POLY_ID", "dtype"),
+    ]
+    assert report.num_rows == 1000
+
+
+def test_check_parquet_schema_without_model(tmp_path: Path) -> None:
+    """Tables with no row model are checked against their required columns."""
+    path = tmp_path / "pvt.parquet"
+    pq.write_table(pa.table({"PVTNUM": [1], "VALUE": [1.0]}), path)
+    report = check_parquet_schema(
+        path, required_columns=SimulatorTables.PvtColumns.index_columns()
+    )
+    assert [(e.column, e.type) for e in report.errors] == [("KEYWORD", "missing")]
+
+
+def test_validate_parquet_row_groups_reads_footer_only(tmp_path: Path) -> None:
+    """Row groups proven valid by their statistics are skipped without reading
+    any row data."""
+    path = tmp_path / "outline.parquet"
+    table = pa.table(
+        {
+            "X_UTME": [1.0] * 1000,
+            "Y_UTMN": [1.0] * 1000,
+            "Z_TVDSS": [1.0] * 1000,
+            "POLY_ID": list(range(1000)),
+        }
+    )
+    pq.write_table(table, path, compression="none", row_group_size=250)
+
+    # Corrupt the row data, leaving the footer intact
+    data = bytearray(path.read_bytes())
+    footer = int.from_bytes(data[-8:-4], "little") + 8
+    data[4 : len(data) - footer] = bytes(len(data) - footer - 4)
+    path.write_bytes(data)
+
+    summary = validate_parquet_row_groups(path, FieldOutlineResult)
+    assert summary.is_valid
+    assert summary.num_rows == 1000
+    assert summary.num_batches == summary.num_skipped_batches == 4
+
+
+def test_validate_parquet_row_groups_decodes_inconclusive(
+    inplace_volumes_parquet: Path,
+) -> None:
+    """Only row groups not proven valid by their statistics are read, and the
+    errors are the same as when validating every batch."""
+    table = pq.read_table(inplace_volumes_parquet).sort_by("FLUID")
+    bulk = table.column("BULK").to_pylist()
+    bulk[600] = -1.0
+    table = table.set_column(3, "BULK", pa.array(bulk))
+    pq.write_table(table, inplace_volumes_parquet, row_group_size=250)
+
+    summary = validate_parquet_row_groups(
+        inplace_volumes_parquet,
+        InplaceVolumesResult,
+        InplaceVolumes.required_columns(),
+        check_nan=False,
+    )
+    assert summary.error_counts == {("BULK", "greater_than_equal"): 1}
+    assert summary.num_batches == 4
+    assert summary.num_invalid_batches == 1
+    assert summary.num_skipped_batches == 3
+
+    # NaN is not in the statistics, so floating point columns are read by default
+    summary = validate_parquet_row_groups(inplace_volumes_parquet, InplaceVolumesResult)
+    assert summary.num_skipped_batches == 0
+    assert (
+        summary.error_counts
+        == validate_parquet(InplaceVolumesResult, inplace_volumes_parquet).error_counts
+    )
+
+
+def test_validate_parquet_row_groups_attribute_bounds(tmp_path: Path) -> None:
+    """Columns are checked against the range of their attribute specification."""
+    specification = PorosityAttributeSpecification(attribute=PropertyAttribute.porosity)
+    bounds = {"PORO": attribute_bounds(specification)}
+    path = tmp_path / "poro.parquet"
+    pq.write_table(
+        pa.table({"PORO": [0.1, 0.3, 0.2, 1.5, float("nan"), 0.2]}),
+        path,
+        row_group_size=2,
+    )
+
+    summary = validate_parquet_row_groups(path, bounds=bounds, check_nan=False)
+    assert summary.error_counts == {("PORO", "less_than_equal"): 1}
+    assert summary.num_skipped_batches == 2
+
+    summary = validate_parquet_row_groups(path, bounds=bounds)
+    assert summary.error_counts == {
+        ("PORO", "less_than_equal"): 2,
+        ("PORO", "greater_than_equal"): 1,
+    }
+    assert summary.num_skipped_batches == 0
+
+
+def test_validate_parquet_row_groups_check_nan_columns(tmp_path: Path) -> None:
+    """Only the floating point columns given are checked for NaN."""
+    path = tmp_path / "poro.parquet"
+    pq.write_table(
+        pa.table({"PORO": [0.1, 0.2, 0.3, 0.4], "NTG": [0.5, 0.5, float("nan"), 0.5]}),
+        path,
+        row_group_size=2,
+    )
+    bounds = {
+        "PORO": [Bound("greater_than_equal", 0.0)],
+        "NTG": [Bound("greater_than_equal", 0.0)],
+    }
+
+    summary = validate_parquet_row_groups(path, bounds=bounds, check_nan=["NTG"])
+    assert summary.error_counts == {("NTG", "greater_than_equal"): 1}
+    assert summary.num_skipped_batches == 0
+
+    # The NaN of NTG is not found if only PORO is checked for NaN
+    summary = validate_parquet_row_groups(path, bounds=bounds, check_nan=["PORO"])
+    assert summary.is_valid
+    assert summary.num_skipped_batches == 0
+
+    summary = validate_parquet_row_groups(path, bounds=bounds, check_nan=[])
+    assert summary.num_skipped_batches == 2
+
+
+def test_validate_parquet_row_groups_parses_datetime_strings(tmp_path: Path) -> None:
+    """Datetimes stored as strings are read and parsed, while timestamps are
+    proven valid by their statistics."""
+    path = tmp_path / "summary.parquet"
+    table = pa.table(
+        {
+            "response_key": ["FOPR"] * 4,
+            "time": ["2020-01-01", "2020-01-02", "2020-13-01", "2020-01-04"],
+            "observation_value": [1.0] * 4,
+            "observation_error": [0.1] * 4,
+        }
+    )
+    pq.write_table(table, path, row_group_size=2)
+    summary = validate_parquet_row_groups(
+        path, ErtObservationsSummaryResult, check_nan=False
+    )
+    assert summary.error_counts == {("time", "datetime_parsing"): 1}
+    assert summary.num_skipped_batches == 0
+
+    table = table.set_column(1, "time", pa.array([0, 1, 2, 3], type=pa.timestamp("ms")))
+    pq.write_table(table, path, row_group_size=2)
+    summary = validate_parquet_row_groups(
+        path, ErtObservationsSummaryResult, check_nan=False
+    )
+    assert summary.is_valid
+    assert summary.num_skipped_batches == 2
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from copy import deepcopy
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from fmu.datamodels import FmuResults, FmuResultsSchema
+from fmu.datamodels.fmu_results.fmu_results import CaseMetadata, ObjectMetadata
+from fmu.datamodels.fmu_results.projection import (
+    contractual_model,
+    model_members,
+    project,
+    project_json,
+)
+
+
+def _get(value: Any, keys: list[str]) -> Any:
+    for index, key in enumerate(keys):
+        if isinstance(value, list):
+            return [_get(item, keys[index:]) for item in value]
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def test_project_matches_full_model(any_metadata: dict) -> None:
+    """Tests that the record has the contractual fields of the full model."""
+    metadata = any_metadata
+    dumped = FmuResults.model_validate(metadata).model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    )
+    expected = {
+        path: _get(dumped, path.split(".")) for path in FmuResultsSchema.CONTRACTUAL
+    }
+
+    record = project(metadata)
+    assert record == expected
+    assert list(record) == FmuResultsSchema.CONTRACTUAL
+    assert project_json(json.dumps(metadata).encode()) == record
+
+
+def test_project_json_buffers(volumes_metadata: dict) -> None:
+    """Tests that records are extracted from memory views of raw JSON."""
+    data = json.dumps(volumes_metadata).encode()
+    record = project_json(memoryview(data))
+    assert record["data.content"] == "volumes"
+    assert record["data.spec.columns"] == volumes_metadata["data"]["spec"]["columns"]
+    assert record["tracklog.event"] == ["created"]
+    assert record["data.standard_result.name"] is None
+
+
+def test_project_validates_contractual_fields_only(volumes_metadata: dict) -> None:
+    """Tests that only the contractual fields are validated."""
+    metadata = deepcopy(volumes_metadata)
+    metadata["data"]["spec"]["num_rows"] = -1
+    with pytest.raises(ValidationError):
+        FmuResults.model_validate(metadata)
+    assert project(metadata)["data.spec.columns"]
+
+    metadata["data"]["content"] = "nope"
+    with pytest.raises(ValidationError, match=r"data\.content"):
+        project(metadata)
+
+
+def test_contractual_model_is_cached() -> None:
+    """Tests that the reduced model is built once and has the contractual fields."""
+    model = contractual_model()
+    assert contractual_model() is model
+    assert {field.alias for field in model.model_fields.values()} == {
+        path.split(".")[0] for path in FmuResultsSchema.CONTRACTUAL
+    }
+    assert model.model_fields["class_"].is_required()
+    assert not model.model_fields["data"].is_required()
+
+
+def test_model_members() -> None:
+    """Unions, lists and root models are looked through to the models in them."""
+    is_list, members = model_members(FmuResults)
+    assert not is_list
+    assert members[:2] == [CaseMetadata, ObjectMetadata]
+    assert model_members(list[CaseMetadata] | None) == (True, [CaseMetadata])
+    assert model_members(int | str) == (False, [])
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import types
+from copy import deepcopy
+from typing import Any
+
+import pytest
+
+import fmu.datamodels as models
+from fmu.datamodels import FmuResultsSchema
+from fmu.datamodels.schema_compiler import (
+    SchemaValidationError,
+    compile_schema,
+    generate_source,
+)
+
+
+@pytest.fixture(scope="module")
+def fmu_results_validator() -> Any:
+    return compile_schema(FmuResultsSchema.dump())
+
+
+@pytest.mark.parametrize("schema", models.schemas)
+def test_compile_all_schemas(schema: type[models.SchemaBase]) -> None:
+    """Tests that the schemas of this package can be compiled."""
+    assert compile_schema(schema.dump()).source
+
+
+def test_compiled_fmu_results_valid(
+    fmu_results_validator: Any, any_metadata: dict
+) -> None:
+    """Tests that valid metadata is valid against the compiled schema."""
+    assert fmu_results_validator.first_error(any_metadata) is None
+    fmu_results_validator.validate(any_metadata)
+
+
+def test_compiled_fmu_results_errors(
+    fmu_results_validator: Any, volumes_metadata: dict
+) -> None:
+    """Tests that the first violation is reported with its path."""
+    metadata = deepcopy(volumes_metadata)
+    metadata["fmu"]["case"]["uuid"] = 3
+    with pytest.raises(SchemaValidationError, match=r"\$\.fmu\.case\.uuid: 3 is not"):
+        fmu_results_validator.validate(metadata)
+
+    metadata = deepcopy(volumes_metadata)
+    del metadata["data"]["name"]
+    assert fmu_results_validator.first_error(metadata) == (
+        ("data",),
+        "'name' is a required property",
+    )
+
+
+def test_compiled_fmu_results_discriminators(
+    fmu_results_validator: Any, volumes_metadata: dict
+) -> None:
+    """Tests that unknown tags of the discriminated unions are reported as such,
+    rather than as a mismatch against every member."""
+    metadata = deepcopy(volumes_metadata)
+    metadata["class"] = "nope"
+    path, message = fmu_results_validator.first_error(metadata)
+    assert path == ("class",)
+    assert message.startswith("'nope' is not one of ['case', ")
+
+    metadata = deepcopy(volumes_metadata)
+    metadata["data"]["content"] = "nope"
+    path, message = fmu_results_validator.first_error(metadata)
+    assert path == ("data", "content")
+    assert "'volumes'" in message
+
+    metadata = deepcopy(volumes_metadata)
+    metadata["data"]["standard_result"] = {"name": "nope"}
+    path, _ = fmu_results_validator.first_error(metadata)
+    assert path == ("data", "standard_result", "name")
+
+
+@pytest.mark.parametrize(
+    "schema, valid, invalid",
+    [
+        ({"type": "integer"}, [1, 1.0], [True, 1.5, "1"]),
+        ({"type": ["string", "null"]}, ["a", None], [1, []]),
+        ({"const": "a"}, ["a"], ["b", None]),
+        ({"const": 1}, [1, 1.0], [True, "1"]),
+        ({"const": True}, [True], [1, 1.0]),
+        ({"const": [1, {"a": False}]}, [[1.0, {"a": False}]], [[True, {"a": 0}]]),
+        ({"enum": ["a", 1]}, ["a", 1], ["b", [1], True]),
+        ({"enum": [False, None]}, [False, None], [0, 0.0]),
+        ({"minimum": 0, "exclusiveMaximum": 2}, [0, 1.5, "x"], [-1, 2]),
+        ({"minLength": 2, "pattern": "^a"}, ["ab", 1], ["a", "ba"]),
+        ({"minItems": 1, "items": {"type": "string"}}, [["a"], {}], [[], [1]]),
+        (
+            {"properties": {"a": {"type": "string"}}, "additionalProperties": False},
+            [{}, {"a": "x"}],
+            [{"a": 1}, {"b": 1}],
+        ),
+        (
+            {"additionalProperties": {"type": "string"}},
+            [{"a": "x"}],
+            [{"a": 1}],
+        ),
+        (
+            {"dependencies": {"a": ["b"], "b": {"not": {"required": ["c"]}}}},
+            [{}, {"a": 1, "b": 1}, {"c": 1}],
+            [{"a": 1}, {"b": 1, "c": 1}],
+        ),
+        (
+            {"if": {"required": ["a"]}, "then": {"required": ["b"]}},
+            [{}, {"a": 1, "b": 1}],
+            [{"a": 1}],
+        ),
+        ({"anyOf": [{"type": "string"}, {"minimum": 2}]}, ["a", 3], [1]),
+        ({"oneOf": [{"type": "string"}, {"minLength": 2}]}, ["a", 1], ["ab"]),
+        ({"allOf": [{"type": "number"}, {"maximum": 1}]}, [1], [2, "a"]),
+        (True, [1, None], []),
+        ({"title": "Annotations only", "format": "uuid"}, ["not a uuid"], []),
+    ],
+)
+def test_keywords(schema: Any, valid: list[Any], invalid: list[Any]) -> None:
+    """Tests the validation of each supported keyword."""
+    validator = compile_schema({"properties": {"value": schema}})
+    for value in valid:
+        assert validator.is_valid({"value": value}), value
+    for value in invalid:
+        assert not validator.is_valid({"value": value}), value
+
+
+def test_recursive_references() -> None:
+    """Tests that a subschema referring to itself is compiled once."""
+    validator = compile_schema(
+        {
+            "$defs": {
+                "Node": {
+                    "properties": {"children": {"items": {"$ref": "#/$defs/Node"}}},
+                    "required": ["name"],
+                }
+            },
+            "$ref": "#/$defs/Node",
+        }
+    )
+    assert validator.source.count("def _s") == 2
+    assert validator.is_valid({"name": "a", "children": [{"name": "b"}]})
+    assert validator.first_error({"name": "a", "children": [{"children": []}]}) == (
+        ("children", 0),
+        "'name' is a required property",
+    )
+
+
+def test_error_paths() -> None:
+    """Tests that paths include object keys and array indices."""
+    validator = compile_schema(
+        {"properties": {"a": {"items": {"properties": {"b": {"type": "string"}}}}}}
+    )
+    assert validator.first_error({"a": [{"b": "x"}, {"b": 1}]}) == (
+        ("a", 1, "b"),
+        "1 is not of type 'string'",
+    )
+
+
+def test_discriminated_one_of_matches_members() -> None:
+    """Tests that a discriminated oneOf only validates the member of the tag, and
+    falls back to trying every member without a tag."""
+    schema = {
+        "$defs": {
+            "A": {"properties": {"kind": {"const": "a"}, "x": {"type": "string"}}},
+            "B": {"properties": {"kind": {"enum": ["b", "c"]}, "x": {"type": "null"}}},
+        },
+        "discriminator": {"propertyName": "kind"},
+        "oneOf": [{"$ref": "#/$defs/A"}, {"$ref": "#/$defs/B"}],
+    }
+    validator = compile_schema(schema)
+    assert validator.is_valid({"kind": "a", "x": "x"})
+    assert validator.is_valid({"kind": "c", "x": None})
+    assert validator.first_error({"kind": "b", "x": "x"}) == (
+        ("x",),
+        "'x' is not of type 'null'",
+    )
+    assert validator.first_error({"kind": "d"}) == (
+        ("kind",),
+        "'d' is not one of ['a', 'b', 'c']",
+    )
+    assert validator.is_valid({"x": None})
+    assert not validator.is_valid({"x": 1})
+
+
+def test_generated_source_is_standalone(volumes_metadata: dict) -> None:
+    """Tests that the generated module can be used on its own."""
+    module = types.ModuleType("fmu_results")
+    exec(generate_source(FmuResultsSchema.dump()), module.__dict__)
+
+    assert module.is_valid(volumes_metadata)
+    with pytest.raises(module.SchemaValidationError, match=r"^\$: 'masterdata' is a"):
+        module.validate({"class": "case"})
+
+
+def test_unsupported_schemas() -> None:
+    """Tests that schemas that cannot be compiled faithfully are rejected."""
+    with pytest.raises(ValueError, match="Unsupported keywords: \\['uniqueItems'\\]"):
+        compile_schema({"properties": {"a": {"uniqueItems": True}}})
+    with pytest.raises(ValueError, match="Only local references"):
+        compile_schema({"$ref": "https://example.com/schema.json"})
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"minLength": "__import__('os').getpid()"},
+        {"maxItems": "1 or print('x')"},
+        {"minItems": True},
+        {"maxLength": -1},
+        {"minimum": "0 or print('x')"},
+        {"maximum": float("inf")},
+    ],
+)
+def test_invalid_keyword_values(schema: dict[str, Any]) -> None:
+    """Tests that keyword values are checked, not written into the source."""
+    with pytest.raises(ValueError, match="must be a"):
+        compile_schema({"properties": {"a": schema}})
+
+
+def test_schema_id_is_escaped() -> None:
+    """Tests that the schema id is written as a literal."""
+    schema_id = '"""\nraise RuntimeError("executed")\n"""'
+    validator = compile_schema({"$id": schema_id, "minLength": 1.0})
+    namespace: dict[str, Any] = {}
+    exec(validator.source, namespace)
+    assert namespace["SCHEMA_ID"] == schema_id
+    assert not validator.is_valid("")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from fmu.datamodels import FmuResults
+from fmu.datamodels.fmu_results.tabular import (
+    categorical_paths,
+    iter_tables,
+    to_table,
+    write_parquet,
+)
+
+
+def _get(document: dict[str, Any], path: str) -> Any:
+    value: Any = document
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def test_categorical_paths() -> None:
+    """Tests that enumerations and literals of all models are found."""
+    paths = categorical_paths()
+    assert {"class", "data.content", "data.format", "fmu.context.stage"} <= paths
+    assert "data.name" not in paths
+
+
+def test_to_table(all_metadata: list[dict[str, Any]]) -> None:
+    """Tests that documents of mixed classes become a row each, with a column per
+    dotted path."""
+    table = to_table(all_metadata)
+    assert table.num_rows == len(all_metadata)
+    for path in ("class", "data.content", "data.bbox.xmin", "data.spec.nrow"):
+        assert table.column(path).to_pylist() == [_get(d, path) for d in all_metadata]
+
+    for path in ("class", "data.content", "data.format"):
+        assert pa.types.is_dictionary(table.schema.field(path).type)
+    assert pa.types.is_string(table.schema.field("data.name").type)
+    assert pa.types.is_list(table.schema.field("tracklog").type)
+
+
+def test_to_table_batches(all_metadata: list[dict[str, Any]]) -> None:
+    """Tests that the table is the same however the documents are batched, and
+    that models are exported as their dumps."""
+    expected = to_table(all_metadata).to_pylist()
+    assert to_table(iter(all_metadata), batch_size=1).to_pylist() == expected
+
+    models = [FmuResults.model_validate(d) for d in all_metadata]
+    dumped = [
+        m.model_dump(mode="json", by_alias=True, exclude_none=True) for m in models
+    ]
+    assert to_table(models, batch_size=3).to_pylist() == to_table(dumped).to_pylist()
+
+    # Each batch has the columns of all of its documents, not only the first
+    batch = next(iter_tables(all_metadata))
+    assert "data.content" in batch.column_names
+
+
+def test_to_table_promotes_numbers() -> None:
+    """Tests that integers and floats of a field in different batches are
+    combined."""
+    table = to_table([{"a": {"b": 1}}, {"a": {"b": 1.5}, "c": "x"}], batch_size=1)
+    assert table.schema.field("a.b").type == pa.float64()
+    assert table.to_pydict() == {"a.b": [1.0, 1.5], "c": [None, "x"]}
+    assert to_table([]).num_rows == 0
+
+
+def test_write_parquet(all_metadata: list[dict[str, Any]], tmp_path: Path) -> None:
+    """Tests that the table is written to Parquet with its dictionary columns."""
+    path = tmp_path / "metadata.parquet"
+    write_parquet(all_metadata, path)
+    table = pq.read_table(path)
+    assert table.num_rows == len(all_metadata)
+    assert pa.types.is_dictionary(table.schema.field("data.content").type)
+    assert table.column("fmu.case.uuid").to_pylist() == [
+        _get(d, "fmu.case.uuid") for d in all_metadata
+    ]
@@ -0,0 +1,217 @@
+import gc
+import json
+import mmap
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+import fmu.datamodels as models
+from fmu.datamodels import validators
+from fmu.datamodels._schema_base import SchemaBase
+from fmu.datamodels.fmu_results.fmu_results import CaseMetadata, ObjectMetadata
+from fmu.datamodels.validators import (
+    ValidatorRegistry,
+    get_adapter,
+    registry,
+    validate_json,
+    validate_many,
+)
+
+
+@pytest.mark.parametrize("schema", models.schemas)
+def test_all_schemas_have_a_registered_validator(schema: type[SchemaBase]) -> None:
+    """Every exposed schema has a validator registered by its name and version."""
+    name = schema.FILENAME.removesuffix(".json")
+    assert registry.versions(name) == [schema.VERSION]
+
+
+def test_get_adapter_validates(case_metadata: dict, volumes_metadata: dict) -> None:
+    """Validators for the FMU results schema and its root models validate."""
+    assert isinstance(
+        get_adapter("fmu_results").validate_python(case_metadata), models.FmuResults
+    )
+    assert isinstance(
+        get_adapter("CaseMetadata").validate_python(case_metadata), CaseMetadata
+    )
+    assert isinstance(
+        get_adapter("ObjectMetadata", models.FmuResultsSchema.VERSION).validate_python(
+            volumes_metadata
+        ),
+        ObjectMetadata,
+    )
+
+
+def test_get_adapter_is_cached() -> None:
+    """Validators are built once and their build time recorded."""
+    adapter = get_adapter("inplace_volumes")
+    assert get_adapter("inplace_volumes") is adapter
+    assert get_adapter("InplaceVolumesResult") is not adapter
+    key = ("inplace_volumes", models.InplaceVolumesSchema.VERSION)
+    assert registry.build_times()[key] >= 0.0
+
+
+def test_get_adapter_unknown_raises() -> None:
+    """Unknown names and versions raise a KeyError."""
+    with pytest.raises(KeyError, match="No validator registered for 'unknown'"):
+        get_adapter("unknown")
+    with pytest.raises(KeyError, match="'fmu_results' version 0.0.1"):
+        get_adapter("fmu_results", "0.0.1")
+
+
+def test_validator_registry_versions_and_build() -> None:
+    """Validators are built lazily, newest version by default."""
+
+    class Old(BaseModel):
+        a: int
+
+    class New(BaseModel):
+        b: int
+
+    built = []
+
+    def new() -> type[BaseModel]:
+        built.append(New)
+        return New
+
+    validators = ValidatorRegistry()
+    validators.register("table", "0.10.0", new)
+    validators.register("table", "0.9.0", lambda: Old)
+    assert validators.versions("table") == ["0.9.0", "0.10.0"]
+    assert built == []
+
+    assert isinstance(validators.get("table").validate_python({"b": 1}), New)
+    assert isinstance(validators.get("table", "0.9.0").validate_python({"a": 1}), Old)
+    assert list(validators.build_times()) == [("table", "0.10.0"), ("table", "0.9.0")]
+
+    validators.get("table")
+    assert len(built) == 1
+    validators.clear()
+    assert validators.build_times() == {}
+    validators.warm()
+    assert len(built) == 2
+
+
+def test_validate_many(case_metadata: dict, volumes_metadata: dict) -> None:
+    """Valid models are returned in input order with their indices."""
+    result = validate_many([case_metadata, volumes_metadata, case_metadata])
+    assert result.is_valid
+    assert result.indices == [0, 1, 2]
+    assert [type(m.root) for m in result.models] == [
+        CaseMetadata,
+        ObjectMetadata,
+        CaseMetadata,
+    ]
+
+
+def test_validate_many_isolates_errors(
+    case_metadata: dict, volumes_metadata: dict
+) -> None:
+    """An invalid item is reported by its index and does not fail the others."""
+    invalid = deepcopy(volumes_metadata)
+    del invalid["data"]
+    result = validate_many(
+        [case_metadata, invalid, volumes_metadata, {"class": "unknown"}]
+    )
+    assert not result.is_valid
+    assert result.indices == [0, 2]
+    assert list(result.errors) == [1, 3]
+    assert ("data",) in [e["loc"][1:] for e in result.errors[1]]
+    assert result.errors[3][0]["type"] == "union_tag_invalid"
+
+
+def test_validate_many_json(case_metadata: dict, volumes_metadata: dict) -> None:
+    """JSON documents and dictionaries can be mixed."""
+    invalid = deepcopy(volumes_metadata)
+    invalid["fmu"]["case"]["uuid"] = "not a uuid"
+    result = validate_many(
+        [
+            json.dumps(volumes_metadata).encode(),
+            case_metadata,
+            json.dumps(invalid),
+            bytearray(json.dumps(case_metadata).encode()),
+        ]
+    )
+    assert result.indices == [0, 1, 3]
+    assert list(result.errors) == [2]
+    assert result.errors[2][0]["type"] == "uuid_parsing"
+
+
+def test_validate_many_malformed_json(case_metadata: dict) -> None:
+    """Documents that are not a single valid JSON value are reported."""
+    document = json.dumps(case_metadata).encode()
+    result = validate_many([document, b"{", document, document + b"," + document, b""])
+    assert result.indices == [0, 2]
+    assert list(result.errors) == [1, 3, 4]
+    assert {e[0]["type"] for e in result.errors.values()} == {"json_invalid"}
+
+
+def test_validate_many_fragments(case_metadata: dict) -> None:
+    """Malformed documents are invalid even if they join into valid JSON."""
+    first, *rest = case_metadata.items()
+    head = json.dumps(dict([first]))[:-1]
+    tail = json.dumps(dict(rest))[1:]
+    document = f"{head}, {tail}"
+    assert json.loads(document) == case_metadata
+
+    result = validate_many([f"{document},{head}", tail])
+    assert not result.models
+    assert list(result.errors) == [0, 1]
+    assert {e[0]["type"] for e in result.errors.values()} == {"json_invalid"}
+
+
+def test_validate_many_pause_gc(case_metadata: dict) -> None:
+    """The garbage collector is only paused on request, and is enabled again
+    when the last of overlapping pauses ends."""
+    assert gc.isenabled()
+    assert validate_many([case_metadata], pause_gc=True).is_valid
+    assert gc.isenabled()
+
+    with validators._gc_paused():
+        with validators._gc_paused():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_validate_many_model_name(case_metadata: dict) -> None:
+    """Items can be validated against any registered model."""
+    result = validate_many([case_metadata], name="CaseMetadata")
+    assert result.is_valid
+    assert isinstance(result.models[0], CaseMetadata)
+
+
+def test_validate_json(tmp_path: Path, case_metadata: dict) -> None:
+    """Raw JSON is validated from any buffer."""
+    document = json.dumps(case_metadata).encode()
+    path = tmp_path / "case.json"
+    path.write_bytes(document)
+
+    assert isinstance(validate_json("fmu_results", document), models.FmuResults)
+    assert isinstance(
+        validate_json("CaseMetadata", memoryview(document)[0:]), CaseMetadata
+    )
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert isinstance(validate_json("CaseMetadata", m), CaseMetadata)
+    with pytest.raises(ValidationError, match="json_invalid"):
+        validate_json("CaseMetadata", b"{")
+
+
+def test_from_json_bytes(
+    tmp_path: Path, case_metadata: dict, volumes_metadata: dict
+) -> None:
+    """The FMU results and standard result root models validate raw JSON."""
+    path = tmp_path / "case.json"
+    path.write_text(json.dumps(case_metadata))
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert models.FmuResults.from_json_bytes(m) == models.FmuResults.model_validate(
+            case_metadata
+        )
+
+    row = {"FLUID": "oil", "ZONE": "A", "REGION": "B", "BULK": 1, "NET": 1, "PORV": 1}
+    rows = memoryview(json.dumps([row]).encode())
+    result = models.InplaceVolumesResult.from_json_bytes(rows)
+    assert result.root[0].BULK == 1.0
+    with pytest.raises(TypeError, match="Expected raw JSON, got 'dict'"):
+        models.FmuResults.from_json_bytes(volumes_metadata)  # type: ignore[arg-type]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+
+from fmu.datamodels import FmuResultsSchema
+from fmu.datamodels.fmu_results.versions import VersionRegistry
+
+
+@pytest.fixture(scope="module")
+def registry() -> VersionRegistry:
+    return VersionRegistry()
+
+
+def test_versions(registry: VersionRegistry) -> None:
+    """Tests that all published versions are found, oldest first."""
+    versions = registry.versions()
+    assert versions[0] == "0.8.0"
+    assert versions[-1] == FmuResultsSchema.VERSION
+    assert versions.index("0.9.0") < versions.index("0.10.0")
+
+
+def test_version_of(registry: VersionRegistry, case_metadata: dict) -> None:
+    """Tests that the version is read from 'version', or else from '$schema'."""
+    assert registry.version_of(case_metadata) == FmuResultsSchema.VERSION
+
+    metadata = deepcopy(case_metadata)
+    del metadata["version"]
+    metadata["$schema"] = FmuResultsSchema.prod_url().replace(
+        FmuResultsSchema.VERSION, "0.9.0"
+    )
+    assert registry.version_of(metadata) == "0.9.0"
+
+    del metadata["$schema"]
+    with pytest.raises(ValueError, match="Cannot determine the schema version"):
+        registry.version_of(metadata)
+
+
+def test_first_error(registry: VersionRegistry, case_metadata: dict) -> None:
+    """Tests that documents are validated against the schema of their version."""
+    assert registry.first_error(case_metadata) is None
+
+    # The ensemble class was added in 0.10.0
+    metadata = deepcopy(case_metadata)
+    metadata["class"] = "ensemble"
+    metadata["version"] = "0.8.0"
+    error = registry.first_error(metadata)
+    assert error is not None and error[0] == ("class",)
+
+    metadata["version"] = "99.0.0"
+    with pytest.raises(ValueError, match="No fmu_results.json of version '99.0.0'"):
+        registry.first_error(metadata)
+    metadata["version"] = "../0.8.0"
+    with pytest.raises(ValueError, match="expected one of: 0.8.0, 0.9.0"):
+        registry.first_error(metadata)
+
+
+def test_validate_many(case_metadata: dict, volumes_metadata: dict) -> None:
+    """Tests that documents of mixed versions are validated in input order, with
+    each validator compiled once even if only one is kept."""
+    registry = VersionRegistry(maxsize=1)
+    old = deepcopy(case_metadata)
+    old["class"] = "ensemble"
+    old["version"] = "0.8.0"
+    unknown = deepcopy(case_metadata)
+    unknown["version"] = "99.0.0"
+    unversioned = deepcopy(case_metadata)
+    del unversioned["version"], unversioned["$schema"]
+
+    errors = registry.validate_many(
+        [case_metadata, old, volumes_metadata, unknown, old, unversioned]
+    )
+
+    assert errors[0] is None
+    assert errors[1] is not None and errors[1][0] == ("class",)
+    assert errors[2] is None
+    assert errors[3] is not None and errors[3][0] == ("version",)
+    assert errors[4] == errors[1]
+    assert errors[5] is not None and errors[5][0] == ("version",)
+    info = registry.validator.cache_info()
+    assert (info.misses, info.currsize) == (3, 1)
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import gc
+import json
+import pickle
+import sys
+from copy import deepcopy
 from pathlib import Path
+from typing import Any
 
 import pytest
+from pytest import MonkeyPatch
 
 import fmu.datamodels as models
-from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH, SchemaBase
+from fmu.datamodels import FmuResultsSchema
+from fmu.datamodels._schema_base import (
+    FMU_SCHEMAS_PATH,
+    GenerateJsonSchemaBase,
+    SchemaBase,
+    drop_discriminator_mapping,
+    drop_format_path,
+    drop_keys,
+    transform_schema,
+)
 
 
 def test_schemabase_validates_class_vars() -> None:
@@ -106,7 +121,109 @@ def test_schemabase_all_subclasses_in_exposed_schemas_list() -> None:
     # Make sure test classes are removed as subclasses of SchemaBase
     gc.collect()
 
-    schemas = SchemaBase.__subclasses__()
+    # Accessing the list imports all schemas
     exposed_schemas = models.schemas
+    schemas = SchemaBase.__subclasses__()
     assert len(schemas) == len(exposed_schemas)
     assert set(schemas) == set(exposed_schemas)
+
+
+def test_schemabase_dump_is_cached(monkeypatch: MonkeyPatch) -> None:
+    """The schema is generated once per version and URL."""
+    calls = []
+
+    class A(SchemaBase):
+        VERSION: str = "0.1.0"
+        VERSION_CHANGELOG: str = "### 0.1.0"
+        FILENAME: str = "a.json"
+        PATH: Path = FMU_SCHEMAS_PATH / "test"
+
+        @classmethod
+        def dump(cls) -> dict[str, Any]:
+            calls.append(cls.url())
+            return {"$id": cls.url(), "required": ["a"], "$defs": {"A": {}}}
+
+    monkeypatch.delenv("DEV_SCHEMA", raising=False)
+    schema = A.dump()
+    assert A.dump() is schema
+    assert calls == [A.prod_url()]
+
+    monkeypatch.setenv("DEV_SCHEMA", "1")
+    assert A.dump()["$id"] == A.dev_url()
+    assert calls == [A.prod_url(), A.dev_url()]
+
+    A.clear_dump_cache()
+    assert A.dump() is not schema
+    assert len(calls) == 3
+
+
+def test_schemabase_dump_is_immutable() -> None:
+    """The cached schema cannot be mutated, but copies of it can."""
+    schema = FmuResultsSchema.dump()
+    with pytest.raises(TypeError, match="'FrozenSchemaDict' is immutable"):
+        schema["$id"] = "changed"
+    with pytest.raises(TypeError, match="'FrozenSchemaDict' is immutable"):
+        schema["$defs"].pop("Timestamp")
+    with pytest.raises(TypeError, match="'FrozenSchemaList' is immutable"):
+        schema["$contractual"].append("changed")
+
+    mutable = deepcopy(schema)
+    assert type(mutable) is dict
+    assert type(mutable["$contractual"]) is list
+    assert mutable == schema
+    mutable["$contractual"].append("changed")
+    assert "changed" not in FmuResultsSchema.dump()["$contractual"]
+
+    assert type(pickle.loads(pickle.dumps(schema))) is dict
+    assert json.loads(json.dumps(schema)) == schema
+
+
+def test_transform_schema_single_pass() -> None:
+    """All transforms are applied to every object, including in arrays."""
+    schema = {
+        "$id": "a",
+        "discriminator": {"propertyName": "b", "mapping": {"b": "#/$defs/B"}},
+        "properties": {"path": {"type": "string", "format": "path"}},
+        "oneOf": [{"$id": "c", "format": "date"}, [{"format": "path"}], "d"],
+    }
+    result = transform_schema(
+        schema, [drop_discriminator_mapping, drop_format_path, drop_keys("$id")]
+    )
+    assert result is schema
+    assert schema == {
+        "discriminator": {"propertyName": "b"},
+        "properties": {"path": {"type": "string"}},
+        "oneOf": [{"format": "date"}, [{}], "d"],
+    }
+
+
+def test_transform_schema_visits_objects_before_members() -> None:
+    """Members removed by a transform are not visited."""
+    visited = []
+    transform_schema(
+        {"a": {"b": {}}, "c": {}},
+        [lambda node: visited.append(sorted(node)), drop_keys("a")],
+    )
+    assert visited == [["a", "c"], []]
+
+
+def test_transform_schema_deeply_nested() -> None:
+    """Deeply nested schemas do not exhaust the recursion limit."""
+    schema: dict[str, Any] = {}
+    node = schema
+    for _ in range(10 * sys.getrecursionlimit()):
+        node["items"] = {"format": "path"}
+        node = node["items"]
+    transform_schema(schema, [drop_format_path])
+    assert node == {}
+
+
+def test_generate_json_schema_base_static_methods() -> None:
+    """remove_discriminator_mapping works in place, remove_format_path on a copy."""
+    schema = {"discriminator": {"mapping": {}}, "format": "path"}
+    assert GenerateJsonSchemaBase.remove_format_path(schema) == {
+        "discriminator": {"mapping": {}}
+    }
+    assert schema["format"] == "path"
+    assert GenerateJsonSchemaBase.remove_discriminator_mapping(schema) is schema
+    assert schema == {"discriminator": {}, "format": "path"}
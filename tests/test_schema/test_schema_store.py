@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+import fmu.datamodels as models
+from fmu.datamodels import FmuResultsSchema
+from fmu.datamodels._schema_base import FMU_SCHEMAS_PATH
+from fmu.datamodels._schema_urls import FmuSchemaUrls
+from fmu.datamodels.schema_store import (
+    SCHEMAS_DIR_ENV,
+    SchemaStore,
+    find_schemas_dir,
+)
+
+
+@pytest.fixture
+def store() -> SchemaStore:
+    return SchemaStore(find_schemas_dir())
+
+
+def test_find_schemas_dir_from_checkout(monkeypatch: MonkeyPatch) -> None:
+    """Tests that the schemas of the checkout are found by default."""
+    monkeypatch.delenv(SCHEMAS_DIR_ENV, raising=False)
+    assert (find_schemas_dir() / "0.8.0" / "fmu_results.json").is_file()
+
+
+def test_find_schemas_dir_from_env(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Tests that the directory given in the environment takes precedence."""
+    monkeypatch.setenv(SCHEMAS_DIR_ENV, str(tmp_path))
+    assert find_schemas_dir() == tmp_path
+
+    monkeypatch.setenv(SCHEMAS_DIR_ENV, str(tmp_path / "missing"))
+    with pytest.raises(FileNotFoundError, match=SCHEMAS_DIR_ENV):
+        find_schemas_dir()
+
+
+@pytest.mark.parametrize("schema", models.schemas)
+def test_store_resolves_current_schemas(
+    store: SchemaStore, schema: type[models.SchemaBase]
+) -> None:
+    """Tests that the current version of every schema is resolved from its dev and
+    prod URLs to the same file as in the repository."""
+    for url in (schema.dev_url(), schema.prod_url()):
+        assert store.path(url) == store.root.joinpath(*schema.PATH.parts[1:])
+        assert store.resolve(url)["$id"] == url
+
+
+def test_store_swaps_prod_urls(store: SchemaStore) -> None:
+    """Tests that prod URLs are served with prod URLs, like the schema server."""
+    data = store.read_bytes(FmuResultsSchema.prod_url())
+    assert FmuSchemaUrls.DEV_URL.encode() not in data
+    assert json.loads(data) == store.resolve(FmuResultsSchema.prod_url())
+
+    dev = store.read_bytes(FmuResultsSchema.dev_url())
+    assert dev == store.path(FmuResultsSchema.dev_url()).read_bytes()
+
+
+def test_store_urls_map_every_file(store: SchemaStore) -> None:
+    """Tests that all versions of all schemas are mapped from both URLs."""
+    urls = store.urls()
+    paths = store.paths()
+    assert len(urls) == 2 * len(paths)
+    assert all(path.parts[0] == str(FMU_SCHEMAS_PATH) for path in paths)
+    assert urls[FmuResultsSchema.prod_url()] == store.path(FmuResultsSchema.url())
+    assert all(path.is_file() for path in urls.values())
+
+
+def test_store_resolve_caches_immutable_schemas(store: SchemaStore) -> None:
+    """Tests that resolved schemas are cached and immutable."""
+    url = FmuResultsSchema.url()
+    schema = store.resolve(url)
+    assert store.resolve(f"{url}#/$defs/Data") is schema
+    with pytest.raises(TypeError, match="immutable"):
+        schema["$id"] = "foo"
+    assert type(deepcopy(schema)) is dict
+
+
+def test_store_rejects_unknown_urls(store: SchemaStore) -> None:
+    """Tests the errors of URLs not on a schema server, or not in the store."""
+    with pytest.raises(ValueError, match="not a schema URL"):
+        store.path("https://json-schema.org/draft/2020-12/schema")
+    with pytest.raises(FileNotFoundError, match="not found"):
+        store.path(f"{FmuSchemaUrls.PROD_URL}/schemas/99.0.0/fmu_results.json")
+
+
+@pytest.mark.parametrize(
+    "path", ["../pyproject.toml", "0.8.0/../../../pyproject.toml", "/etc/hostname"]
+)
+def test_store_rejects_paths_outside_of_store(tmp_path: Path, path: str) -> None:
+    """Tests that URLs cannot read files outside of the store."""
+    root = tmp_path / "schemas"
+    (root / "0.8.0").mkdir(parents=True)
+    (tmp_path / "pyproject.toml").touch()
+    store = SchemaStore(root)
+    with pytest.raises(ValueError, match="outside of"):
+        store.read_bytes(f"{FmuSchemaUrls.DEV_URL}/schemas/{path}")
+
+
+def test_store_reads_empty_files(tmp_path: Path) -> None:
+    """Tests that an empty schema file is read as empty rather than failing."""
+    (tmp_path / "0.8.0").mkdir()
+    (tmp_path / "0.8.0" / "empty.json").touch()
+    store = SchemaStore(tmp_path)
+    assert store.read_bytes(f"{FmuSchemaUrls.DEV_URL}/schemas/0.8.0/empty.json") == b""
+
+
+def test_store_compile_caches_validators(store: SchemaStore) -> None:
+    """Tests that a validator is compiled once per schema."""
+    validator = store.compile(FmuResultsSchema.url())
+    assert store.compile(f"{FmuResultsSchema.url()}#/$defs/Data") is validator
+    assert not validator.is_valid({"class": "case"})
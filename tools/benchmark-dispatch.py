@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""Benchmarks validating FMU results metadata through the tagged unions against
+validating it with its concrete metadata model alone, and resolving that model
+from the dispatch tables.
+
+Give the metadata files to validate, as JSON or YAML (YAML requires PyYAML):
+
+    $ ./tools/benchmark-dispatch.py path/to/.surface.gri.yml path/to/case.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import timeit
+from pathlib import Path
+from typing import Any
+
+from fmu.datamodels import FmuResults
+from fmu.datamodels.fmu_results import dispatch
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", type=Path, help="Metadata files.")
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=2000,
+        help="The number of validations of each file to time.",
+    )
+    return parser
+
+
+def _load(path: Path) -> Any:
+    if path.suffix in (".yml", ".yaml"):
+        yaml: Any = importlib.import_module("yaml")
+        return yaml.safe_load(path.read_text())
+    return json.loads(path.read_text())
+
+
+def _time(func: Any, number: int) -> float:
+    """Returns the best time of a call in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def _benchmark(path: Path, number: int) -> None:
+    payload = _load(path)
+    leaf = dispatch.resolve(payload)
+    union = _time(lambda: FmuResults.model_validate(payload), number)
+    # The concrete model alone, without the validators of FmuResults
+    metadata = _time(lambda: leaf.metadata.model_validate(payload), number)
+    resolve = _time(lambda: dispatch.resolve(payload), number)
+    name = (leaf.data or leaf.metadata).__name__
+    print(
+        f"{path.name:<40} {name:<24} {union:>10.1f} {metadata:>14.1f} {resolve:>12.1f}"
+    )
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    print(
+        f"{'file':<40} {'leaf':<24} {'union (us)':>10} "
+        f"{'metadata (us)':>14} {'resolve (us)':>12}"
+    )
+    for path in args.paths:
+        _benchmark(path, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+"""Benchmarks writing and reading the Arrow schema of Ert parameter tables with
+thousands of parameters, for the whole table at once against one column at a time:
+
+    $ ./tools/benchmark-ert-parameters.py -n 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pyarrow as pa
+
+from fmu.datamodels.standard_results.ert_parameters import ErtParametersResult
+
+_DISTRIBUTIONS: list[dict[str, Any]] = [
+    {"distribution": "uniform", "min": 0.0, "max": 1.0},
+    {"distribution": "normal", "mean": 0.0, "std": 1.0},
+    {"distribution": "dunif", "min": 0.0, "max": 10.0, "steps": 11},
+    {"distribution": "const", "value": 1.0},
+    {"distribution": "pert", "min": 0.0, "max": 1.0, "mode": 0.5, "scale": 4.0},
+]
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10000,
+        help="The number of parameters in the table.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to repeat each measurement.",
+    )
+    return parser
+
+
+def _parameters(number: int) -> ErtParametersResult:
+    rng = random.Random(0)
+    columns = {}
+    for i in range(number):
+        metadata = dict(rng.choice(_DISTRIBUTIONS))
+        if "min" in metadata:
+            metadata["min"] = rng.random() - 1.0
+        columns[f"PARAM_{i}"] = {
+            "type": "float64",
+            "metadata": {"group": "GLOBVAR", "input_source": "sampled", **metadata},
+        }
+    return ErtParametersResult.model_validate(columns)
+
+
+def _write_per_column(parameters: ErtParametersResult) -> pa.Schema:
+    fields: list[pa.Field] = [pa.field("REAL", pa.int64())]
+    for name, column in parameters.root.items():
+        metadata = column.metadata.to_pa_metadata()
+        fields.append(pa.field(name, pa.float64(), metadata=metadata))
+    return pa.schema(fields)
+
+
+def _read_per_column(schema: pa.Schema) -> ErtParametersResult:
+    """Reads the metadata like ``GenKwParameterMetadata.from_pa_metadata``, and
+    validates the result from a dictionary of columns."""
+    columns = {}
+    for field in schema:
+        if field.name != "REAL":
+            columns[field.name] = {
+                "type": "float64",
+                "metadata": {
+                    key.decode("utf-8"): json.loads(value.decode("utf-8"))
+                    for key, value in (field.metadata or {}).items()
+                },
+            }
+    return ErtParametersResult.model_validate(columns)
+
+
+def _time(function: Callable[[], object], repeat: int) -> float:
+    """Returns the best time of calling a function, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    parameters = _parameters(args.number)
+    schema = parameters.to_pa_schema()
+    assert ErtParametersResult.from_pa_schema(schema) == parameters
+    assert _read_per_column(_write_per_column(parameters)) == parameters
+
+    print(f"{args.number} parameters")
+    print(f"{'':<8} {'per column (ms)':>16} {'schema (ms)':>16}")
+    write = [
+        _time(lambda: _write_per_column(parameters), args.repeat),
+        _time(parameters.to_pa_schema, args.repeat),
+    ]
+    read = [
+        _time(lambda: _read_per_column(schema), args.repeat),
+        _time(lambda: ErtParametersResult.from_pa_schema(schema), args.repeat),
+    ]
+    print(f"{'write':<8} {write[0]:>16.1f} {write[1]:>16.1f}")
+    print(f"{'read':<8} {read[0]:>16.1f} {read[1]:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
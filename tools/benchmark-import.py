@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Benchmarks the time it takes to import fmu-datamodels.
+
+Each statement is timed in a fresh interpreter, as the import cost is paid once
+per process. Compares importing the package with accessing the models that build
+the large discriminated unions:
+
+    $ ./tools/benchmark-import.py --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import fmu.datamodels": "import fmu.datamodels",
+    "Masterdata": "from fmu.datamodels import Masterdata",
+    "InplaceVolumes enum": (
+        "from fmu.datamodels.standard_results.enums import InplaceVolumes"
+    ),
+    "InplaceVolumesResult": "from fmu.datamodels import InplaceVolumesResult",
+    "FmuResults": "from fmu.datamodels import FmuResults",
+    "schemas": "import fmu.datamodels; fmu.datamodels.schemas",
+}
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of fresh interpreters to time each statement in.",
+    )
+    return parser
+
+
+def _time(statement: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    print(f"{'statement':<24} {'median (ms)':>12} {'min (ms)':>10}")
+    for name, statement in STATEMENTS.items():
+        times = [_time(statement) * 1000 for _ in range(args.repeat)]
+        print(f"{name:<24} {statistics.median(times):>12.1f} {min(times):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
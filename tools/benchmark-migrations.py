@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""Benchmarks upgrading FMU results metadata of version 0.8.0 to the current
+version, in batches and one document at a time, against validating and dumping the
+upgraded metadata with the Pydantic models.
+
+Give the metadata files to upgrade, as JSON or YAML (YAML requires PyYAML). They
+are written back as 0.8.0 metadata before upgrading:
+
+    $ ./tools/benchmark-migrations.py path/to/.surface.gri.yml path/to/case.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import importlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from fmu.datamodels import FmuResults, FmuResultsSchema
+from fmu.datamodels.fmu_results.migrations import upgrade_stream
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", type=Path, help="Metadata files.")
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10000,
+        help="The number of documents of each file to upgrade.",
+    )
+    return parser
+
+
+def _load(path: Path) -> Any:
+    if path.suffix in (".yml", ".yaml"):
+        yaml: Any = importlib.import_module("yaml")
+        return yaml.safe_load(path.read_text())
+    return json.loads(path.read_text())
+
+
+def _downgrade(payload: dict[str, Any]) -> dict[str, Any]:
+    """Returns the metadata as it would have been written at version 0.8.0."""
+    old = copy.deepcopy(payload)
+    old["version"] = "0.8.0"
+    if isinstance(old.get("$schema"), str):
+        old["$schema"] = old["$schema"].replace(FmuResultsSchema.VERSION, "0.8.0")
+    if "ensemble" in old.get("fmu", {}):
+        old["fmu"]["iteration"] = old["fmu"].pop("ensemble")
+    if "standard_result" in old.get("data", {}):
+        old["data"]["product"] = old["data"].pop("standard_result")
+    return old
+
+
+def _rate(documents: list[dict[str, Any]], batch_size: int, dump: bool) -> float:
+    """Returns the number of documents upgraded per second."""
+    copies = [copy.deepcopy(document) for document in documents]
+    start = time.perf_counter()
+    for document in upgrade_stream(copies, batch_size=batch_size):
+        if dump:
+            FmuResults.model_validate(document).model_dump(
+                mode="json", exclude_none=True, by_alias=True
+            )
+    return len(documents) / (time.perf_counter() - start)
+
+
+def _benchmark(path: Path, number: int) -> None:
+    documents = [_downgrade(_load(path))] * number
+    batched = _rate(documents, 1000, dump=False)
+    single = _rate(documents, 1, dump=False)
+    pydantic = _rate(documents[: max(number // 10, 1)], 1000, dump=True)
+    print(f"{path.name:<40} {batched:>14.0f} {single:>14.0f} {pydantic:>14.0f}")
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    print(
+        f"{'file':<40} {'batched (/s)':>14} {'single (/s)':>14} {'pydantic (/s)':>14}"
+    )
+    for path in args.paths:
+        _benchmark(path, args.number)
+
+
+if __name__ == "__main__":
+    main()
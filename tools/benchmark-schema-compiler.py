@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""Benchmarks validating FMU results metadata with the compiled `fmu_results.json`
+against interpreting the schema with `jsonschema`, if installed, and against the
+Pydantic models.
+
+Give the metadata files to validate, as JSON or YAML (YAML requires PyYAML):
+
+    $ ./tools/benchmark-schema-compiler.py path/to/.surface.gri.yml path/to/case.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import time
+import timeit
+from pathlib import Path
+from typing import Any
+
+from fmu.datamodels import FmuResults, FmuResultsSchema
+from fmu.datamodels.schema_compiler import compile_schema
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", type=Path, help="Metadata files.")
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=1000,
+        help="The number of validations of each file to time.",
+    )
+    return parser
+
+
+def _load(path: Path) -> Any:
+    if path.suffix in (".yml", ".yaml"):
+        yaml: Any = importlib.import_module("yaml")
+        return yaml.safe_load(path.read_text())
+    return json.loads(path.read_text())
+
+
+def _time(func: Any, number: int) -> float:
+    """Returns the best time of a call in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def _interpreter(schema: dict[str, Any]) -> Any | None:
+    try:
+        jsonschema: Any = importlib.import_module("jsonschema")
+    except ImportError:
+        print("jsonschema is not installed, skipping the interpreted schema")
+        return None
+    return jsonschema.Draft202012Validator(schema)
+
+
+def _benchmark(path: Path, number: int, compiled: Any, interpreter: Any) -> None:
+    payload = _load(path)
+    if error := compiled.first_error(payload):
+        print(f"{path.name}: invalid, {error}")
+    compiled_time = _time(lambda: compiled.is_valid(payload), number)
+    pydantic_time = _time(lambda: FmuResults.model_validate(payload), number)
+    interpreted = (
+        f"{_time(lambda: interpreter.is_valid(payload), number):>16.1f}"
+        if interpreter
+        else f"{'-':>16}"
+    )
+    print(
+        f"{path.name:<40} {compiled_time:>13.1f} {interpreted} {pydantic_time:>13.1f}"
+    )
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    schema = json.loads(json.dumps(FmuResultsSchema.dump()))
+
+    start = time.perf_counter()
+    compiled = compile_schema(schema)
+    print(f"Compiled fmu_results.json in {time.perf_counter() - start:.2f} s")
+    interpreter = _interpreter(schema)
+
+    print(
+        f"{'file':<40} {'compiled (us)':>13} {'interpreted (us)':>16} "
+        f"{'pydantic (us)':>13}"
+    )
+    for path in args.paths:
+        _benchmark(path, args.number, compiled, interpreter)
+
+
+if __name__ == "__main__":
+    main()
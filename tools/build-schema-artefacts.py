@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+"""Builds the schema artefacts served by the schema server.
+
+Every JSON file under `schemas/` is copied to `schemas/` in the output directory,
+which is listed by the schema server and so holds only the schemas. Another copy
+is written to `artefacts/schemas/` along with a minified variant and gzip, and
+brotli if the `brotli` module is installed, compressions of both. A standalone
+Python validator compiled from the schema by `fmu.datamodels.schema_compiler` is
+written next to them, i.e. `fmu_results.py`. nginx serves the schemas, their
+variants and validators from there, so that the compressed files are found by
+`gzip_static`. A manifest of every file, with its version, sizes and SHA-256
+hashes, is written to `schemas/manifest.json` in both.
+
+Only the standard library is required, so this runs in the Docker build stage:
+
+    $ ./tools/build-schema-artefacts.py --output build/dev
+    $ ./tools/build-schema-artefacts.py --output build/prod --prod
+
+With `--prod` the dev schema URL is replaced with the prod schema URL in all
+schemas, as they are committed with dev URLs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+SCHEMAS_DIR = "schemas"
+ARTEFACTS_DIR = "artefacts"
+MANIFEST_FILENAME = "manifest.json"
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Construct parser object."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="The directory to write the artefacts to. It is replaced if it exists.",
+    )
+    parser.add_argument(
+        "-p",
+        "--prod",
+        action="store_true",
+        help="Replace the dev schema URL with the prod schema URL.",
+    )
+    return parser
+
+
+def _import(name: str) -> Any:
+    """Imports a module of fmu.datamodels that only depends on the standard
+    library, without importing fmu.datamodels and its dependencies."""
+    path = str(PROJECT_ROOT / "src/fmu/datamodels")
+    if path not in sys.path:
+        sys.path.append(path)
+    return importlib.import_module(name)
+
+
+def _schema_urls() -> tuple[str, str]:
+    """Returns the dev and prod schema URLs."""
+    urls = _import("_schema_urls").FmuSchemaUrls
+    return urls.DEV_URL, urls.PROD_URL
+
+
+def _compressors() -> dict[str, Any]:
+    """Returns the available compressions by file suffix."""
+    compressors: dict[str, Any] = {
+        # Without a timestamp, so that the output is reproducible
+        ".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    }
+    try:
+        brotli: Any = importlib.import_module("brotli")
+    except ImportError:
+        print("brotli is not installed, skipping brotli variants", file=sys.stderr)
+    else:
+        compressors[".br"] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+
+def _describe(path: Path, data: bytes, output: Path) -> dict[str, Any]:
+    return {
+        "path": path.relative_to(output).as_posix(),
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def _write(path: Path, data: bytes, output: Path) -> dict[str, Any]:
+    path.write_bytes(data)
+    return _describe(path, data, output)
+
+
+def _build_schema(
+    source: Path,
+    output: Path,
+    replace_url: tuple[str, str] | None,
+    compressors: dict[str, Any],
+) -> dict[str, Any]:
+    """Writes a schema and its variants and returns its manifest entry."""
+    relative = source.relative_to(PROJECT_ROOT)
+    target = output / relative
+    target.parent.mkdir(parents=True, exist_ok=True)
+    artefact = output / ARTEFACTS_DIR / relative
+    artefact.parent.mkdir(parents=True, exist_ok=True)
+
+    data = source.read_bytes()
+    if replace_url:
+        data = data.replace(replace_url[0].encode(), replace_url[1].encode())
+    schema = json.loads(data)
+    minified = json.dumps(schema, separators=(",", ":"), ensure_ascii=False).encode()
+
+    entry = _write(target, data, output)
+    entry["version"] = relative.parent.name
+    entry["id"] = schema.get("$id")
+    # Served by gzip_static to clients not accepting gzip
+    artefact.write_bytes(data)
+    entry["variants"] = {
+        "min": _write(artefact.with_suffix(".min.json"), minified, output)
+    }
+    validator = _import("schema_compiler").generate_source(schema).encode()
+    entry["validator"] = _write(artefact.with_suffix(".py"), validator, output)
+    # As named by their suffixes, i.e. 'gz' for foo.json.gz, 'min.gz' for
+    # foo.min.json.gz
+    for suffix, compress in compressors.items():
+        for prefix, content in (("", data), ("min", minified)):
+            path = artefact.with_suffix(f".{prefix}.json{suffix}".replace("..", "."))
+            entry["variants"][f"{prefix}{suffix}".lstrip(".")] = _write(
+                path, compress(content), output
+            )
+    return entry
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
+    output: Path = args.output.resolve()
+    if output.exists():
+        shutil.rmtree(output)
+
+    replace_url = _schema_urls() if args.prod else None
+    compressors = _compressors()
+
+    sources = sorted(
+        path
+        for path in (PROJECT_ROOT / SCHEMAS_DIR).rglob("*.json")
+        if path.name != MANIFEST_FILENAME
+    )
+    entries = [_build_schema(s, output, replace_url, compressors) for s in sources]
+
+    manifest = json.dumps({"schemas": entries}, indent=2, sort_keys=True)
+    for root in (output, output / ARTEFACTS_DIR):
+        (root / SCHEMAS_DIR / MANIFEST_FILENAME).write_text(manifest)
+
+    original = sum(e["size"] for e in entries)
+    gzipped = sum(e["variants"]["min.gz"]["size"] for e in entries)
+    print(
+        f"Wrote {len(entries)} schemas to {output}: {original} bytes, "
+        f"{gzipped} bytes minified and gzipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,17 @@
 """Updates the schemas for both the dev environment and the staging/production
 environment.
 
+The schemas are dumped in parallel, one process per schema up to the number of
+CPUs. Use `--jobs 1` to dump them one at a time in this process.
+
+With --incremental, schemas whose inputs are unchanged since the last run are
+skipped without importing the models. The inputs of a schema are the source files
+of the modules it is built from, the installed Pydantic version and the URL mode,
+and its output is the schema file itself. Their hashes are kept in
+`.schemas-manifest.json` next to `schemas/`, with the hash of the package
+`__init__.py` that lists the schemas. The models are only left unimported if that
+list is unchanged and every schema in it is current, and never with --test.
+
 To prepare the schemas for release first check the changes with the --prod flag:
 
     $ ./tools/update-schemas.py --prod --diff
@@ -18,16 +29,23 @@ you can write the production schemas:
 from __future__ import annotations
 
 import argparse
+import ast
 import difflib
+import hashlib
+import importlib.metadata
 import json
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from fmu.datamodels._schema_base import drop_keys, transform_schema
+
 if TYPE_CHECKING:
     from fmu.datamodels._schema_base import SchemaBase
 
@@ -42,6 +60,14 @@ INFO = f"[{BOLD}{YELLOW}+{NC}]"
 
 T = TypeVar("T", dict, list, object)
 
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+SOURCE_ROOT = PROJECT_ROOT / "src"
+MANIFEST_PATH = PROJECT_ROOT / ".schemas-manifest.json"
+MANIFEST_VERSION = 2
+PACKAGE = "fmu.datamodels"
+# Defines `schemas`, the list of all schemas
+SCHEMAS_LIST_PATH = SOURCE_ROOT / "fmu" / "datamodels" / "__init__.py"
+
 
 def _get_parser() -> argparse.ArgumentParser:
     """Construct parser object."""
@@ -76,9 +102,189 @@ def _get_parser() -> argparse.ArgumentParser:
         dest="force_contractual",
         help="Force the script to accept a removal of a $contractual item.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="The number of processes dumping schemas. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Skip schemas whose source files and output are unchanged since the "
+        "last run.",
+    )
     return parser
 
 
+def _hash_file(path: Path) -> str | None:
+    """Returns the SHA-256 of a file, or None if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _module_path(module: str) -> Path | None:
+    """Returns the source file of a module in this package, without importing it."""
+    base = SOURCE_ROOT.joinpath(*module.split("."))
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+def _imported_modules(module: str, path: Path) -> set[str]:
+    """Returns the modules of this package imported anywhere in a source file."""
+    package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    imported: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.rsplit(".", node.level - 1)[0]
+                base = f"{parent}.{base}" if base else parent
+            imported.add(base)
+            # `from package import module`
+            imported.update(f"{base}.{alias.name}" for alias in node.names)
+    return {m for m in imported if m == PACKAGE or m.startswith(f"{PACKAGE}.")}
+
+
+def _source_closure(module: str) -> list[Path]:
+    """Returns the source files of a module, of the modules it imports from this
+    package, recursively, and of their parent packages."""
+    seen: set[str] = set()
+    paths: set[Path] = set()
+    stack = [module]
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = _module_path(name)
+        if path is None:
+            continue
+        paths.add(path)
+        stack.extend(_imported_modules(name, path))
+        if "." in name:
+            stack.append(name.rpartition(".")[0])
+    return sorted(paths)
+
+
+def _environment(url_mode: str) -> dict[str, str]:
+    """The inputs of all schemas besides their source files."""
+    return {
+        "pydantic": importlib.metadata.version("pydantic"),
+        "pydantic-core": importlib.metadata.version("pydantic-core"),
+        "url_mode": url_mode,
+    }
+
+
+def _manifest_entry(schema_base: type[SchemaBase]) -> dict[str, Any]:
+    sources = _source_closure(schema_base.__module__)
+    return {
+        "sources": {
+            str(path.relative_to(PROJECT_ROOT)): _hash_file(path) for path in sources
+        },
+        "output": _hash_file(PROJECT_ROOT / schema_base.PATH),
+    }
+
+
+def _entry_is_current(path: str, entry: dict[str, Any]) -> bool:
+    """Checks that the source files and the output of a schema are unchanged."""
+    return (
+        entry["output"] is not None
+        and _hash_file(PROJECT_ROOT / path) == entry["output"]
+        and all(
+            _hash_file(PROJECT_ROOT / source) == digest
+            for source, digest in entry["sources"].items()
+        )
+    )
+
+
+def _load_manifest(url_mode: str) -> dict[str, Any]:
+    """Returns the manifest, or an empty one if it is missing or was written for
+    other Pydantic versions or URLs."""
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get(
+        "environment"
+    ) != _environment(url_mode):
+        return {}
+    return manifest
+
+
+def _all_schemas_are_current(manifest: dict[str, Any]) -> bool:
+    """Checks that the list of schemas is unchanged and that every schema in it
+    is current, without importing the models.
+
+    A schema missing from the manifest, i.e. a new schema or one that failed to
+    update in the last run, is stale."""
+    entries = manifest.get("schemas", {})
+    return (
+        manifest.get("schemas_list") == _hash_file(SCHEMAS_LIST_PATH)
+        and set(manifest.get("paths", ())) == set(entries)
+        and all(_entry_is_current(path, entry) for path, entry in entries.items())
+    )
+
+
+def _write_manifest(
+    url_mode: str, paths: list[str], entries: dict[str, dict[str, Any]]
+) -> None:
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "environment": _environment(url_mode),
+        "schemas_list": _hash_file(SCHEMAS_LIST_PATH),
+        "paths": paths,
+        "schemas": entries,
+    }
+    MANIFEST_PATH.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+    )
+
+
+def _dump_schema(index: int) -> tuple[dict[str, Any], float]:
+    """Dumps a schema in a worker process and returns it with the time it took."""
+    import fmu.datamodels as models  # noqa
+
+    schema_base = models.schemas[index]
+    start = time.perf_counter()
+    schema = schema_base.dump()
+    return schema, time.perf_counter() - start
+
+
+def _dump_schemas(indices: list[int], jobs: int) -> list[tuple[dict[str, Any], float]]:
+    """Dumps schemas, in parallel unless only one job is requested."""
+    if jobs == 1 or len(indices) <= 1:
+        return [_dump_schema(index) for index in indices]
+    with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+        return list(executor.map(_dump_schema, indices))
+
+
+def _show_timings(
+    schemas: list[type[SchemaBase]],
+    dump_times: list[float],
+    results: list[SchemaUpdateResult],
+    total_time: float,
+) -> None:
+    print(INFO, "Timings:")
+    print(f"      {'schema':<36} {'version':<8} {'dump (s)':>8}  result")
+    for schema_base, dump_time, result in zip(
+        schemas, dump_times, results, strict=True
+    ):
+        print(
+            f"      {schema_base.FILENAME:<36} {schema_base.VERSION:<8} "
+            f"{dump_time:>8.2f}  {result.name.lower()}"
+        )
+    print(f"      {'total':<45} {total_time:>8.2f}")
+
+
 def _show_git_diff(output_filepath: Path) -> None:
     command = ["git", "diff", str(output_filepath)]
     print(INFO, f"running `{' '.join(command)}` ...")
@@ -102,16 +308,8 @@ def _show_py_diff(existing_schema: dict[str, Any], new_schema: dict[str, Any]) -
 
 
 def _remove_schema_ids(schema: T) -> T:
-    """Recursively remove all '$id' and 'url' fields from a schema."""
-    if isinstance(schema, dict):
-        return {
-            key: _remove_schema_ids(value)
-            for key, value in schema.items()
-            if key not in ("$id", "url")
-        }
-    if isinstance(schema, list):
-        return [_remove_schema_ids(item) for item in schema]
-    return schema
+    """Remove all '$id' and 'url' fields from a schema, in place."""
+    return transform_schema(schema, [drop_keys("$id", "url")])
 
 
 def _schemas_are_equivalent(
@@ -166,12 +364,16 @@ class SchemaWriter:
     def write_schema(
         self,
         schema_base: type[SchemaBase],
+        new_schema: dict[str, Any] | None = None,
     ) -> SchemaUpdateResult:
-        """Write schema to file after some checking."""
+        """Write schema to file after some checking.
+
+        The schema is dumped from the schema base unless it is already given."""
         output_filepath = self._get_output_filepath(schema_base.PATH)
         self._ensure_output_path(output_filepath.parent)
 
-        new_schema = schema_base.dump()
+        if new_schema is None:
+            new_schema = schema_base.dump()
 
         try:
             existing_schema = self._load_existing_schema(output_filepath)
@@ -190,12 +392,18 @@ class SchemaWriter:
             output_filepath,
         )
 
-    def contractual_item_removed(self, fmu_result_schema: type[SchemaBase]) -> bool:
+    def contractual_item_removed(
+        self,
+        fmu_result_schema: type[SchemaBase],
+        new_schema: dict[str, Any] | None = None,
+    ) -> bool:
         newest_existing_schema = self._load_existing_schema(
             self._find_newest_existing_schema_path(fmu_result_schema)
         )
         existing_contractual = newest_existing_schema["$contractual"]
-        new_contractional = fmu_result_schema.dump()["$contractual"]
+        if new_schema is None:
+            new_schema = fmu_result_schema.dump()
+        new_contractional = new_schema["$contractual"]
         if not set(existing_contractual).issubset(set(new_contractional)):
             print(
                 FAIL,
@@ -208,8 +416,7 @@ class SchemaWriter:
 
     def _get_output_filepath(self, schema_path: Path) -> Path:
         """Returns a Path with the appropriate output location, without the filename."""
-        project_root = Path(__file__).parent.parent.resolve()  # absolute path of ../../
-        return project_root / schema_path
+        return PROJECT_ROOT / schema_path
 
     def _ensure_output_path(self, dir_path: Path) -> None:
         dir_exists = dir_path.exists()
@@ -326,6 +533,15 @@ def main() -> None:
     if args.force:
         print(INFO, "Forcing schema overwrite")
 
+    url_mode = "prod" if args.prod else "dev"
+    manifest = _load_manifest(url_mode) if args.incremental else {}
+    if manifest and not args.test and _all_schemas_are_current(manifest):
+        print(
+            PASS, f"All {len(manifest['paths'])} schemas unchanged since the last run"
+        )
+        return
+    entries: dict[str, dict[str, Any]] = manifest.get("schemas", {})
+
     os.environ["DEV_SCHEMA"] = "" if args.prod else "1"
     # Ensures URLs will differ based on above
     import fmu.datamodels as models  # noqa
@@ -338,15 +554,56 @@ def main() -> None:
         force_contractual=args.force_contractual,
     )
 
-    if not writer.force_contractual and writer.contractual_item_removed(
-        models.FmuResultsSchema
+    start = time.perf_counter()
+    schemas = models.schemas
+    stale = [
+        index
+        for index, schema in enumerate(schemas)
+        if not (
+            str(schema.PATH) in entries
+            and _entry_is_current(str(schema.PATH), entries[str(schema.PATH)])
+        )
+    ]
+    dumps = dict(zip(stale, _dump_schemas(stale, args.jobs), strict=True))
+
+    fmu_results_index = schemas.index(models.FmuResultsSchema)
+    if (
+        fmu_results_index in dumps
+        and not writer.force_contractual
+        and writer.contractual_item_removed(
+            models.FmuResultsSchema, dumps[fmu_results_index][0]
+        )
     ):
         sys.exit(1)
 
     schema_update_results = []
-    for schema in models.schemas:
-        update_result = writer.write_schema(schema)
+    dump_times = []
+    for index, schema in enumerate(schemas):
+        if index in dumps:
+            new_schema, dump_time = dumps[index]
+            update_result = writer.write_schema(schema, new_schema)
+        else:
+            print(PASS, f"{BOLD}{schema.FILENAME}{NC} inputs unchanged, skipped")
+            update_result, dump_time = SchemaUpdateResult.UNCHANGED, 0.0
         schema_update_results.append(update_result)
+        dump_times.append(dump_time)
+
+    _show_timings(
+        schemas, dump_times, schema_update_results, time.perf_counter() - start
+    )
+
+    if args.incremental:
+        # Only record schemas known to match their file on disk
+        _write_manifest(
+            url_mode,
+            [str(schema.PATH) for schema in schemas],
+            {
+                str(schema.PATH): _manifest_entry(schema)
+                for schema, result in zip(schemas, schema_update_results, strict=True)
+                if result == SchemaUpdateResult.UNCHANGED
+                or (result == SchemaUpdateResult.UPDATED and not args.test)
+            },
+        )
 
     if SchemaUpdateResult.FAILED in schema_update_results:
         sys.exit(1)